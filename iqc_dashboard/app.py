@@ -11,21 +11,85 @@ import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
 import tempfile
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, ClassVar
+from collections.abc import Iterator
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import re
 import difflib
 import html
 import hashlib
 import json
 import base64
+import glob
 import zlib
+import os
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import unquote
+
+from iqc_dashboard.config import DUCKDB_SETTINGS, load_duckdb_config
+from iqc_dashboard.data_cache import (
+    cache_entry_key,
+    cache_entry_of,
+    cache_size_limit,
+    data_cache_dir,
+    evict_cache_entries,
+    file_content_digest,
+    touch_cache_entry,
+)
+from iqc_dashboard.json_stream import (
+    JSON_LAYOUT_NDJSON,
+    JSON_LAYOUT_OBJECT,
+    json_layout,
+    read_json_table,
+    write_json_parquet,
+)
+from iqc_dashboard.reaction_rows import (
+    REACTION_ROLES,
+    component_unique_names,
+    interleave_components,
+    is_reaction_store_table,
+    optional_column,
+    read_reaction_store,
+    role_smiles,
+    xyz_atom_counts,
+)
 
 EV_TO_KCAL_MOL = 23.0605
 ENERGY_UNIT_KCAL = "kcal/mol"
 ENERGY_UNIT_EV = "eV"
 ENERGY_UNITS = [ENERGY_UNIT_KCAL, ENERGY_UNIT_EV]
-SUPPORTED_DATA_SUFFIXES = (".parquet", ".json")
+JSON_DATA_SUFFIXES = (".json", ".ndjson", ".jsonl")
+SUPPORTED_DATA_SUFFIXES = (".parquet",) + JSON_DATA_SUFFIXES
+REACTION_JSON_COLUMNS = ("ligand_pair", "reactant_geometry", "product_geometry")
+# Part of the cache key of converted JSON; bump when conversion output changes.
+JSON_CONVERTER_VERSION = 2
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Sidebar filters that can skip whole files in hive-partitioned trees (key=value dirs).
+PARTITION_FILTER_KEYS = ("calculator", "task", "formula")
+DATASET_VIEW_PREFIX = "iqc_dataset_"
+FILTER_SNAPSHOT_PREFIX = "iqc_snapshot_"
+FILTER_SNAPSHOT_LIMIT = 8
+# Per-snapshot table of lowest-G reactant/product pairs, in eV
+REACTION_TABLE_SUFFIX = "_reactions"
+NAME_INDEX_PREFIX = "iqc_names_"
+# Datasets whose view and name index stay registered once no live session loads them
+DATASET_CATALOG_LIMIT = 4
+# Bump when the manifest layout changes so stale manifests are rebuilt.
+MANIFEST_VERSION = 2
+MANIFEST_DIR_NAME = ".iqc_cache"
+# Dataset manifests are cheap to re-merge from per-file ones, so only recent ones are kept
+MANIFEST_HISTORY_LIMIT = 8
+DATA_WATCH_INTERVAL_SECONDS = 10
+DUCKDB_POOL_SIZE = 32
 COVALENT_RADII_ANGSTROM = {
     "H": 0.31,
     "B": 0.85,
@@ -60,6 +124,148 @@ COMPARISON_SUMMARY_COLUMNS = (
     "opt_time",
     "number_of_imaginary",
 )
+ANALYTICS_TEXT_COLUMNS = (
+    "unique_name",
+    "formula",
+    "opt_converged",
+    "initial_smiles",
+    "opt_smiles",
+)
+# unique_name fields parsed once per filter snapshot rather than per row on each rerun
+PARSED_NAME_COLUMNS = ("name_role", "name_bipyridine", "name_alkyne", "name_conformer")
+UNIQUE_NAME_FIELDS_PATTERN = (
+    r"(?s)^(?P<bipyridine>[^_]*)_(?P<alkyne>[^_]*)_(?P<role>[^_]*)(?:_(?P<conformer>.*))?$"
+)
+PARSED_NAME_FIELDS = {"name_bipyridine": "bipyridine", "name_alkyne": "alkyne", "name_role": "role"}
+DESCRIPTOR_SOURCE_COLUMNS = (
+    "unique_name",
+    "formula",
+    "initial_smiles",
+    "opt_smiles",
+    "initial_xyz",
+    "opt_xyz",
+    "G_eV",
+    "reaction_role",
+    "reaction_gibbs_kcal",
+    "source_json_row",
+    "source_gibbs",
+    "ligand_pair",
+    "stereo_type",
+    "insertion_type",
+    "descriptor_precomputed",
+) + PARSED_NAME_COLUMNS
+REACTION_TABLE_COLUMNS = (
+    "unique_name",
+    "G_eV",
+    "reaction_role",
+    "reaction_gibbs_kcal",
+    "source_json_row",
+    "source_gibbs",
+    "stereo_type",
+    "insertion_type",
+) + PARSED_NAME_COLUMNS
+MOLECULE_NAME_PAGE_SIZE = 200
+TEXT_FILTER_COLUMNS = ("unique_name", "initial_smiles", "opt_smiles")
+TEXT_FILTER_REGEX_CHARS = set("^$[]()+?{}|.\\")
+SEARCH_INDEX_SUFFIX = ".trigrams"
+SEARCH_INDEX_GRAM_SIZE = 3
+# Intersect only the rarest grams of a query; the text condition re-checks candidates.
+SEARCH_INDEX_PROBE_GRAMS = 3
+SEARCH_INDEX_MAX_CANDIDATES = 250_000
+SEARCH_INDEX_MEMORY_LIMIT = "2GB"
+# SQL equivalents of parse_unique_names, materialised in every filter snapshot.
+_NAME_SQL = "CAST(unique_name AS VARCHAR)"
+_NAME_IS_COMPLEX_SQL = (
+    f"NOT starts_with(lower({_NAME_SQL}), 'co2') AND len(string_split({_NAME_SQL}, '_')) >= 3"
+)
+PARSED_NAME_SQL = {
+    "name_role": (
+        f"CASE WHEN starts_with(lower({_NAME_SQL}), 'co2') THEN 'co2' "
+        f"WHEN NOT {_NAME_IS_COMPLEX_SQL} THEN NULL "
+        f"WHEN contains(lower(split_part({_NAME_SQL}, '_', 3)), 'product') THEN 'product' "
+        f"WHEN contains(lower(split_part({_NAME_SQL}, '_', 3)), 'reactant') THEN 'reactant' END"
+    ),
+    "name_bipyridine": (
+        f"CASE WHEN {_NAME_IS_COMPLEX_SQL} "
+        f"THEN replace(split_part({_NAME_SQL}, '_', 1), 'bipy-', '') END"
+    ),
+    "name_alkyne": (
+        f"CASE WHEN {_NAME_IS_COMPLEX_SQL} "
+        f"THEN replace(split_part({_NAME_SQL}, '_', 2), '-C2H2-', '') END"
+    ),
+    "name_conformer": (
+        f"CASE WHEN {_NAME_IS_COMPLEX_SQL} AND len(string_split({_NAME_SQL}, '_')) > 3 "
+        f"THEN array_to_string(string_split({_NAME_SQL}, '_')[4:], '_') END"
+    ),
+}
+# Low-cardinality labels returned as pandas categoricals straight from Arrow dictionaries.
+DICTIONARY_COLUMNS = (
+    "calculator",
+    "task",
+    "formula",
+    "stereo_type",
+    "insertion_type",
+    "ligand_pair",
+)
+# A label column is a dictionary when it has at most this many distinct values,
+# or when no more than this share of its rows hold distinct values.
+DICTIONARY_MAX_DISTINCT = 64
+DICTIONARY_MAX_DISTINCT_RATIO = 0.1
+# Filter snapshots keep each row's key and these light columns; the rest is read back by key.
+SNAPSHOT_KEY_COLUMNS = ("iqc_file_index", "file_row_number")
+SNAPSHOT_COLUMNS = tuple(
+    dict.fromkeys(
+        (
+            "unique_name",
+            "calculator",
+            "task",
+            "formula",
+            "opt_converged",
+            "smiles_changed",
+            "number_of_imaginary",
+            *TEXT_FILTER_COLUMNS,
+            *DICTIONARY_COLUMNS,
+            "reaction_role",
+            "G_eV",
+        )
+    )
+)
+# Match DuckDB's .df(): integer and boolean columns with nulls use pandas masked dtypes.
+ARROW_NULLABLE_DTYPES = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.uint8(): pd.UInt8Dtype(),
+    pa.uint16(): pd.UInt16Dtype(),
+    pa.uint32(): pd.UInt32Dtype(),
+    pa.uint64(): pd.UInt64Dtype(),
+    pa.bool_(): pd.BooleanDtype(),
+}
+try:
+    ARROW_STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+except TypeError:
+    # pandas < 2.3 names the NaN-semantics Arrow string dtype differently
+    ARROW_STRING_DTYPE = pd.StringDtype("pyarrow_numpy")
+ARROW_STRING_DTYPES = {
+    pa.string(): ARROW_STRING_DTYPE,
+    pa.large_string(): ARROW_STRING_DTYPE,
+}
+NUMERIC_COLUMN_TYPES = {
+    "TINYINT",
+    "SMALLINT",
+    "INTEGER",
+    "BIGINT",
+    "HUGEINT",
+    "UTINYINT",
+    "USMALLINT",
+    "UINTEGER",
+    "UBIGINT",
+    "UHUGEINT",
+    "FLOAT",
+    "DOUBLE",
+    "DECIMAL",
+}
 try:
     from descriptor_kit import (
         DESCRIPTOR_KEYS as KIT_DESCRIPTOR_KEYS,
@@ -188,7 +394,7 @@ def descriptor_unit_for_key(descriptor_key: str) -> str:
     return "angstrom"
 
 
-def build_descriptor_definitions() -> Tuple[dict, ...]:
+def build_descriptor_definitions() -> tuple[dict, ...]:
     """Build descriptor metadata from descriptor_kit registries."""
     descriptor_keys = list(KIT_DESCRIPTOR_KEYS) + list(KIT_TDELTA_KEYS)
     return tuple(
@@ -236,6 +442,431 @@ except ImportError as e:
     pass  # Will check when rendering molecules
 
 
+def quote_identifier(name: str) -> str:
+    """Quote a column name for use in DuckDB SQL."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def sql_string_literal(value: str) -> str:
+    """Quote a string, such as a file path, as a DuckDB SQL literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def escape_like_pattern(text: str) -> str:
+    """Escape LIKE wildcards so text matches literally with ESCAPE '\\'."""
+    return (
+        str(text)
+        .replace("\\", "\\\\")
+        .replace("%", "\\%")
+        .replace("_", "\\_")
+    )
+
+
+def is_simple_text_filter(text_filter: str) -> bool:
+    """Return True when a text filter has no regex syntax and can match as a substring."""
+    return not any(char in TEXT_FILTER_REGEX_CHARS for char in text_filter)
+
+
+def search_index_path(parquet_path: str) -> Path:
+    """Return the sidecar trigram index path for a Parquet file."""
+    return Path(f"{parquet_path}{SEARCH_INDEX_SUFFIX}")
+
+
+def is_search_index_fresh(parquet_path: str) -> bool:
+    """Return True when a Parquet file has a trigram index at least as new as the data."""
+    try:
+        index_mtime = search_index_path(parquet_path).stat().st_mtime
+        return index_mtime >= Path(parquet_path).stat().st_mtime
+    except OSError:
+        return False
+
+
+def search_text_grams(text: str) -> list[str]:
+    """Return the distinct lowercase trigrams used to probe the search index."""
+    text = text.lower()
+    return sorted(
+        {
+            text[position : position + SEARCH_INDEX_GRAM_SIZE]
+            for position in range(len(text) - SEARCH_INDEX_GRAM_SIZE + 1)
+        }
+    )
+
+
+def write_search_index(parquet_path: str) -> Path:
+    """
+    Write a sidecar trigram index for the text filter columns of a Parquet file.
+
+    The index holds one (gram, file_row_number) row per distinct trigram of each
+    row's lowercase unique_name/SMILES text, sorted by gram so lookups only read
+    the row groups of the probed grams.
+    """
+    parquet_path = str(parquet_path)
+    index_path = search_index_path(parquet_path)
+    staging_path = index_path.with_name(f"{index_path.name}.tmp")
+    gram_end = f"length(text) - {SEARCH_INDEX_GRAM_SIZE - 2}"
+
+    conn = duckdb.connect()
+    try:
+        available_columns = {
+            row[0]
+            for row in conn.execute(
+                f"DESCRIBE SELECT * FROM {data_file_source_sql(parquet_path)}"
+            ).fetchall()
+        }
+        text_columns = [
+            column for column in TEXT_FILTER_COLUMNS if column in available_columns
+        ]
+        if not text_columns:
+            raise ValueError(
+                f"{parquet_path} has none of the text columns {TEXT_FILTER_COLUMNS}"
+            )
+        text_values = ", ".join(
+            f"lower(COALESCE(CAST({quote_identifier(column)} AS VARCHAR), ''))"
+            for column in text_columns
+        )
+
+        # The gram sort spills to disk, so bound memory and drop ordering guarantees
+        conn.execute(f"SET memory_limit = '{SEARCH_INDEX_MEMORY_LIMIT}'")
+        conn.execute("SET preserve_insertion_order = false")
+        conn.execute(
+            f"""
+            COPY (
+                WITH row_grams AS (
+                    SELECT
+                        file_row_number,
+                        list_distinct(flatten([
+                            [
+                                substr(text, position, {SEARCH_INDEX_GRAM_SIZE})
+                                FOR position IN range(1, {gram_end})
+                            ]
+                            FOR text IN [{text_values}]
+                        ])) AS grams
+                    FROM {data_file_source_sql(parquet_path, file_row_number=True)}
+                )
+                SELECT unnest(grams) AS gram, file_row_number
+                FROM row_grams
+                ORDER BY gram, file_row_number
+            ) TO {sql_string_literal(str(staging_path))} (FORMAT parquet, COMPRESSION zstd)
+            """
+        )
+    finally:
+        conn.close()
+
+    staging_path.replace(index_path)
+    return index_path
+
+
+def is_numeric_column_type(column_type: str) -> bool:
+    """Return True when a DuckDB or pandas column type holds plain numbers."""
+    type_name = str(column_type).strip()
+    base_type = type_name.split("(", 1)[0].upper()
+    if base_type in NUMERIC_COLUMN_TYPES:
+        return True
+    return re.fullmatch(r"u?int(8|16|32|64)|float(16|32|64)", type_name.lower()) is not None
+
+
+def is_scalar_column_type(column_type: str) -> bool:
+    """Return True when a DuckDB column type has a meaningful min and max."""
+    type_name = str(column_type).strip().upper()
+    return not (type_name.endswith("]") or type_name.startswith(("STRUCT", "MAP", "UNION")))
+
+
+_parquet_fingerprints: dict[tuple[str, int, int], str] = {}
+
+
+def parquet_content_fingerprint(parquet_path: str) -> str:
+    """
+    Hash a Parquet file's size and footer.
+
+    The footer records every row group's byte ranges and column statistics, so it
+    changes whenever the content does, and reading it avoids hashing whole files.
+    """
+    path = Path(parquet_path)
+    stat = path.stat()
+    cache_key = (str(path), stat.st_size, stat.st_mtime_ns)
+    fingerprint = _parquet_fingerprints.get(cache_key)
+    if fingerprint is None:
+        with path.open("rb") as parquet_file:
+            parquet_file.seek(-8, os.SEEK_END)
+            footer_length = int.from_bytes(parquet_file.read(4), "little")
+            parquet_file.seek(-(8 + footer_length), os.SEEK_END)
+            footer = parquet_file.read(footer_length)
+        fingerprint = hashlib.sha256(stat.st_size.to_bytes(8, "little") + footer).hexdigest()
+        _parquet_fingerprints[cache_key] = fingerprint
+    return fingerprint
+
+
+def merge_file_manifests(
+    file_manifests: list[dict[str, Any]],
+    column_types: dict[str, str],
+) -> dict[str, Any]:
+    """
+    Combine per-file manifests into dataset statistics.
+
+    Counts and sums add up, min/max take the extremes and label values are
+    unioned, so adding a file only requires scanning that file.
+    """
+    row_count = sum(file_manifest["row_count"] for file_manifest in file_manifests)
+    columns = {}
+    for column, column_type in column_types.items():
+        file_stats = [
+            (file_manifest["row_count"], file_manifest["columns"][column])
+            for file_manifest in file_manifests
+            if column in file_manifest["columns"]
+        ]
+        non_null_count = sum(rows - stats["null_count"] for rows, stats in file_stats)
+        stats = {"type": column_type, "null_count": row_count - non_null_count}
+        if is_scalar_column_type(column_type):
+            for bound, pick in (("min", min), ("max", max)):
+                values = [
+                    file_stat[bound] for _, file_stat in file_stats if file_stat.get(bound) is not None
+                ]
+                try:
+                    stats[bound] = pick(values) if values else None
+                except TypeError:
+                    # Files disagree on the column type; no single bound applies
+                    stats[bound] = None
+        columns[column] = stats
+
+    distinct_values = {}
+    for column in DICTIONARY_COLUMNS:
+        if column not in column_types:
+            continue
+        values = set()
+        for file_manifest in file_manifests:
+            values.update(file_manifest["distinct_values"].get(column, []))
+        try:
+            distinct_values[column] = sorted(values)
+        except TypeError:
+            distinct_values[column] = sorted(values, key=str)
+
+    def total(name: str) -> Any:
+        return sum(file_manifest["totals"].get(name, 0) for file_manifest in file_manifests)
+
+    def average(column: str, prefix: str) -> float | None:
+        count = total(f"{prefix}_count")
+        if column not in column_types or not count:
+            return None
+        return total(f"{prefix}_sum") / count
+
+    summary = {
+        "total_rows": row_count,
+        "unique_calculators": len(distinct_values.get("calculator", [])),
+        "unique_tasks": len(distinct_values.get("task", [])),
+        "unique_formulas": len(distinct_values.get("formula", [])),
+        "avg_opt_energy": average("opt_energy_eV", "opt_energy"),
+        "avg_initial_energy": average("initial_energy_eV", "initial_energy"),
+        "converged_count": total("converged_count") if "opt_converged" in column_types else None,
+        "not_converged_count": (
+            total("not_converged_count") if "opt_converged" in column_types else None
+        ),
+    }
+    return {
+        "row_count": row_count,
+        "columns": columns,
+        "distinct_values": distinct_values,
+        "summary": summary,
+    }
+
+
+def write_file_atomically(path: Path, write: Any) -> None:
+    """Write through a temporary name so concurrent sessions never read half a file."""
+    staging_path = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    write(staging_path)
+    staging_path.replace(path)
+
+
+def hive_partition_values(path: str) -> dict[str, str]:
+    """Return the key=value directory segments of a hive-partitioned file path."""
+    values = {}
+    for part in Path(path).parent.parts:
+        key, separator, value = part.partition("=")
+        if separator and key:
+            values[key] = unquote(value)
+    return values
+
+
+def parquet_read_options(paths: list[str]) -> str:
+    """Return extra read_parquet options so hive partition keys become columns."""
+    if any(hive_partition_values(path) for path in paths):
+        return ", hive_partitioning = true"
+    return ""
+
+
+def is_json_data_file(path: str) -> bool:
+    """Return True for JSON and newline-delimited JSON data files."""
+    return Path(path).suffix.lower() in JSON_DATA_SUFFIXES
+
+
+def json_source_sql(json_path: str) -> str:
+    """Return the read_json table function call for a record-oriented JSON file."""
+    json_format = "newline_delimited" if json_layout(json_path) == JSON_LAYOUT_NDJSON else "array"
+    return f"read_json({sql_string_literal(json_path)}, format = '{json_format}')"
+
+
+def reaction_store_source_sql(
+    components_path: str,
+    store: dict[str, Any],
+    file_row_number: bool = False,
+) -> str:
+    """
+    Return a subquery that rebuilds expanded reactant/product rows from a reaction store.
+
+    Each component row is joined to its reaction by source_json_row, and columns
+    that repeat a role-specific reaction column are picked by reaction_role.
+    Rows come in join order; callers that need file order sort by file_row_number.
+    """
+    reaction_columns = set(store["reaction_columns"])
+    select_list = []
+    for column in store["columns"]:
+        quoted = quote_identifier(column)
+        role_sources = store["role_columns"].get(column)
+        if role_sources:
+            cases = " ".join(
+                f"WHEN {sql_string_literal(role)} THEN r.{quote_identifier(source)}"
+                for role, source in role_sources.items()
+            )
+            select_list.append(f"CASE c.reaction_role {cases} END AS {quoted}")
+        elif column in reaction_columns:
+            select_list.append(f"r.{quoted}")
+        else:
+            select_list.append(f"c.{quoted}")
+    if file_row_number:
+        select_list.append("c.file_row_number")
+    return (
+        f"(SELECT {', '.join(select_list)} "
+        f"FROM read_parquet({sql_string_literal(components_path)}, file_row_number = true) AS c "
+        f"JOIN read_parquet({sql_string_literal(store['reactions'])}) AS r "
+        f"USING (source_json_row))"
+    )
+
+
+def data_file_source_sql(path: str, file_row_number: bool = False) -> str:
+    """Return the table expression that reads one loaded data file as dashboard rows."""
+    if is_json_data_file(path):
+        if file_row_number:
+            # read_json has no file_row_number option; ordinality numbers rows in file order
+            return (
+                f"(SELECT * EXCLUDE (ordinality), ordinality - 1 AS file_row_number "
+                f"FROM {json_source_sql(path)} WITH ORDINALITY)"
+            )
+        return json_source_sql(path)
+    store = read_reaction_store(path)
+    if store is not None:
+        return reaction_store_source_sql(path, store, file_row_number)
+    row_number_option = ", file_row_number = true" if file_row_number else ""
+    return (
+        f"read_parquet({sql_string_literal(path)}{row_number_option}"
+        f"{parquet_read_options([path])})"
+    )
+
+
+def is_glob_pattern(path: str) -> bool:
+    """Return True when a data path uses glob wildcards."""
+    return any(character in path for character in "*?[")
+
+
+def fetch_arrow_table(result: duckdb.DuckDBPyConnection) -> pa.Table:
+    """Fetch a DuckDB result as an Arrow table."""
+    to_arrow_table = getattr(result, "to_arrow_table", None)
+    if to_arrow_table is not None:
+        return to_arrow_table()
+    return result.fetch_arrow_table()
+
+
+def dictionary_encode_columns(table: pa.Table, columns: tuple[str, ...]) -> pa.Table:
+    """Dictionary-encode the named string columns of an Arrow table."""
+    for index, field in enumerate(table.schema):
+        if field.name in columns and field.type in ARROW_STRING_DTYPES:
+            table = table.set_column(index, field.name, pc.dictionary_encode(table.column(index)))
+    return table
+
+
+def arrow_table_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Convert an Arrow table to pandas with the dtypes DuckDB's ``.df()`` would give.
+
+    Strings stay in Arrow buffers rather than becoming Python objects, and
+    dictionary-encoded columns arrive as categoricals.
+    """
+    nullable_columns = {}
+    for index, field in enumerate(table.schema):
+        column = table.column(index)
+        if pa.types.is_decimal(field.type):
+            table = table.set_column(index, field.name, column.cast(pa.float64()))
+        elif column.null_count and field.type in ARROW_NULLABLE_DTYPES:
+            nullable_columns[field.name] = column
+
+    result = table.to_pandas(split_blocks=True, types_mapper=ARROW_STRING_DTYPES.get)
+    for name, column in nullable_columns.items():
+        result[name] = column.to_pandas(types_mapper=ARROW_NULLABLE_DTYPES.get)
+    return result
+
+
+class DuckDBConnectionPool:
+    """
+    Hand each thread its own cursor on one shared in-process DuckDB database.
+
+    Streamlit runs every session's script in its own thread, and a DuckDB
+    connection must not be used from several threads at once. Cursors share the
+    database, so views and snapshot tables created by one session are visible to
+    the others. At most ``max_cursors`` threads hold a cursor; cursors of finished
+    threads are closed and reused, and further threads wait for a free slot.
+    """
+
+    def __init__(self, max_cursors: int = DUCKDB_POOL_SIZE, settings: dict[str, Any] | None = None):
+        self.max_cursors = max(1, int(max_cursors))
+        self._database = duckdb.connect()
+        self._cursors: dict[int, duckdb.DuckDBPyConnection] = {}
+        self._slot_available = threading.Condition()
+
+        # Keep parsed Parquet footers in memory so repeated queries against the
+        # registered dataset views do not re-read file metadata.
+        for setting in ("parquet_metadata_cache", "enable_object_cache"):
+            try:
+                self._database.execute(f"SET {setting} = true")
+                break
+            except duckdb.Error:
+                continue
+        # Rejected settings are kept for the UI to report once, not per cursor.
+        self.setting_errors: list[str] = []
+        for setting, value in (settings or {}).items():
+            try:
+                self._database.execute(f"SET {setting} = {sql_string_literal(str(value))}")
+            except duckdb.Error as e:
+                self.setting_errors.append(f"Ignoring DuckDB setting {setting}={value!r}: {e}")
+
+    def _release_finished_threads(self) -> None:
+        """Close the cursors of threads that have exited."""
+        live_threads = {thread.ident for thread in threading.enumerate()}
+        for thread_id in [ident for ident in self._cursors if ident not in live_threads]:
+            self._cursors.pop(thread_id).close()
+
+    def cursor(self, timeout: float | None = None) -> duckdb.DuckDBPyConnection:
+        """Return the calling thread's cursor, waiting for a free slot if needed."""
+        thread_id = threading.get_ident()
+        with self._slot_available:
+            cursor = self._cursors.get(thread_id)
+            if cursor is not None:
+                return cursor
+
+            # Threads exit without telling the pool, so re-check for free slots
+            # on a short interval instead of waiting for a notification.
+            deadline = None if timeout is None else time.monotonic() + timeout
+            self._release_finished_threads()
+            while len(self._cursors) >= self.max_cursors:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"All {self.max_cursors} DuckDB connections are in use."
+                    )
+                self._slot_available.wait(0.05)
+                self._release_finished_threads()
+
+            cursor = self._database.cursor()
+            self._cursors[thread_id] = cursor
+            return cursor
+
+
 # ============================================================================
 # DataManager Class - Efficient Parquet File Handling
 # ============================================================================
@@ -244,86 +875,385 @@ except ImportError as e:
 class DataManager:
     """Manages data ingestion and querying using DuckDB for efficient Parquet file access."""
 
+    # Filter snapshots live on the shared connection, so their LRU order is shared too.
+    # Each snapshot maps to the number of callers holding it, which eviction skips.
+    _snapshot_tables: ClassVar[OrderedDict[str, int]] = OrderedDict()
+    _snapshot_lock = threading.Lock()
+    # Background JSON-to-Parquet conversions, shared by sessions and keyed by target path
+    _json_conversions: ClassVar[dict[str, Future]] = {}
+    _json_conversion_lock = threading.Lock()
+    _json_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="iqc-json")
+    # Live managers, whose files cache eviction must leave in place
+    _cache_users: ClassVar["weakref.WeakSet[DataManager]"] = weakref.WeakSet()
+    # Files hashes with a dataset view or name index on the shared connection, oldest first
+    _dataset_catalog: ClassVar[OrderedDict[str, None]] = OrderedDict()
+    _dataset_catalog_lock = threading.Lock()
+
     def __init__(self, temp_dir: str):
+        """Use temp_dir as the cache for uploads and converted files, shared by sessions."""
         self.temp_dir = Path(temp_dir)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
-        self.conn: Optional[duckdb.DuckDBPyConnection] = None
-        self.parquet_files: List[str] = []
-
-    def save_uploaded_files(self, uploaded_files: List) -> List[str]:
+        self.conn: duckdb.DuckDBPyConnection | None = None
+        self.parquet_files: list[str] = []
+        self.data_paths: list[str] = []
+        self._source_signature = ""
+        # JSON files queried in place until their Parquet copy is written
+        self.json_sources: dict[str, str] = {}
+        # Uploads already ingested, by Streamlit file id and by content hash
+        self._upload_digests: dict[str, str] = {}
+        self._ingested_uploads: dict[str, Path | None] = {}
+        # Pending Parquet copies of uploads queried in place, by content hash
+        self._upload_json_sources: dict[str, tuple[str, str]] = {}
+        # Uploads written, converted or switched to a new cache entry since creation
+        self._upload_cache_updates = 0
+        DataManager._cache_users.add(self)
+
+    def save_uploaded_files(self, uploaded_files: list) -> list[str]:
         """Save uploaded data files to temporary directory and return query-ready paths."""
         saved_paths = []
+        self.json_sources = {}
+        cache_updates = self._upload_cache_updates
         for uploaded_file in uploaded_files:
             if uploaded_file is not None:
-                file_path = self.temp_dir / uploaded_file.name
-                with open(file_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
-                converted_path = self.prepare_data_file(file_path)
+                converted_path = self.ingest_uploaded_file(uploaded_file)
                 if converted_path is not None:
                     saved_paths.append(str(converted_path))
         self.parquet_files = saved_paths
+        # Uploads replace any watched data paths
+        self.data_paths = []
+        self.build_manifest()
+        # Reruns that only reuse ingested uploads leave the shared cache alone
+        if self._upload_cache_updates != cache_updates:
+            self.use_cache_entries()
         return saved_paths
 
-    def load_data_paths(self, paths: List[str]) -> List[str]:
-        """Load Parquet or JSON data from local filesystem paths."""
-        resolved_paths: List[str] = []
+    @staticmethod
+    def _read_upload_chunks(uploaded_file) -> Any:
+        """Yield an upload's bytes in fixed-size chunks from the start."""
+        uploaded_file.seek(0)
+        while True:
+            chunk = uploaded_file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+    def ingest_uploaded_file(self, uploaded_file) -> Path | None:
+        """
+        Write an upload to the temporary directory once and return its query-ready path.
+
+        Streamlit hands the same uploads back on every rerun, so files are keyed
+        by a hash of their bytes: content that was already written and converted
+        is reused instead of being processed again.
+        """
+        file_id = getattr(uploaded_file, "file_id", None)
+        digest = self._upload_digests.get(file_id) if isinstance(file_id, str) else None
+        if digest is None:
+            hasher = hashlib.sha256()
+            for chunk in self._read_upload_chunks(uploaded_file):
+                hasher.update(chunk)
+            digest = hasher.hexdigest()
+            if isinstance(file_id, str):
+                self._upload_digests[file_id] = digest
+        ingested_path = self._ingested_uploads.get(digest)
+        # Another session's cache eviction may have removed an upload no longer shown
+        if digest in self._ingested_uploads and (ingested_path is None or ingested_path.exists()):
+            return self._reuse_ingested_upload(digest, ingested_path)
+
+        # Upload names come from the browser; keep only the final component
+        file_path = self.temp_dir / digest[:16] / Path(uploaded_file.name).name
+        if not file_path.exists():
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            def write_upload(staging_path: Path) -> None:
+                with open(staging_path, "wb") as f:
+                    for chunk in self._read_upload_chunks(uploaded_file):
+                        f.write(chunk)
+
+            write_file_atomically(file_path, write_upload)
+        converted_path = self.prepare_data_file(file_path)
+        self._ingested_uploads[digest] = converted_path
+        self._upload_cache_updates += 1
+        if converted_path is not None and str(converted_path) in self.json_sources:
+            self._upload_json_sources[digest] = (
+                str(converted_path),
+                self.json_sources[str(converted_path)],
+            )
+        return converted_path
+
+    def _reuse_ingested_upload(self, digest: str, ingested_path: Path | None) -> Path | None:
+        """Return an ingested upload's path, re-registering it if still queried in place."""
+        pending = self._upload_json_sources.get(digest)
+        if pending is None:
+            return ingested_path
+        json_path, parquet_path = pending
+        if Path(parquet_path).exists():
+            del self._upload_json_sources[digest]
+            self._ingested_uploads[digest] = Path(parquet_path)
+            self._upload_cache_updates += 1
+            return Path(parquet_path)
+        # save_uploaded_files starts each rerun with no JSON sources registered
+        self.json_sources[json_path] = parquet_path
+        self._schedule_json_conversion(Path(json_path), Path(parquet_path))
+        return Path(json_path)
+
+    def load_data_paths(self, paths: list[str]) -> list[str]:
+        """Load Parquet or JSON data from local filesystem paths.
+
+        Directories are searched recursively, so hive-partitioned trees such as
+        ``calculator=dft/task=opt/part-0.parquet`` load as one dataset; glob
+        patterns (``**`` included) are expanded as well.
+        """
+        self.data_paths = list(paths)
+        data_files = self._discover_data_files(paths, report_missing=True)
+        self._source_signature = self._get_source_signature(data_files)
+
+        resolved_paths: list[str] = []
+        self.json_sources = {}
+        for file_path in data_files:
+            converted_path = self.prepare_data_file(file_path)
+            if converted_path is not None:
+                resolved_paths.append(str(converted_path))
+
+        self.parquet_files = resolved_paths
+        self.build_manifest()
+        self.use_cache_entries()
+        return resolved_paths
+
+    @staticmethod
+    def _discover_data_files(paths: list[str], report_missing: bool = False) -> list[Path]:
+        """Expand files, directories and glob patterns into the data files they name."""
+        data_files: list[Path] = []
         for raw_path in paths:
             path = Path(raw_path).expanduser()
-            if path.is_dir():
-                data_files = sorted(
+            if path.is_dir() or (not path.exists() and is_glob_pattern(str(path))):
+                if path.is_dir():
+                    # Skip hidden directories such as the .iqc_cache manifests
+                    candidates = (
+                        file_path
+                        for file_path in path.rglob("*")
+                        if not any(
+                            part.startswith(".")
+                            for part in file_path.relative_to(path).parts
+                        )
+                    )
+                    missing_message = f"No parquet or json files found in directory: {path}"
+                else:
+                    candidates = (Path(match) for match in glob.glob(str(path), recursive=True))
+                    missing_message = f"No parquet or json files match: {path}"
+                matched_files = sorted(
                     file_path
-                    for file_path in path.iterdir()
+                    for file_path in candidates
                     if file_path.is_file()
                     and file_path.suffix.lower() in SUPPORTED_DATA_SUFFIXES
+                    # Reaction store tables load through their components file
+                    and not is_reaction_store_table(file_path)
                 )
-                if not data_files:
-                    st.warning(f"No parquet or json files found in directory: {path}")
-                for file_path in data_files:
-                    converted_path = self.prepare_data_file(file_path)
-                    if converted_path is not None:
-                        resolved_paths.append(str(converted_path))
+                if not matched_files and report_missing:
+                    st.warning(missing_message)
+                data_files.extend(matched_files)
             elif path.is_file():
-                converted_path = self.prepare_data_file(path)
-                if converted_path is not None:
-                    resolved_paths.append(str(converted_path))
-            else:
+                data_files.append(path)
+            elif report_missing:
                 st.warning(f"Path not found: {path}")
+        return data_files
 
-        self.parquet_files = resolved_paths
-        return resolved_paths
+    @staticmethod
+    def _get_source_signature(data_files: list[Path]) -> str:
+        """Hash the names, sizes and modification times of discovered data files."""
+        file_info = []
+        for file_path in data_files:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            file_info.append(f"{file_path}:{stat.st_size}:{stat.st_mtime_ns}")
+        return hashlib.md5("|".join(file_info).encode()).hexdigest()
+
+    def refresh_data_paths(self) -> list[str]:
+        """
+        Reload the data paths if files were added, changed or removed since the last load.
+
+        Returns the newly loaded or changed paths. Only those files are scanned,
+        since the manifest of every unchanged file is reused.
+        """
+        if not self.data_paths:
+            return []
+        data_files = self._discover_data_files(self.data_paths)
+        if self._get_source_signature(data_files) == self._source_signature:
+            return []
+
+        def file_stamp(path: str) -> tuple[int, int] | None:
+            try:
+                stat = Path(path).stat()
+            except OSError:
+                return None
+            return stat.st_size, stat.st_mtime_ns
+
+        previous_stamps = {path: file_stamp(path) for path in self.parquet_files}
+        loaded_paths = self.load_data_paths(self.data_paths)
+        return [
+            path
+            for path in loaded_paths
+            if path not in previous_stamps or previous_stamps[path] != file_stamp(path)
+        ]
 
-    def load_parquet_paths(self, paths: List[str]) -> List[str]:
+    def load_parquet_paths(self, paths: list[str]) -> list[str]:
         """Load local data paths. Retained for compatibility with older callers."""
         return self.load_data_paths(paths)
 
-    def prepare_data_file(self, path: Path) -> Optional[Path]:
+    def prepare_data_file(self, path: Path) -> Path | None:
         """Return a Parquet path that DuckDB can query for a supported data file."""
         suffix = path.suffix.lower()
         if suffix == ".parquet":
             return path
-        if suffix == ".json":
-            return self.convert_json_to_parquet(path)
+        if suffix in JSON_DATA_SUFFIXES:
+            return self.register_json_file(path)
 
         st.warning(f"Skipping unsupported data file: {path}")
         return None
 
-    def convert_json_to_parquet(self, json_path: Path) -> Optional[Path]:
-        """Convert a JSON data file into a temporary Parquet file."""
+    def _json_parquet_path(self, json_path: Path) -> Path:
+        """Return the cached Parquet path for a JSON file's content and converter version."""
+        entry_dir = self.temp_dir / cache_entry_key(
+            f"json-v{JSON_CONVERTER_VERSION}", file_content_digest(json_path)
+        )
+        # Same content under another name reuses the copy already written
+        return next(entry_dir.glob("*.parquet"), entry_dir / f"{json_path.stem}.parquet")
+
+    def _cached_paths(self) -> list[str]:
+        """Return the loaded files and pending JSON copies, which may live in the cache."""
+        return (
+            self.parquet_files
+            + list(self.json_sources)
+            + list(self.json_sources.values())
+        )
+
+    def use_cache_entries(self) -> list[Path]:
+        """
+        Mark the cache entries behind the loaded files as used, then trim the cache.
+
+        Least recently used entries go first once the cache exceeds its size limit;
+        files loaded by any live session are kept. Returns the removed entries.
+        """
+        for path in self._cached_paths():
+            entry_dir = cache_entry_of(self.temp_dir, path)
+            if entry_dir is not None:
+                touch_cache_entry(entry_dir)
+        try:
+            size_limit = cache_size_limit()
+        except ValueError as e:
+            st.warning(f"Cache size limit ignored: {e}")
+            return []
+        keep = []
+        for manager in list(DataManager._cache_users):
+            for path in manager._cached_paths():
+                entry_dir = cache_entry_of(self.temp_dir, path)
+                if entry_dir is not None:
+                    keep.append(entry_dir)
+        try:
+            return evict_cache_entries(self.temp_dir, size_limit, keep)
+        except OSError as e:
+            st.warning(f"Unable to trim the data cache: {e}")
+            return []
+
+    def register_json_file(self, json_path: Path) -> Path | None:
+        """
+        Return a path DuckDB can query for a JSON data file.
+
+        Record arrays and newline-delimited files are queried in place through
+        DuckDB's JSON reader while a Parquet copy is written in the background;
+        later loads and reruns switch to the copy. Reaction JSON, which expands
+        into component rows, and other layouts are converted up front.
+        """
+        try:
+            parquet_path = self._json_parquet_path(json_path)
+        except OSError as e:
+            st.warning(f"Unable to load JSON file {json_path}: {e}")
+            return None
+        if parquet_path.exists():
+            return parquet_path
+
+        try:
+            if json_layout(json_path) != JSON_LAYOUT_OBJECT:
+                conn = DataManager.get_connection()
+                schema = conn.execute(
+                    f"DESCRIBE SELECT * FROM {json_source_sql(str(json_path))}"
+                ).fetchall()
+                columns = [row[0] for row in schema]
+                # DuckDB falls back to a single JSON column when it finds no records
+                has_records = [tuple(row[:2]) for row in schema] != [("json", "JSON")]
+                if has_records and not set(REACTION_JSON_COLUMNS).issubset(columns):
+                    self.json_sources[str(json_path)] = str(parquet_path)
+                    self._schedule_json_conversion(json_path, parquet_path)
+                    return json_path
+        except (OSError, ValueError, duckdb.Error):
+            pass
+        return self.convert_json_to_parquet(json_path)
+
+    @staticmethod
+    def _schedule_json_conversion(json_path: Path, parquet_path: Path) -> None:
+        """Start writing a Parquet copy of a JSON file unless one is already underway."""
+        pool = DataManager.get_connection_pool()
+        with DataManager._json_conversion_lock:
+            conversion = DataManager._json_conversions.get(str(parquet_path))
+            # Retry a finished conversion whose copy is missing, e.g. after a failure
+            if conversion is None or (conversion.done() and not parquet_path.exists()):
+                DataManager._json_conversions[str(parquet_path)] = (
+                    DataManager._json_executor.submit(
+                        DataManager._convert_json_file, pool, str(json_path), str(parquet_path)
+                    )
+                )
+
+    @staticmethod
+    def _convert_json_file(pool: DuckDBConnectionPool, json_path: str, parquet_path: str) -> None:
+        """Write a JSON file's Parquet copy on the background conversion thread."""
+        target_path = Path(parquet_path)
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = target_path.with_name(f"{target_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            # The pool may run with preserve_insertion_order off, so sort by file position;
+            # queries and snapshots number the copy's rows as those of the JSON it replaces
+            pool.cursor().execute(
+                f"COPY (SELECT * EXCLUDE (ordinality) FROM {json_source_sql(json_path)} "
+                f"WITH ORDINALITY ORDER BY ordinality) "
+                f"TO {sql_string_literal(str(staging_path))} (FORMAT parquet)"
+            )
+            staging_path.replace(target_path)
+        except duckdb.Error:
+            # DuckDB infers types from a sample; pandas batches widen them instead
+            staging_path.unlink(missing_ok=True)
+            write_json_parquet(json_path, target_path)
+
+    def swap_converted_json_files(self) -> bool:
+        """Switch JSON files whose Parquet copy is ready over to it; True if any were."""
+        converted = {
+            json_path: parquet_path
+            for json_path, parquet_path in self.json_sources.items()
+            if Path(parquet_path).exists()
+        }
+        if not converted:
+            return False
+        self.parquet_files = [converted.get(path, path) for path in self.parquet_files]
+        for json_path in converted:
+            del self.json_sources[json_path]
+        if not self.json_sources:
+            self.build_manifest()
+        self.use_cache_entries()
+        return True
+
+    def convert_json_to_parquet(self, json_path: Path) -> Path | None:
+        """Convert a JSON data file into a Parquet file in the shared cache."""
         try:
-            json_df = self.read_json_dataframe(json_path)
-            parquet_df = normalize_json_dataframe(json_df)
-            if parquet_df.empty:
+            parquet_path = self._json_parquet_path(json_path)
+            if parquet_path.exists():
+                # Already converted this content, by this or another session
+                return parquet_path
+            parquet_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Streams record-oriented JSON in batches sized by IQC_JSON_MEMORY_LIMIT
+            if not write_json_parquet(json_path, parquet_path, transform=normalize_json_dataframe):
                 st.warning(f"No rows found in JSON file: {json_path}")
                 return None
-
-            file_stamp = ""
-            try:
-                file_stamp = f":{json_path.stat().st_mtime_ns}"
-            except OSError:
-                pass
-            digest = hashlib.md5(f"{json_path.resolve()}{file_stamp}".encode()).hexdigest()[:10]
-            parquet_path = self.temp_dir / f"{json_path.stem}_{digest}.parquet"
-            parquet_df.to_parquet(parquet_path, index=False)
             return parquet_path
         except Exception as e:
             st.warning(f"Unable to load JSON file {json_path}: {e}")
@@ -332,22 +1262,7 @@ class DataManager:
     @staticmethod
     def read_json_dataframe(json_path: Path) -> pd.DataFrame:
         """Read common JSON table layouts into a DataFrame."""
-        try:
-            return pd.read_json(json_path)
-        except ValueError:
-            with open(json_path, encoding="utf-8") as json_file:
-                json_data = json.load(json_file)
-
-            if isinstance(json_data, list):
-                return pd.DataFrame(json_data)
-            if isinstance(json_data, dict):
-                for key in ("data", "records", "rows"):
-                    value = json_data.get(key)
-                    if isinstance(value, list):
-                        return pd.DataFrame(value)
-                return pd.DataFrame.from_dict(json_data)
-
-            raise ValueError("Unsupported JSON table structure.")
+        return read_json_table(json_path)
 
     def _get_parquet_files_hash(self) -> str:
         """Generate a hash of parquet files for caching purposes."""
@@ -362,59 +1277,590 @@ class DataManager:
         return hashlib.md5("|".join(file_info).encode()).hexdigest()
 
     @staticmethod
-    @st.cache_resource
-    def get_connection() -> duckdb.DuckDBPyConnection:
-        """Get or create DuckDB connection (cached)."""
-        return duckdb.connect()
-
-    @st.cache_data(ttl=3600)  # Cache for 1 hour
-    def get_summary_stats(_self, parquet_files_hash: str) -> pd.DataFrame:
-        """Get summary statistics without loading full dataset. Cached based on parquet files."""
-        if not _self.parquet_files:
-            return pd.DataFrame()
+    def get_file_manifest_key(parquet_path: str) -> str:
+        """Return the hash of everything one file contributes: content, reactions, partition."""
+        fingerprint = parquet_content_fingerprint(parquet_path)
+        store = read_reaction_store(parquet_path)
+        if store is not None:
+            fingerprint += f"+{parquet_content_fingerprint(store['reactions'])}"
+        # Hive partition values are columns too, so they are part of the file's key
+        key_source = (
+            f"v{MANIFEST_VERSION}|{fingerprint}|"
+            f"{json.dumps(hive_partition_values(parquet_path), sort_keys=True)}"
+        )
+        return hashlib.sha256(key_source.encode()).hexdigest()[:32]
 
-        conn = DataManager.get_connection()
+    def get_manifest_key(self) -> str:
+        """Return the hash that names the manifest of the loaded files, from their file keys."""
+        file_keys = [self.get_file_manifest_key(path) for path in self.parquet_files]
+        key_source = f"v{MANIFEST_VERSION}|" + "|".join(file_keys)
+        return hashlib.sha256(key_source.encode()).hexdigest()[:32]
 
-        # Build query to read from all Parquet files
-        parquet_paths = "', '".join(_self.parquet_files)
-        query = f"""
-        SELECT 
-            COUNT(*) as total_rows,
-            COUNT(DISTINCT calculator) as unique_calculators,
-            COUNT(DISTINCT task) as unique_tasks,
-            COUNT(DISTINCT formula) as unique_formulas,
-            AVG(opt_energy_eV) as avg_opt_energy,
-            AVG(initial_energy_eV) as avg_initial_energy,
-            SUM(CASE WHEN opt_converged THEN 1 ELSE 0 END) as converged_count,
-            SUM(CASE WHEN NOT opt_converged THEN 1 ELSE 0 END) as not_converged_count
-        FROM read_parquet(['{parquet_paths}'])
-        """
+    def _manifest_dir(self) -> Path:
+        """Return the manifest directory next to the data, or in temp_dir if read-only."""
+        data_dir = Path(self.parquet_files[0]).parent / MANIFEST_DIR_NAME
+        try:
+            data_dir.mkdir(exist_ok=True)
+            if os.access(data_dir, os.W_OK):
+                return data_dir
+        except OSError:
+            pass
+        fallback_dir = self.temp_dir / MANIFEST_DIR_NAME
+        fallback_dir.mkdir(parents=True, exist_ok=True)
+        return fallback_dir
+
+    def _manifest_paths(self) -> tuple[Path, Path]:
+        """Return the manifest JSON and sorted-name Parquet paths for the loaded files."""
+        manifest_key = self.get_manifest_key()
+        manifest_dir = self._manifest_dir()
+        return (
+            manifest_dir / f"manifest-{manifest_key}.json",
+            manifest_dir / f"names-{manifest_key}.parquet",
+        )
 
+    def get_manifest(self) -> dict[str, Any] | None:
+        """Return the stored manifest for the loaded files, or None if none was built."""
+        if not self.parquet_files or self.json_sources:
+            return None
         try:
-            result = conn.execute(query).df()
-            return result
-        except Exception as e:
-            st.error(f"Error querying data: {e}")
-            return pd.DataFrame()
+            manifest_path, _ = self._manifest_paths()
+            if not manifest_path.exists():
+                return None
+            with manifest_path.open(encoding="utf-8") as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return None
 
-    def get_filtered_data(
+    def _file_manifest_paths(self, parquet_path: str) -> tuple[Path, Path]:
+        """Return the per-file manifest JSON and sorted-name Parquet paths of one file."""
+        file_key = self.get_file_manifest_key(parquet_path)
+        manifest_dir = self._manifest_dir()
+        return (
+            manifest_dir / f"file-{file_key}.json",
+            manifest_dir / f"file-{file_key}.names.parquet",
+        )
+
+    def build_file_manifest(
         self,
-        calculator: Optional[str] = None,
-        task: Optional[str] = None,
-        formula: Optional[str] = None,
-        opt_converged: Optional[bool] = None,
-        smiles_changed: Optional[bool] = None,
-        text_filter: Optional[str] = None,
-        number_of_imaginary_max: Optional[int] = None,
-        limit: Optional[int] = None,
-    ) -> pd.DataFrame:
-        """Get filtered data with optional limit for performance."""
-        if not self.parquet_files:
+        conn: duckdb.DuckDBPyConnection,
+        parquet_path: str,
+    ) -> dict[str, Any]:
+        """Scan one file for its statistics, or reuse them if already stored."""
+        manifest_path, names_path = self._file_manifest_paths(parquet_path)
+        if manifest_path.exists() and names_path.exists():
+            with manifest_path.open(encoding="utf-8") as manifest_file:
+                return json.load(manifest_file)
+
+        source = data_file_source_sql(parquet_path)
+        schema = conn.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()
+        column_types = {row[0]: row[1] for row in schema}
+
+        aggregates = ["count(*)"]
+        for column, column_type in column_types.items():
+            quoted = quote_identifier(column)
+            aggregates.append(f"count({quoted})")
+            if is_scalar_column_type(column_type):
+                aggregates.extend([f"min({quoted})", f"max({quoted})"])
+        label_columns = [column for column in DICTIONARY_COLUMNS if column in column_types]
+        for column in label_columns:
+            quoted = quote_identifier(column)
+            aggregates.append(
+                f"list(DISTINCT {quoted} ORDER BY {quoted}) FILTER (WHERE {quoted} IS NOT NULL)"
+            )
+        total_aggregates = {
+            "opt_energy_sum": ("opt_energy_eV", "sum(opt_energy_eV)"),
+            "opt_energy_count": ("opt_energy_eV", "count(opt_energy_eV)"),
+            "initial_energy_sum": ("initial_energy_eV", "sum(initial_energy_eV)"),
+            "initial_energy_count": ("initial_energy_eV", "count(initial_energy_eV)"),
+            "converged_count": ("opt_converged", "count_if(opt_converged)"),
+            "not_converged_count": ("opt_converged", "count_if(NOT opt_converged)"),
+        }
+        total_names = [
+            name for name, (column, _) in total_aggregates.items() if column in column_types
+        ]
+        aggregates.extend(total_aggregates[name][1] for name in total_names)
+        has_names = "unique_name" in column_types
+        if has_names:
+            aggregates.append(
+                "list(DISTINCT CAST(unique_name AS VARCHAR) ORDER BY CAST(unique_name AS VARCHAR)) "
+                "FILTER (WHERE unique_name IS NOT NULL)"
+            )
+
+        values = iter(conn.execute(f"SELECT {', '.join(aggregates)} FROM {source}").fetchone())
+        row_count = next(values)
+        columns = {}
+        for column, column_type in column_types.items():
+            stats = {"type": column_type, "null_count": row_count - next(values)}
+            if is_scalar_column_type(column_type):
+                stats["min"] = next(values)
+                stats["max"] = next(values)
+            columns[column] = stats
+        distinct_values = {column: next(values) or [] for column in label_columns}
+        totals = {name: next(values) or 0 for name in total_names}
+        molecule_names = (next(values) or []) if has_names else []
+
+        file_manifest = {
+            "version": MANIFEST_VERSION,
+            "path": parquet_path,
+            "fingerprint": parquet_content_fingerprint(parquet_path),
+            "row_count": row_count,
+            "columns": columns,
+            "distinct_values": distinct_values,
+            "totals": totals,
+        }
+        # Round-trip through JSON so a fresh manifest matches one read back from disk
+        file_manifest = json.loads(json.dumps(file_manifest, default=str))
+        write_file_atomically(
+            names_path,
+            lambda staging_path: pq.write_table(
+                pa.table({"unique_name": pa.array(molecule_names, type=pa.string())}),
+                staging_path,
+            ),
+        )
+        write_file_atomically(
+            manifest_path,
+            lambda staging_path: staging_path.write_text(
+                json.dumps(file_manifest), encoding="utf-8"
+            ),
+        )
+        return file_manifest
+
+    def build_manifest(self) -> dict[str, Any] | None:
+        """
+        Compute dataset statistics and store them next to the data.
+
+        The manifest holds row counts, per-column null counts and min/max, the
+        distinct values of label columns and the summary metrics; the sorted
+        molecule names go to a Parquet file alongside it. Every file gets its own
+        manifest keyed by its content hash, and the dataset manifest is merged
+        from those, so adding a file to a loaded directory scans only that file.
+        Building waits until JSON files queried in place have their Parquet copy.
+        """
+        if not self.parquet_files or self.json_sources:
+            return None
+
+        try:
+            manifest_path, names_path = self._manifest_paths()
+            if manifest_path.exists() and names_path.exists():
+                return self.get_manifest()
+
+            conn = DataManager.get_connection()
+            file_manifests = [
+                self.build_file_manifest(conn, path) for path in self.parquet_files
+            ]
+            dataset_view = self.register_dataset_view(conn)
+            schema = conn.execute(f"DESCRIBE SELECT * FROM {dataset_view}").fetchall()
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "key": self.get_manifest_key(),
+                "files": [
+                    {"path": path, "fingerprint": file_manifest["fingerprint"]}
+                    for path, file_manifest in zip(self.parquet_files, file_manifests)
+                ],
+                **merge_file_manifests(file_manifests, {row[0]: row[1] for row in schema}),
+            }
+
+            name_tables = [
+                pq.read_table(self._file_manifest_paths(path)[1]) for path in self.parquet_files
+            ]
+            molecule_names = pc.unique(
+                pa.chunked_array(
+                    [table.column("unique_name").combine_chunks() for table in name_tables],
+                    type=pa.string(),
+                )
+            )
+            molecule_names = molecule_names.take(pc.array_sort_indices(molecule_names))
+            write_file_atomically(
+                names_path,
+                lambda staging_path: pq.write_table(
+                    pa.table({"unique_name": molecule_names}), staging_path
+                ),
+            )
+            write_file_atomically(
+                manifest_path,
+                lambda staging_path: staging_path.write_text(
+                    json.dumps(manifest, default=str), encoding="utf-8"
+                ),
+            )
+            self._prune_dataset_manifests(manifest_path.parent)
+            return manifest
+        except (OSError, ValueError, duckdb.Error, pa.ArrowException) as e:
+            st.warning(f"Could not build dataset manifest: {e}")
+            return None
+
+    @staticmethod
+    def _prune_dataset_manifests(manifest_dir: Path) -> None:
+        """Delete all but the most recent dataset manifests in a cache directory."""
+        manifests = sorted(
+            manifest_dir.glob("manifest-*.json"),
+            key=lambda path: path.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for stale_path in manifests[MANIFEST_HISTORY_LIMIT:]:
+            manifest_key = stale_path.stem.split("-", 1)[1]
+            for path in (stale_path, manifest_dir / f"names-{manifest_key}.parquet"):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    @staticmethod
+    @st.cache_resource
+    def get_connection_pool() -> DuckDBConnectionPool:
+        """Get or create the DuckDB connection pool shared by all sessions (cached)."""
+        config_error = None
+        try:
+            config = load_duckdb_config()
+        except ValueError as e:
+            config_error = f"Using default DuckDB settings: {e}"
+            config = {}
+        pool = DuckDBConnectionPool(
+            max_cursors=config.get("pool_size", DUCKDB_POOL_SIZE),
+            settings={
+                setting: config[setting] for setting in DUCKDB_SETTINGS if setting in config
+            },
+        )
+        if config_error:
+            pool.setting_errors.insert(0, config_error)
+        return pool
+
+    @staticmethod
+    def get_connection() -> duckdb.DuckDBPyConnection:
+        """Get the calling thread's DuckDB cursor from the shared pool."""
+        return DataManager.get_connection_pool().cursor()
+
+    def _parquet_source_sql(self) -> str:
+        """Return the read_parquet table function call for the loaded files."""
+        if self.json_sources or any(map(read_reaction_store, self.parquet_files)):
+            # JSON queried in place and reaction stores join the other files by column name
+            sources = " UNION ALL BY NAME ".join(
+                f"SELECT * FROM {data_file_source_sql(path)}" for path in self.parquet_files
+            )
+            return f"({sources})"
+        parquet_paths = "', '".join(path.replace("'", "''") for path in self.parquet_files)
+        return f"read_parquet(['{parquet_paths}']{parquet_read_options(self.parquet_files)})"
+
+    def get_dataset_view_name(self) -> str:
+        """Return the catalog view name for the currently loaded files."""
+        return f"{DATASET_VIEW_PREFIX}{self._get_parquet_files_hash()}"
+
+    def register_dataset_view(self, conn: duckdb.DuckDBPyConnection) -> str:
+        """Register the loaded files as a named view once per dataset and return its name."""
+        view_name = self.get_dataset_view_name()
+        registered = conn.execute(
+            "SELECT 1 FROM duckdb_views() WHERE view_name = ?",
+            [view_name],
+        ).fetchone()
+        if not registered:
+            conn.execute(
+                f"CREATE OR REPLACE VIEW {view_name} AS "
+                f"SELECT * FROM {self._parquet_source_sql()}"
+            )
+            self._remember_dataset_catalog(conn, self._get_parquet_files_hash())
+        return view_name
+
+    @classmethod
+    def _remember_dataset_catalog(cls, conn: duckdb.DuckDBPyConnection, files_hash: str) -> None:
+        """
+        Record a dataset's view or name index, then drop those of unused datasets.
+
+        Refreshes and uploads give each version of the files a new hash. The least
+        recently registered datasets past DATASET_CATALOG_LIMIT are dropped, except
+        those a live session still has loaded.
+        """
+        with cls._dataset_catalog_lock:
+            cls._dataset_catalog.pop(files_hash, None)
+            cls._dataset_catalog[files_hash] = None
+            excess = len(cls._dataset_catalog) - DATASET_CATALOG_LIMIT
+            if excess <= 0:
+                return
+            live_hashes = {manager._get_parquet_files_hash() for manager in list(cls._cache_users)}
+            stale_hashes = [
+                stale_hash for stale_hash in cls._dataset_catalog if stale_hash not in live_hashes
+            ]
+            for stale_hash in stale_hashes[:excess]:
+                del cls._dataset_catalog[stale_hash]
+                conn.execute(f"DROP TABLE IF EXISTS {NAME_INDEX_PREFIX}{stale_hash}")
+                conn.execute(f"DROP VIEW IF EXISTS {DATASET_VIEW_PREFIX}{stale_hash}")
+
+    def _execute_dataset_query(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        query: str,
+        params: list[Any] | None = None,
+    ) -> duckdb.DuckDBPyConnection:
+        """Execute a query against the dataset view, registering the view if needed."""
+        self.register_dataset_view(conn)
+        if params:
+            return conn.execute(query, params)
+        return conn.execute(query)
+
+    def _build_text_filter_condition(self, text_filter: str) -> tuple[str, list[Any]]:
+        """Build a parameterized SQL condition for the unique_name/SMILES text filter."""
+        available_columns = set(self.get_column_names())
+        text_columns = [
+            column
+            for column in TEXT_FILTER_COLUMNS
+            if not available_columns or column in available_columns
+        ]
+        if not text_columns:
+            return "FALSE", []
+
+        if is_simple_text_filter(text_filter):
+            # Plain substrings skip the regex engine and need no LIKE escaping
+            template = "contains(lower(COALESCE(CAST({column} AS VARCHAR), '')), ?)"
+            value = text_filter.lower()
+        else:
+            template = "regexp_matches(COALESCE(CAST({column} AS VARCHAR), ''), ?)"
+            value = f"(?i){text_filter}"
+
+        condition = " OR ".join(template.format(column=column) for column in text_columns)
+        return condition, [value] * len(text_columns)
+
+    def has_search_index(self) -> bool:
+        """Return True when every loaded Parquet file has a fresh trigram index."""
+        return bool(self.parquet_files) and not self.json_sources and all(
+            is_search_index_fresh(parquet_path) for parquet_path in self.parquet_files
+        )
+
+    def build_search_index(self) -> list[str]:
+        """Build missing or stale trigram indexes next to the loaded Parquet files."""
+        index_paths = []
+        for parquet_path in self.parquet_files:
+            if parquet_path in self.json_sources:
+                continue
+            try:
+                if not is_search_index_fresh(parquet_path):
+                    write_search_index(parquet_path)
+                index_paths.append(str(search_index_path(parquet_path)))
+            except (OSError, ValueError, duckdb.Error) as e:
+                st.warning(f"Could not build search index for {Path(parquet_path).name}: {e}")
+        return index_paths
+
+    def _get_search_index_hash(self) -> str:
+        """Generate a hash of the search index files for caching purposes."""
+        index_info = []
+        for parquet_path in sorted(self.parquet_files):
+            index_path = search_index_path(parquet_path)
+            if index_path.exists():
+                index_info.append(f"{index_path}:{index_path.stat().st_mtime}")
+        return hashlib.md5("|".join(index_info).encode()).hexdigest()
+
+    @st.cache_data(ttl=3600)  # Cache for 1 hour
+    def get_search_index_gram_counts(_self, search_index_hash: str) -> dict[str, int]:
+        """Get the number of indexed rows per trigram. Cached based on the index files."""
+        if not _self.has_search_index():
+            return {}
+
+        conn = DataManager.get_connection()
+        index_paths = ", ".join(
+            sql_string_literal(str(search_index_path(parquet_path)))
+            for parquet_path in _self.parquet_files
+        )
+        query = f"""
+        SELECT gram, COUNT(*) AS row_count
+        FROM read_parquet([{index_paths}])
+        GROUP BY gram
+        """
+
+        try:
+            return {gram: int(row_count) for gram, row_count in conn.execute(query).fetchall()}
+        except duckdb.Error as e:
+            st.warning(f"Error reading search index: {e}")
+            return {}
+
+    def _partition_pruned_files(self, filters: dict[str, Any] | None = None) -> list[str]:
+        """Return the loaded files whose hive partition values do not rule out the filters."""
+        pruned_files = []
+        for parquet_path in self.parquet_files:
+            partition_values = hive_partition_values(parquet_path)
+            if all(
+                partition_values.get(key) in (None, str(value))
+                for key, value in (filters or {}).items()
+                if key in PARTITION_FILTER_KEYS and value is not None
+            ):
+                pruned_files.append(parquet_path)
+        return pruned_files
+
+    def _search_index_source(
+        self,
+        text_filter: str,
+        filters: dict[str, Any] | None = None,
+    ) -> tuple[str, list[Any]] | None:
+        """
+        Return keyed rows limited to search index candidates, or None to scan.
+
+        Only plain ASCII substrings of at least one trigram use the index, and only
+        when the rarest probed gram is selective enough to beat a full scan. Files
+        in hive partitions excluded by ``filters`` are never opened.
+        """
+        if (
+            not is_simple_text_filter(text_filter)
+            or not text_filter.isascii()
+            or not self.has_search_index()
+        ):
+            return None
+
+        grams = search_text_grams(text_filter)
+        gram_counts = self.get_search_index_gram_counts(self._get_search_index_hash())
+        if not grams or not gram_counts:
+            return None
+
+        probe_grams = sorted(grams, key=lambda gram: gram_counts.get(gram, 0))
+        probe_grams = probe_grams[:SEARCH_INDEX_PROBE_GRAMS]
+        if gram_counts.get(probe_grams[0], 0) > SEARCH_INDEX_MAX_CANDIDATES:
+            return None
+
+        conn = DataManager.get_connection()
+        gram_placeholders = ", ".join("?" for _ in probe_grams)
+        candidate_files = set(self._partition_pruned_files(filters))
+        branches = []
+        params = []
+        for file_index, parquet_path in enumerate(self.parquet_files):
+            if parquet_path not in candidate_files:
+                continue
+            candidate_rows = conn.execute(
+                f"""
+                SELECT file_row_number
+                FROM read_parquet({sql_string_literal(str(search_index_path(parquet_path)))})
+                WHERE gram IN ({gram_placeholders})
+                GROUP BY file_row_number
+                HAVING COUNT(*) = {len(probe_grams)}
+                """,
+                probe_grams,
+            ).fetchall()
+            if not candidate_rows:
+                continue
+            branches.append(
+                f"{self._keyed_file_sql(file_index, parquet_path)} "
+                f"WHERE file_row_number IN (SELECT UNNEST(?::BIGINT[]))"
+            )
+            params.append([row[0] for row in candidate_rows])
+
+        if not branches:
+            # No file can match, so return the dataset's columns without reading any rows
+            return f"(SELECT * FROM {self._keyed_source_sql()} LIMIT 0) AS indexed_rows", []
+
+        return f"({' UNION ALL BY NAME '.join(branches)}) AS indexed_rows", params
+
+    def get_column_names(self, numeric_only: bool = False) -> list[str]:
+        """Return dataset column names from the cached schema."""
+        schema = self.get_schema(self._get_parquet_files_hash())
+        if schema.empty or "column_name" not in schema.columns:
+            return []
+
+        column_names = schema["column_name"].astype(str).tolist()
+        if not numeric_only:
+            return column_names
+
+        type_column = "column_type" if "column_type" in schema.columns else "type"
+        if type_column not in schema.columns:
+            return []
+        return [
+            column_name
+            for column_name, column_type in zip(column_names, schema[type_column])
+            if is_numeric_column_type(column_type)
+        ]
+
+    def _derived_name_columns(self) -> list[str]:
+        """Return the parsed unique_name columns snapshots add to the dataset's own."""
+        column_names = self.get_column_names()
+        if "unique_name" not in column_names:
+            return []
+        return [column for column in PARSED_NAME_COLUMNS if column not in column_names]
+
+    def _parsed_name_select_sql(self) -> str:
+        """Return the SELECT list suffix that materialises parsed unique_name fields."""
+        return "".join(
+            f", {PARSED_NAME_SQL[column]} AS {column}" for column in self._derived_name_columns()
+        )
+
+    @st.cache_data(ttl=3600)  # Cache for 1 hour
+    def get_dictionary_columns(_self, parquet_files_hash: str) -> tuple[str, ...]:
+        """
+        Get the label columns to return as categoricals. Cached based on parquet files.
+
+        A candidate column qualifies when its values repeat across rows. Distinct
+        counts come from the manifest, or from one approximate count over the
+        candidate columns when the files have no manifest yet.
+        """
+        if not _self.parquet_files:
+            return ()
+        column_names = set(_self.get_column_names())
+        candidates = [column for column in DICTIONARY_COLUMNS if column in column_names]
+        if not candidates:
+            return ()
+
+        manifest = _self.get_manifest()
+        if manifest is not None:
+            row_count = manifest["row_count"]
+            distinct_counts = {
+                column: len(manifest["distinct_values"].get(column, []))
+                for column in candidates
+            }
+        else:
+            conn = DataManager.get_connection()
+            counts = ", ".join(
+                f"approx_count_distinct({quote_identifier(column)})" for column in candidates
+            )
+            query = f"SELECT count(*), {counts} FROM {_self.get_dataset_view_name()}"
+            try:
+                result = _self._execute_dataset_query(conn, query).fetchone()
+            except duckdb.Error as e:
+                st.warning(f"Error counting distinct label values: {e}")
+                return ()
+            row_count = result[0]
+            distinct_counts = dict(zip(candidates, result[1:]))
+
+        max_distinct = max(DICTIONARY_MAX_DISTINCT, row_count * DICTIONARY_MAX_DISTINCT_RATIO)
+        return tuple(
+            column for column in candidates if distinct_counts[column] <= max_distinct
+        )
+
+    @st.cache_data(ttl=3600)  # Cache for 1 hour
+    def get_summary_stats(_self, parquet_files_hash: str) -> pd.DataFrame:
+        """Get summary statistics without loading full dataset. Cached based on parquet files."""
+        if not _self.parquet_files:
             return pd.DataFrame()
 
+        manifest = _self.get_manifest()
+        if manifest is not None:
+            return pd.DataFrame([manifest["summary"]])
+
         conn = DataManager.get_connection()
 
-        # Build WHERE clause with parameterized queries
+        # Build query against the registered dataset view
+        dataset_view = _self.get_dataset_view_name()
+        query = f"""
+        SELECT 
+            COUNT(*) as total_rows,
+            COUNT(DISTINCT calculator) as unique_calculators,
+            COUNT(DISTINCT task) as unique_tasks,
+            COUNT(DISTINCT formula) as unique_formulas,
+            AVG(opt_energy_eV) as avg_opt_energy,
+            AVG(initial_energy_eV) as avg_initial_energy,
+            SUM(CASE WHEN opt_converged THEN 1 ELSE 0 END) as converged_count,
+            SUM(CASE WHEN NOT opt_converged THEN 1 ELSE 0 END) as not_converged_count
+        FROM {dataset_view}
+        """
+
+        try:
+            result = _self._execute_dataset_query(conn, query).df()
+            return result
+        except Exception as e:
+            st.error(f"Error querying data: {e}")
+            return pd.DataFrame()
+
+    @staticmethod
+    def _build_filter_conditions(
+        calculator: str | None = None,
+        task: str | None = None,
+        formula: str | None = None,
+        opt_converged: bool | None = None,
+        smiles_changed: bool | None = None,
+        number_of_imaginary_max: int | None = None,
+    ) -> tuple[list[str], list[Any]]:
+        """Build parameterized WHERE conditions for the sidebar column filters."""
         conditions = []
         params = []
 
@@ -437,221 +1883,885 @@ class DataManager:
             conditions.append("number_of_imaginary <= ?")
             params.append(number_of_imaginary_max)
 
-        where_clause = " AND ".join(conditions) if conditions else ""
-        limit_clause = f"LIMIT {limit}" if limit else ""
+        return conditions, params
+
+    @staticmethod
+    def _normalize_snapshot_filters(
+        filters: dict[str, Any] | None = None,
+    ) -> tuple[tuple[str, Any], ...]:
+        """Return a hashable, order-independent key of the active filter values."""
+        normalized = []
+        for key, value in sorted((filters or {}).items()):
+            if value is None or (isinstance(value, str) and not value.strip()):
+                continue
+            normalized.append((key, value))
+        return tuple(normalized)
+
+    def get_filter_snapshot_name(self, filters: dict[str, Any] | None = None) -> str:
+        """Return the snapshot table name for the loaded files and filter values."""
+        snapshot_key = repr(
+            (self._get_parquet_files_hash(), self._normalize_snapshot_filters(filters))
+        )
+        digest = hashlib.sha256(snapshot_key.encode()).hexdigest()[:16]
+        return f"{FILTER_SNAPSHOT_PREFIX}{digest}"
+
+    def get_filter_snapshot(self, filters: dict[str, Any] | None = None) -> str:
+        """Materialise the rows matching the filters once and return the table name.
+
+        Queries should hold the snapshot with use_filter_snapshot instead, since
+        another session may evict a table that nobody holds.
+        """
+        with self.use_filter_snapshot(filters) as table_name:
+            return table_name
 
-        parquet_paths = "', '".join(self.parquet_files)
+    @contextmanager
+    def use_filter_snapshot(self, filters: dict[str, Any] | None = None) -> Iterator[str]:
+        """Materialise the filter snapshot and keep it from eviction until the block exits.
+
+        Every tab reads the same snapshot, so an interaction scans the files once.
+        Snapshots keep only row keys and light columns; get_filtered_data reads the
+        other projected columns back from the files.
+        """
+        conn = DataManager.get_connection()
+        table_name = self.get_filter_snapshot_name(filters)
+        self._hold_filter_snapshot(conn, table_name)
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM duckdb_tables() WHERE table_name = ?",
+                [table_name],
+            ).fetchone()
+            if not exists:
+                self._create_filter_snapshot(conn, table_name, filters)
+            yield table_name
+        finally:
+            self._release_filter_snapshot(conn, table_name)
+
+    def _create_filter_snapshot(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table_name: str,
+        filters: dict[str, Any] | None = None,
+    ) -> None:
+        """Write the row keys and light columns of the rows matching the filters."""
+        filter_values = dict(self._normalize_snapshot_filters(filters))
+        text_filter = filter_values.pop("text_filter", None)
+        conditions, params = self._build_filter_conditions(**filter_values)
+        indexed_source = (
+            self._search_index_source(text_filter, filter_values) if text_filter else None
+        )
+        if indexed_source is not None:
+            self._create_indexed_snapshot(
+                conn,
+                table_name,
+                indexed_source,
+                conditions,
+                params,
+                text_filter,
+            )
+            return
+
+        if text_filter:
+            text_condition, text_params = self._build_text_filter_condition(text_filter)
+            conditions.append(f"({text_condition})")
+            params.extend(text_params)
+
+        where_clause = " AND ".join(conditions)
         query = f"""
-        SELECT *
-        FROM read_parquet(['{parquet_paths}'])
+        CREATE TABLE IF NOT EXISTS {table_name} AS
+        SELECT {self._snapshot_select_list()}
+        FROM {self._keyed_source_sql(self._partition_pruned_files(filter_values))}
         {f'WHERE {where_clause}' if where_clause else ''}
-        {limit_clause}
+        ORDER BY iqc_file_index, file_row_number
+        """
+        try:
+            conn.execute(query, params)
+        except duckdb.Error:
+            if not text_filter:
+                raise
+            self._create_text_fallback_snapshot(
+                conn,
+                table_name,
+                filter_values,
+                text_filter,
+            )
+
+    @classmethod
+    def _hold_filter_snapshot(cls, conn: duckdb.DuckDBPyConnection, table_name: str) -> None:
+        """Mark a snapshot as held and most recently used, then drop unheld extras."""
+        with cls._snapshot_lock:
+            holders = cls._snapshot_tables.pop(table_name, 0)
+            cls._snapshot_tables[table_name] = holders + 1
+            cls._evict_filter_snapshots(conn)
+
+    @classmethod
+    def _release_filter_snapshot(cls, conn: duckdb.DuckDBPyConnection, table_name: str) -> None:
+        """Release a hold on a snapshot, then drop unheld extras."""
+        with cls._snapshot_lock:
+            if table_name in cls._snapshot_tables:
+                cls._snapshot_tables[table_name] = max(cls._snapshot_tables[table_name] - 1, 0)
+            cls._evict_filter_snapshots(conn)
+
+    @classmethod
+    def _evict_filter_snapshots(cls, conn: duckdb.DuckDBPyConnection) -> None:
+        """Drop least recently used snapshots nobody holds until within the limit.
+
+        Callers hold _snapshot_lock. Held snapshots stay past the limit until released.
         """
+        stale_tables = [
+            table_name for table_name, holders in cls._snapshot_tables.items() if not holders
+        ]
+        excess = len(cls._snapshot_tables) - FILTER_SNAPSHOT_LIMIT
+        for stale_table in stale_tables[: max(excess, 0)]:
+            del cls._snapshot_tables[stale_table]
+            conn.execute(f"DROP TABLE IF EXISTS {stale_table}{REACTION_TABLE_SUFFIX}")
+            conn.execute(f"DROP TABLE IF EXISTS {stale_table}")
+
+    def _snapshot_columns(self) -> list[str]:
+        """Return the light dataset columns filter snapshots keep, in dataset order."""
+        column_names = self.get_column_names()
+        return [column for column in column_names if column in SNAPSHOT_COLUMNS]
+
+    def _snapshot_select_list(self) -> str:
+        """Return the SELECT list that writes a snapshot from keyed dataset rows."""
+        columns = [*SNAPSHOT_KEY_COLUMNS, *self._snapshot_columns()]
+        return ", ".join(quote_identifier(column) for column in columns) + (
+            self._parsed_name_select_sql()
+        )
 
+    @staticmethod
+    def _keyed_file_sql(file_index: int, path: str) -> str:
+        """Return one loaded file's rows with its index and row numbers as the row key."""
+        return (
+            f"SELECT *, {file_index} AS iqc_file_index "
+            f"FROM {data_file_source_sql(path, file_row_number=True)}"
+        )
+
+    def _keyed_source_sql(self, paths: list[str] | None = None) -> str:
+        """Return the loaded files' rows keyed by (iqc_file_index, file_row_number).
+
+        ``paths`` limits the rows to some of the loaded files; when it excludes every
+        file, no rows are read but the columns are still those of the dataset.
+        """
+        included_paths = set(self.parquet_files if paths is None else paths)
+        branches = [
+            self._keyed_file_sql(file_index, path)
+            for file_index, path in enumerate(self.parquet_files)
+            if path in included_paths
+        ]
+        if not branches and paths is not None:
+            return f"(SELECT * FROM {self._keyed_source_sql()} LIMIT 0)"
+        return f"({' UNION ALL BY NAME '.join(branches)})"
+
+    def _create_indexed_snapshot(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table_name: str,
+        indexed_source: tuple[str, list[Any]],
+        conditions: list[str],
+        params: list[Any],
+        text_filter: str,
+    ) -> None:
+        """Build a text-filtered snapshot from search index candidate rows.
+
+        Candidates are materialised first so DuckDB cannot push the exact text check
+        below the candidate join and back onto a full-column scan.
+        """
+        source_sql, source_params = indexed_source
+        staging_table = f"{table_name}_candidates_{uuid.uuid4().hex[:8]}"
+        where_clause = " AND ".join(conditions)
+        conn.execute(
+            f"""
+            CREATE TABLE {staging_table} AS
+            SELECT {self._snapshot_select_list()}
+            FROM {source_sql}
+            {f'WHERE {where_clause}' if where_clause else ''}
+            """,
+            source_params + params,
+        )
         try:
-            if params:
-                result = conn.execute(query, params).df()
-            else:
-                result = conn.execute(query).df()
+            text_condition, text_params = self._build_text_filter_condition(text_filter)
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table_name} AS
+                SELECT *
+                FROM {staging_table}
+                WHERE {text_condition}
+                ORDER BY iqc_file_index, file_row_number
+                """,
+                text_params,
+            )
+        finally:
+            conn.execute(f"DROP TABLE IF EXISTS {staging_table}")
 
-            # Apply text filter using SQL if possible (more efficient than pandas)
-            if text_filter and text_filter.strip():
-                try:
-                    # Escape special SQL characters
-                    text_filter_escaped = text_filter.replace("'", "''").replace("\\", "\\\\")
+    def _create_text_fallback_snapshot(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table_name: str,
+        filter_values: dict[str, Any],
+        text_filter: str,
+    ) -> None:
+        """Build a text-filtered snapshot with Python regex when DuckDB cannot run it.
+
+        Only the text columns of the snapshot without the text filter reach pandas.
+        """
+        pattern = re.compile(text_filter, re.IGNORECASE)
+        available_columns = set(self.get_column_names())
+        text_columns = [
+            column
+            for column in TEXT_FILTER_COLUMNS
+            if not available_columns or column in available_columns
+        ]
 
-                    # Check if it's a simple pattern (no regex special chars except *)
-                    is_simple_pattern = not any(
-                        char in text_filter
-                        for char in ["^", "$", "[", "]", "(", ")", "+", "?", "{", "}", "|", "."]
+        with self.use_filter_snapshot(filter_values) as base_table:
+            matched_rows: list[int] = []
+            if text_columns:
+                text_df = conn.execute(
+                    f"SELECT rowid AS snapshot_row, "
+                    f"{', '.join(quote_identifier(column) for column in text_columns)} "
+                    f"FROM {base_table}"
+                ).df()
+                mask = pd.Series(False, index=text_df.index)
+                for column in text_columns:
+                    mask |= (
+                        text_df[column]
+                        .astype("string")
+                        .str.contains(pattern, na=False, regex=True)
                     )
+                matched_rows = text_df.loc[mask, "snapshot_row"].astype(int).tolist()
+
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table_name} AS
+                SELECT *
+                FROM {base_table}
+                WHERE rowid IN (SELECT UNNEST(?::BIGINT[]))
+                ORDER BY rowid
+                """,
+                [matched_rows],
+            )
 
-                    if is_simple_pattern:
-                        # Use ILIKE for simple case-insensitive pattern matching (faster)
-                        text_conditions = []
-                        text_conditions.append(
-                            f"COALESCE(CAST(unique_name AS VARCHAR), '') ILIKE '%{text_filter_escaped}%'"
-                        )
-                        text_conditions.append(
-                            f"COALESCE(CAST(initial_smiles AS VARCHAR), '') ILIKE '%{text_filter_escaped}%'"
-                        )
-                        text_conditions.append(
-                            f"COALESCE(CAST(opt_smiles AS VARCHAR), '') ILIKE '%{text_filter_escaped}%'"
-                        )
-                    else:
-                        # Use regexp_matches for complex regex patterns
-                        text_conditions = []
-                        text_conditions.append(
-                            f"regexp_matches(COALESCE(CAST(unique_name AS VARCHAR), ''), '{text_filter_escaped}', 'i')"
-                        )
-                        text_conditions.append(
-                            f"regexp_matches(COALESCE(CAST(initial_smiles AS VARCHAR), ''), '{text_filter_escaped}', 'i')"
-                        )
-                        text_conditions.append(
-                            f"regexp_matches(COALESCE(CAST(opt_smiles AS VARCHAR), ''), '{text_filter_escaped}', 'i')"
-                        )
+    def _projected_columns(self, columns: list[str] | None) -> list[str] | None:
+        """Return the requested columns in dataset order, or None when none exist.
 
-                    text_where = " OR ".join(text_conditions)
+        An empty list means the schema is unknown and every column is read.
+        """
+        dataset_columns = self.get_column_names()
+        if columns is None or not dataset_columns:
+            return dataset_columns
+        requested_columns = set(columns)
+        projected_columns = [
+            column
+            for column in dataset_columns + self._derived_name_columns()
+            if column in requested_columns
+        ]
+        return projected_columns or None
 
-                    # Re-query with text filter in SQL (more efficient)
-                    query_with_text = f"""
-                    SELECT *
-                    FROM read_parquet(['{parquet_paths}'])
-                    {f'WHERE {where_clause}' if where_clause else ''}
-                    {f'AND ({text_where})' if where_clause else f'WHERE ({text_where})'}
-                    {limit_clause}
-                    """
+    def _snapshot_rows_sql(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        snapshot_table: str,
+        projected_columns: list[str],
+        limit: int | None = None,
+    ) -> str:
+        """Return the query reading projected columns of a snapshot's rows, in order.
+
+        Columns the snapshot keeps are read from it. Any others are read back by
+        row key from the files those rows come from, so only the projected columns
+        of those files are scanned and pruned partitions stay closed.
+        """
+        stored_columns = set(self._snapshot_columns() + self._derived_name_columns())
+        limit_clause = f"LIMIT {int(limit)}" if limit else ""
+        rows_sql = (
+            f"(SELECT rowid AS snapshot_row, * FROM {snapshot_table} "
+            f"ORDER BY rowid {limit_clause}) AS s"
+        )
+        if projected_columns and stored_columns.issuperset(projected_columns):
+            select_list = ", ".join(f"s.{quote_identifier(column)}" for column in projected_columns)
+            return f"SELECT {select_list} FROM {rows_sql} ORDER BY s.snapshot_row"
+
+        if projected_columns:
+            select_list = ", ".join(
+                f"{'s' if column in stored_columns else 'k'}.{quote_identifier(column)}"
+                for column in projected_columns
+            )
+        else:
+            # Without a schema, return every column the files have
+            select_list = f"k.* EXCLUDE ({', '.join(SNAPSHOT_KEY_COLUMNS)})"
+        file_indexes = conn.execute(
+            f"SELECT DISTINCT iqc_file_index FROM {rows_sql}"
+        ).fetchall()
+        snapshot_files = [self.parquet_files[row[0]] for row in file_indexes]
+        return f"""
+        SELECT {select_list}
+        FROM {rows_sql}
+        JOIN {self._keyed_source_sql(snapshot_files)} AS k
+            ON s.iqc_file_index = k.iqc_file_index AND s.file_row_number = k.file_row_number
+        ORDER BY s.snapshot_row
+        """
 
-                    if params:
-                        result = conn.execute(query_with_text, params).df()
-                    else:
-                        result = conn.execute(query_with_text).df()
-                except Exception:
-                    # Fallback to pandas filtering if SQL regex fails
-                    try:
-                        pattern = re.compile(text_filter, re.IGNORECASE)
-                        mask = pd.Series([False] * len(result))
-
-                        # Check unique_name
-                        if "unique_name" in result.columns:
-                            mask |= (
-                                result["unique_name"]
-                                .astype(str)
-                                .str.contains(pattern, na=False, regex=True)
-                            )
+    def get_filtered_data(
+        self,
+        calculator: str | None = None,
+        task: str | None = None,
+        formula: str | None = None,
+        opt_converged: bool | None = None,
+        smiles_changed: bool | None = None,
+        text_filter: str | None = None,
+        number_of_imaginary_max: int | None = None,
+        limit: int | None = None,
+        columns: list[str] | None = None,
+        as_arrow: bool = False,
+    ) -> pd.DataFrame | pa.Table:
+        """Get filtered data with optional limit and column projection for performance.
+
+        When ``columns`` is given, only those columns that exist in the dataset are
+        read, in dataset order; filters may still reference unprojected columns.
+        With ``as_arrow`` the Arrow table is returned so callers can slice it before
+        paying for a pandas conversion.
+        """
+        empty_result = pa.table({}) if as_arrow else pd.DataFrame()
+        if not self.parquet_files:
+            return empty_result
 
-                        # Check initial_smiles
-                        if "initial_smiles" in result.columns:
-                            mask |= (
-                                result["initial_smiles"]
-                                .astype(str)
-                                .str.contains(pattern, na=False, regex=True)
-                            )
+        projected_columns = self._projected_columns(columns)
+        if projected_columns is None:
+            return empty_result
 
-                        # Check opt_smiles
-                        if "opt_smiles" in result.columns:
-                            mask |= (
-                                result["opt_smiles"]
-                                .astype(str)
-                                .str.contains(pattern, na=False, regex=True)
-                            )
+        conn = DataManager.get_connection()
+        filters = {
+            "calculator": calculator,
+            "task": task,
+            "formula": formula,
+            "opt_converged": opt_converged,
+            "smiles_changed": smiles_changed,
+            "number_of_imaginary_max": number_of_imaginary_max,
+        }
 
-                        result = result[mask]
-                    except re.error as re_err:
-                        st.warning(f"Invalid regex pattern: {re_err}")
-                        return pd.DataFrame()
-
-            # Optimize memory usage by converting object columns to category where appropriate
-            if not result.empty:
-                for col in result.columns:
-                    if result[col].dtype == "object":
-                        try:
-                            # Skip columns that contain arrays, lists, or other complex types
-                            # Check if first non-null value is hashable (simple string/number)
-                            non_null_values = result[col].dropna()
-                            if non_null_values.empty:
-                                continue
-
-                            sample_value = non_null_values.iloc[0]
-                            # Skip if it's a list, array, or dict
-                            if isinstance(sample_value, (list, dict, np.ndarray)):
-                                continue
-                            # Try to hash it - if it fails, skip this column
-                            try:
-                                hash(sample_value)
-                            except (TypeError, ValueError):
-                                continue
-
-                            # Convert to category if unique values are less than 50% of total
-                            # Use try-except around nunique() in case it fails with arrays
-                            try:
-                                unique_count = result[col].nunique()
-                                unique_ratio = unique_count / len(result)
-                                if unique_ratio < 0.5 and unique_count > 0:
-                                    result[col] = result[col].astype("category")
-                            except (TypeError, ValueError):
-                                # Skip if nunique() fails (e.g., with unhashable types)
-                                continue
-                        except (ValueError, TypeError, AttributeError, IndexError):
-                            # Skip if conversion fails or column has issues
-                            pass
+        if text_filter and text_filter.strip():
+            try:
+                re.compile(text_filter, re.IGNORECASE)
+            except re.error as re_err:
+                st.warning(f"Invalid regex pattern: {re_err}")
+                return empty_result
 
-            return result
+        try:
+            # The text filter is part of the snapshot query, so it costs no extra scan
+            with self.use_filter_snapshot(
+                {**filters, "text_filter": text_filter}
+            ) as snapshot_table:
+                query = self._snapshot_rows_sql(conn, snapshot_table, projected_columns, limit)
+                arrow_result = fetch_arrow_table(conn.execute(query))
+            # Label columns come back as categoricals straight from Arrow dictionaries
+            result = dictionary_encode_columns(
+                arrow_result,
+                self.get_dictionary_columns(self._get_parquet_files_hash()),
+            )
+            return result if as_arrow else arrow_table_to_pandas(result)
         except Exception as e:
             st.error(f"Error querying filtered data: {e}")
+            return empty_result
+
+    @staticmethod
+    def _build_name_conditions(search: str | None = None) -> tuple[list[str], list[Any]]:
+        """Build WHERE conditions for molecule name queries on a filter snapshot."""
+        conditions = ["unique_name IS NOT NULL"]
+        params = []
+
+        if search and search.strip():
+            conditions.append("CAST(unique_name AS VARCHAR) ILIKE ? ESCAPE '\\'")
+            params.append(f"%{escape_like_pattern(search.strip())}%")
+
+        return conditions, params
+
+    def _query_molecule_names(
+        self,
+        filters: dict[str, Any] | None,
+        conditions: list[str],
+        params: list[Any],
+        order: str = "ASC",
+        limit: int | None = None,
+    ) -> list[str]:
+        """Return distinct molecule names matching conditions in keyset order."""
+        conn = DataManager.get_connection()
+        limit_clause = f"LIMIT {int(limit)}" if limit is not None else ""
+
+        with self.use_filter_snapshot(filters) as snapshot_table:
+            query = f"""
+            SELECT DISTINCT unique_name
+            FROM {snapshot_table}
+            WHERE {" AND ".join(conditions)}
+            ORDER BY unique_name {order}
+            {limit_clause}
+            """
+            result = conn.execute(query, params).df()
+        return result["unique_name"].astype(str).tolist()
+
+    def get_molecule_name_page(
+        self,
+        filters: dict[str, Any] | None = None,
+        search: str | None = None,
+        after: str | None = None,
+        page_size: int = MOLECULE_NAME_PAGE_SIZE,
+    ) -> tuple[list[str], bool]:
+        """Get one page of sorted molecule names after a keyset cursor.
+
+        Returns the page and whether more names follow it.
+        """
+        if not self.parquet_files:
+            return [], False
+
+        conditions, params = self._build_name_conditions(search)
+        if after is not None:
+            conditions.append("unique_name > ?")
+            params.append(after)
+
+        try:
+            names = self._query_molecule_names(
+                filters,
+                conditions,
+                params,
+                limit=page_size + 1,
+            )
+        except duckdb.Error as e:
+            st.warning(f"Error getting molecule names: {e}")
+            return [], False
+
+        return names[:page_size], len(names) > page_size
+
+    def count_molecule_names(
+        self,
+        filters: dict[str, Any] | None = None,
+        search: str | None = None,
+        before: str | None = None,
+    ) -> int:
+        """Count distinct molecule names, optionally only those sorting before a name."""
+        if not self.parquet_files:
+            return 0
+
+        conditions, params = self._build_name_conditions(search)
+        if before is not None:
+            conditions.append("unique_name < ?")
+            params.append(before)
+
+        conn = DataManager.get_connection()
+
+        try:
+            with self.use_filter_snapshot(filters) as snapshot_table:
+                query = f"""
+                SELECT COUNT(DISTINCT unique_name) AS name_count
+                FROM {snapshot_table}
+                WHERE {" AND ".join(conditions)}
+                """
+                result = conn.execute(query, params).fetchone()
+            return int(result[0]) if result else 0
+        except duckdb.Error as e:
+            st.warning(f"Error counting molecule names: {e}")
+            return 0
+
+    def get_adjacent_molecule_name(
+        self,
+        unique_name: str,
+        step: int,
+        filters: dict[str, Any] | None = None,
+        search: str | None = None,
+    ) -> str | None:
+        """Get the molecule name immediately after (step > 0) or before a name."""
+        if not self.parquet_files or step == 0:
+            return None
+
+        conditions, params = self._build_name_conditions(search)
+        conditions.append("unique_name > ?" if step > 0 else "unique_name < ?")
+        params.append(unique_name)
+
+        try:
+            names = self._query_molecule_names(
+                filters,
+                conditions,
+                params,
+                order="ASC" if step > 0 else "DESC",
+                limit=1,
+            )
+        except duckdb.Error as e:
+            st.warning(f"Error getting molecule names: {e}")
+            return None
+
+        return names[0] if names else None
+
+    def get_ligand_pairs(self, filters: dict[str, Any] | None = None) -> pd.DataFrame:
+        """Get distinct bipyridine/alkyne pairs parsed from reaction-like unique_name values."""
+        columns = ["bipyridine", "alkyne"]
+        if not self.parquet_files:
+            return pd.DataFrame(columns=columns)
+
+        conditions, params = self._build_name_conditions()
+        conditions.append("name_role IN ('reactant', 'product')")
+
+        conn = DataManager.get_connection()
+
+        try:
+            with self.use_filter_snapshot(filters) as snapshot_table:
+                query = f"""
+                SELECT DISTINCT
+                    name_bipyridine AS bipyridine,
+                    name_alkyne AS alkyne
+                FROM {snapshot_table}
+                WHERE {" AND ".join(conditions)}
+                ORDER BY bipyridine, alkyne
+                """
+                return conn.execute(query, params).df()
+        except duckdb.Error as e:
+            st.warning(f"Error getting ligand pairs: {e}")
+            return pd.DataFrame(columns=columns)
+
+    def get_ligand_molecule_names(
+        self,
+        bipyridine: str,
+        alkyne: str,
+        filters: dict[str, Any] | None = None,
+    ) -> list[str]:
+        """Get sorted molecule names for one bipyridine/alkyne pair."""
+        if not self.parquet_files:
+            return []
+
+        conditions, params = self._build_name_conditions()
+        conditions.extend(
+            [
+                "name_role IN ('reactant', 'product')",
+                "name_bipyridine = ?",
+                "name_alkyne = ?",
+            ]
+        )
+        params.extend([bipyridine, alkyne])
+
+        try:
+            return self._query_molecule_names(filters, conditions, params)
+        except duckdb.Error as e:
+            st.warning(f"Error getting molecule names: {e}")
+            return []
+
+    @staticmethod
+    def get_reaction_gibbs_table(snapshot_table: str) -> str:
+        """Materialise the lowest-G reactant/product pairs of a snapshot once; return the name.
+
+        The SQL counterpart of calculate_reaction_gibbs: conformers are reduced with
+        arg_min per (bipyridine, alkyne, role), ties going to the earlier row, and
+        energies stay in eV so every display unit reads the same table. The table
+        is dropped with its snapshot, so hold the snapshot while reading it.
+        """
+        conn = DataManager.get_connection()
+        table_name = f"{snapshot_table}{REACTION_TABLE_SUFFIX}"
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table_name} AS
+            WITH energies AS (
+                SELECT
+                    rowid AS snapshot_row,
+                    unique_name,
+                    name_bipyridine AS bipyridine,
+                    name_alkyne AS alkyne,
+                    name_role AS role,
+                    CAST(G_eV AS DOUBLE) AS G_eV
+                FROM {snapshot_table}
+            ),
+            lowest AS (
+                SELECT
+                    bipyridine,
+                    alkyne,
+                    role,
+                    arg_min(unique_name, (G_eV, snapshot_row)) AS unique_name,
+                    min(G_eV) AS G_eV
+                FROM energies
+                WHERE role IN ('reactant', 'product')
+                    AND NOT isnan(G_eV)
+                    AND bipyridine IS NOT NULL
+                    AND alkyne IS NOT NULL
+                GROUP BY bipyridine, alkyne, role
+            )
+            SELECT
+                reactant.bipyridine,
+                reactant.alkyne,
+                reactant.G_eV AS G_reactant,
+                reactant.unique_name AS unique_name_reactant,
+                product.G_eV AS G_product,
+                product.unique_name AS unique_name_product,
+                (SELECT min(G_eV) FROM energies WHERE role = 'co2') AS G_CO2
+            FROM lowest AS reactant
+            JOIN lowest AS product USING (bipyridine, alkyne)
+            WHERE reactant.role = 'reactant' AND product.role = 'product'
+            ORDER BY reactant.bipyridine, reactant.alkyne
+            """
+        )
+        return table_name
+
+    @st.cache_data(ttl=3600)  # Cache for 1 hour
+    def get_reaction_table_ev(
+        _self,
+        snapshot_filters: tuple[tuple[str, Any], ...],
+        parquet_files_hash: str,
+    ) -> pd.DataFrame:
+        """
+        Get the reaction ΔG table in eV for a filter key. Cached based on filters and files.
+
+        G_eV datasets only fetch the materialised reaction rows; precomputed reaction
+        JSON still pairs its component rows in pandas.
+        """
+        filters = dict(snapshot_filters)
+        column_names = _self.get_column_names()
+        if "G_eV" not in column_names or "unique_name" not in column_names:
+            reaction_df = _self.get_filtered_data(
+                **filters,
+                columns=list(REACTION_TABLE_COLUMNS),
+            )
+            if reaction_df.empty:
+                return pd.DataFrame()
+            return calculate_reaction_table(reaction_df, energy_unit=ENERGY_UNIT_EV)
+
+        conn = DataManager.get_connection()
+        with _self.use_filter_snapshot(filters) as snapshot_table:
+            reaction_table = _self.get_reaction_gibbs_table(snapshot_table)
+            co2_rows = conn.execute(
+                f"SELECT count(*) FROM {snapshot_table} WHERE name_role = 'co2'"
+            ).fetchone()[0]
+            if not co2_rows:
+                raise ValueError("No CO2 entries found — cannot compute ΔG.")
+            delta = conn.execute(
+                f"SELECT * FROM {reaction_table} ORDER BY bipyridine, alkyne"
+            ).df()
+        delta["deltaG"] = delta["G_product"] - (delta["G_reactant"] + delta["G_CO2"])
+        delta["reaction_data_source"] = "computed_from_g_eV"
+        return delta
+
+    def get_reaction_table(
+        self,
+        filters: dict[str, Any] | None = None,
+        energy_unit: str = ENERGY_UNIT_KCAL,
+    ) -> pd.DataFrame:
+        """Get the reaction ΔG table for the filtered rows, as calculate_reaction_table does."""
+        if not self.parquet_files:
             return pd.DataFrame()
+        delta_df = self.get_reaction_table_ev(
+            self._normalize_snapshot_filters(filters),
+            self._get_parquet_files_hash(),
+        )
+        return convert_reaction_table(delta_df, energy_unit)
 
     @st.cache_data(ttl=3600)  # Cache for 1 hour
-    def get_unique_values(_self, column: str, parquet_files_hash: str) -> List[str]:
+    def get_unique_values(_self, column: str, parquet_files_hash: str) -> list[str]:
         """Get unique values for a column (for filter dropdowns). Cached based on column and files."""
         if not _self.parquet_files:
             return []
 
+        manifest = _self.get_manifest()
+        if manifest is not None and column in manifest["distinct_values"]:
+            return list(manifest["distinct_values"][column])
+
         conn = DataManager.get_connection()
-        parquet_paths = "', '".join(_self.parquet_files)
+        dataset_view = _self.get_dataset_view_name()
 
         query = f"""
         SELECT DISTINCT {column}
-        FROM read_parquet(['{parquet_paths}'])
+        FROM {dataset_view}
         WHERE {column} IS NOT NULL
         ORDER BY {column}
         """
 
         try:
-            result = conn.execute(query).df()
+            result = _self._execute_dataset_query(conn, query).df()
             return result[column].tolist()
         except Exception as e:
             st.warning(f"Error getting unique values for {column}: {e}")
             return []
 
-    def get_molecule_by_name(self, unique_name: str) -> Optional[pd.Series]:
-        """Get a single molecule by unique_name."""
+    def get_name_index(self) -> str:
+        """
+        Build the unique_name lookup table once per dataset and return its name.
+
+        The table maps each name to its file and row, sorted by name and backed
+        by an ART index, so a lookup touches a few index nodes instead of
+        scanning the name column of every file.
+        """
+        conn = DataManager.get_connection()
+        table_name = f"{NAME_INDEX_PREFIX}{self._get_parquet_files_hash()}"
+        exists = conn.execute(
+            "SELECT 1 FROM duckdb_tables() WHERE table_name = ?",
+            [table_name],
+        ).fetchone()
+
+        if not exists:
+            sources = " UNION ALL ".join(
+                f"""
+                SELECT
+                    CAST(unique_name AS VARCHAR) AS unique_name,
+                    {file_index} AS file_index,
+                    file_row_number
+                FROM read_parquet({sql_string_literal(path)}, file_row_number = true)
+                WHERE unique_name IS NOT NULL
+                """
+                for file_index, path in enumerate(self.parquet_files)
+            )
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table_name} AS
+                {sources}
+                ORDER BY unique_name, file_index, file_row_number
+                """
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table_name}_unique_name "
+                f"ON {table_name} (unique_name)"
+            )
+            self._remember_dataset_catalog(conn, self._get_parquet_files_hash())
+        return table_name
+
+    def _read_file_row(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        file_path: str,
+        file_row_number: int,
+    ) -> pd.Series | None:
+        """Read one row of one Parquet file; the row number filter prunes to its row group."""
+        query = f"""
+        SELECT * EXCLUDE (file_row_number)
+        FROM {data_file_source_sql(file_path, file_row_number=True)}
+        WHERE file_row_number = ?
+        """
+        result = conn.execute(query, [int(file_row_number)]).df()
+        if not result.empty:
+            return result.iloc[0]
+        return None
+
+    def get_molecule_by_name(self, unique_name: str) -> pd.Series | None:
+        """Get a single molecule by unique_name via the name index."""
         if not self.parquet_files:
             return None
 
         conn = DataManager.get_connection()
-        parquet_paths = "', '".join(self.parquet_files)
-
-        # Use parameterized query to prevent SQL injection
-        query = f"""
-        SELECT *
-        FROM read_parquet(['{parquet_paths}'])
-        WHERE unique_name = ?
-        LIMIT 1
-        """
 
         try:
-            result = conn.execute(query, [unique_name]).df()
-            if not result.empty:
-                return result.iloc[0]
-            return None
+            if self.json_sources:
+                # JSON queried in place has no name index yet; scan the files
+                result = conn.execute(
+                    f"""
+                    SELECT * EXCLUDE ({", ".join(SNAPSHOT_KEY_COLUMNS)})
+                    FROM {self._keyed_source_sql()}
+                    WHERE unique_name = ?
+                    ORDER BY iqc_file_index, file_row_number
+                    LIMIT 1
+                    """,
+                    [unique_name],
+                ).df()
+                return None if result.empty else result.iloc[0]
+
+            name_index = self.get_name_index()
+            # Use parameterized query to prevent SQL injection
+            location = conn.execute(
+                f"""
+                SELECT file_index, file_row_number
+                FROM {name_index}
+                WHERE unique_name = ?
+                ORDER BY file_index, file_row_number
+                LIMIT 1
+                """,
+                [unique_name],
+            ).fetchone()
+            if location is None:
+                return None
+
+            file_index, file_row_number = location
+            return self._read_file_row(conn, self.parquet_files[file_index], file_row_number)
         except Exception as e:
             st.error(f"Error fetching molecule: {e}")
             return None
 
-    def get_molecule_by_index(self, index: int) -> Optional[pd.Series]:
-        """Get a single molecule by row index."""
-        if not self.parquet_files:
-            return None
+    @st.cache_data(ttl=3600)  # Cache for 1 hour
+    def get_row_locator(_self, parquet_files_hash: str) -> pd.DataFrame:
+        """
+        Get the dataset position of every row group. Cached based on parquet files.
 
-        conn = DataManager.get_connection()
-        parquet_paths = "', '".join(self.parquet_files)
+        One row per (file, row group) in dataset order, with the group's first row
+        both in the dataset (``start_row``) and in its file (``file_start_row``).
+        Built from Parquet footers only, so no data pages are read.
+        """
+        columns = ["file_path", "row_group_id", "num_rows", "start_row", "file_start_row"]
+        if not _self.parquet_files or _self.json_sources:
+            return pd.DataFrame(columns=columns)
 
+        conn = DataManager.get_connection()
+        parquet_paths = ", ".join(sql_string_literal(path) for path in _self.parquet_files)
         query = f"""
-        SELECT *
-        FROM read_parquet(['{parquet_paths}'])
-        LIMIT 1 OFFSET {index}
+        SELECT file_name AS file_path, row_group_id, any_value(row_group_num_rows) AS num_rows
+        FROM parquet_metadata([{parquet_paths}])
+        GROUP BY file_name, row_group_id
         """
 
         try:
             result = conn.execute(query).df()
-            if not result.empty:
-                return result.iloc[0]
+            file_order = {path: order for order, path in enumerate(_self.parquet_files)}
+            result["file_order"] = result["file_path"].map(file_order)
+            result = result.sort_values(["file_order", "row_group_id"], ignore_index=True)
+            result["num_rows"] = result["num_rows"].astype("int64")
+            result["start_row"] = result["num_rows"].cumsum() - result["num_rows"]
+            result["file_start_row"] = (
+                result.groupby("file_order")["num_rows"].cumsum() - result["num_rows"]
+            )
+            return result[columns]
+        except duckdb.Error as e:
+            st.warning(f"Error building row locator: {e}")
+            return pd.DataFrame(columns=columns)
+
+    def get_molecule_by_index(self, index: int) -> pd.Series | None:
+        """Get a single molecule by row index, reading only the row group that holds it."""
+        if not self.parquet_files or index < 0:
             return None
+
+        conn = DataManager.get_connection()
+        locator = self.get_row_locator(self._get_parquet_files_hash())
+
+        try:
+            if locator.empty:
+                # Without footer metadata, fall back to scanning up to the offset
+                query = f"""
+                SELECT * EXCLUDE ({", ".join(SNAPSHOT_KEY_COLUMNS)})
+                FROM {self._keyed_source_sql()}
+                ORDER BY iqc_file_index, file_row_number
+                LIMIT 1 OFFSET {int(index)}
+                """
+                result = conn.execute(query).df()
+                if not result.empty:
+                    return result.iloc[0]
+                return None
+
+            group_position = int(np.searchsorted(locator["start_row"], index, side="right")) - 1
+            row_group = locator.iloc[group_position]
+            if index >= row_group["start_row"] + row_group["num_rows"]:
+                return None
+            return self._read_file_row(
+                conn,
+                row_group["file_path"],
+                row_group["file_start_row"] + index - row_group["start_row"],
+            )
         except Exception as e:
             st.error(f"Error fetching molecule by index: {e}")
             return None
 
+    @staticmethod
+    @st.cache_data(ttl=3600)
+    def get_parquet_file_summary(
+        file_path: str, file_size: int, file_mtime_ns: int
+    ) -> tuple[int, tuple[str, ...]]:
+        """Get one file's row count and column names. Cached per file, so adding files reuses it."""
+        if is_json_data_file(file_path) or read_reaction_store(file_path) is not None:
+            conn = DataManager.get_connection()
+            source = data_file_source_sql(file_path)
+            column_names = conn.execute(f"DESCRIBE SELECT * FROM {source}").df()["column_name"]
+            return conn.execute(f"SELECT count(*) FROM {source}").fetchone()[0], tuple(column_names)
+        try:
+            parquet_file = pq.ParquetFile(file_path)
+            return parquet_file.metadata.num_rows, tuple(parquet_file.schema_arrow.names)
+        except (pa.ArrowException, OSError):
+            parquet_df = pd.read_parquet(file_path)
+            return len(parquet_df), tuple(parquet_df.columns)
+
     @st.cache_data(ttl=3600)
     def get_parquet_file_summaries(_self, parquet_files_hash: str) -> pd.DataFrame:
         """Get row counts, column counts, and schema names for each loaded parquet file."""
@@ -664,16 +2774,10 @@ class DataManager:
             zip(_self.parquet_files, file_labels)
         ):
             try:
-                try:
-                    import pyarrow.parquet as pq
-
-                    parquet_file = pq.ParquetFile(file_path)
-                    row_count = parquet_file.metadata.num_rows
-                    column_names = tuple(parquet_file.schema_arrow.names)
-                except Exception:
-                    parquet_df = pd.read_parquet(file_path)
-                    row_count = len(parquet_df)
-                    column_names = tuple(parquet_df.columns)
+                stat = Path(file_path).stat()
+                row_count, column_names = DataManager.get_parquet_file_summary(
+                    file_path, stat.st_size, stat.st_mtime_ns
+                )
 
                 rows.append(
                     {
@@ -706,10 +2810,10 @@ class DataManager:
         _self,
         parquet_files_hash: str,
         key_column: str,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Load same-dimension parquet files and match rows by an initial-molecule key."""
         file_summaries = _self.get_parquet_file_summaries(parquet_files_hash)
-        result: Dict[str, Any] = {
+        result: dict[str, Any] = {
             "file_summaries": file_summaries,
             "matched_rows": pd.DataFrame(),
             "duplicate_summary": pd.DataFrame(),
@@ -733,7 +2837,18 @@ class DataManager:
         duplicate_rows = []
         for summary_row in file_summaries.sort_values("file_order").itertuples(index=False):
             try:
-                file_df = pd.read_parquet(summary_row.path).copy()
+                if is_json_data_file(summary_row.path) or read_reaction_store(summary_row.path):
+                    file_df = (
+                        DataManager.get_connection()
+                        .execute(
+                            f"SELECT * EXCLUDE (file_row_number) "
+                            f"FROM {data_file_source_sql(summary_row.path, file_row_number=True)} "
+                            f"ORDER BY file_row_number"
+                        )
+                        .df()
+                    )
+                else:
+                    file_df = pd.read_parquet(summary_row.path).copy()
             except Exception as e:
                 result["error"] = f"Unable to read {summary_row.file}: {e}"
                 return result
@@ -817,23 +2932,30 @@ class DataManager:
         return result
 
     @st.cache_data(ttl=3600)  # Cache for 1 hour
-    def get_all_molecule_names(_self, parquet_files_hash: str) -> List[str]:
+    def get_all_molecule_names(_self, parquet_files_hash: str) -> list[str]:
         """Get all unique molecule names for the selector. Cached based on parquet files."""
         if not _self.parquet_files:
             return []
 
+        if _self.get_manifest() is not None:
+            _, names_path = _self._manifest_paths()
+            try:
+                return pq.read_table(names_path).column("unique_name").to_pylist()
+            except (OSError, pa.ArrowException):
+                pass
+
         conn = DataManager.get_connection()
-        parquet_paths = "', '".join(_self.parquet_files)
+        dataset_view = _self.get_dataset_view_name()
 
         query = f"""
         SELECT DISTINCT unique_name
-        FROM read_parquet(['{parquet_paths}'])
+        FROM {dataset_view}
         WHERE unique_name IS NOT NULL
         ORDER BY unique_name
         """
 
         try:
-            result = conn.execute(query).df()
+            result = _self._execute_dataset_query(conn, query).df()
             return result["unique_name"].tolist()
         except Exception as e:
             st.warning(f"Error getting molecule names: {e}")
@@ -846,21 +2968,21 @@ class DataManager:
             return pd.DataFrame()
 
         conn = DataManager.get_connection()
-        parquet_paths = "', '".join(_self.parquet_files)
+        dataset_view = _self.get_dataset_view_name()
 
         # Use DESCRIBE to get column information
         query = f"""
-        DESCRIBE SELECT * FROM read_parquet(['{parquet_paths}'])
+        DESCRIBE SELECT * FROM {dataset_view}
         """
 
         try:
-            result = conn.execute(query).df()
+            result = _self._execute_dataset_query(conn, query).df()
             return result
         except Exception:
             # Fallback: try to get schema from a sample query
             try:
-                sample_query = f"SELECT * FROM read_parquet(['{parquet_paths}']) LIMIT 1"
-                sample_df = conn.execute(sample_query).df()
+                sample_query = f"SELECT * FROM {dataset_view} LIMIT 1"
+                sample_df = _self._execute_dataset_query(conn, sample_query).df()
                 if not sample_df.empty:
                     schema_df = pd.DataFrame(
                         {
@@ -879,58 +3001,27 @@ class DataManager:
 # ============================================================================
 
 
-def normalize_json_dataframe(json_df: pd.DataFrame) -> pd.DataFrame:
-    """Normalize supported JSON table layouts to dashboard-queryable rows."""
+def normalize_json_dataframe(json_df: pd.DataFrame, row_offset: int = 0) -> pd.DataFrame:
+    """Normalize supported JSON table layouts to dashboard-queryable rows.
+
+    ``row_offset`` is the file position of the first row when the JSON is
+    converted in batches, so generated names stay unique across batches.
+    """
     if json_df.empty:
         return json_df
 
     if is_reaction_json_dataframe(json_df):
-        return expand_reaction_json_dataframe(json_df)
+        return expand_reaction_json_dataframe(json_df, row_offset)
 
     return json_df.reset_index(drop=True)
 
 
 def is_reaction_json_dataframe(df: pd.DataFrame) -> bool:
     """Return True for reaction-level JSON containing paired geometries."""
-    required_columns = {
-        "ligand_pair",
-        "reactant_geometry",
-        "product_geometry",
-    }
-    return required_columns.issubset(df.columns)
-
-
-def sanitize_name_part(value: Any) -> str:
-    """Return a compact token suitable for generated unique_name values."""
-    if value is None:
-        return ""
-    try:
-        if pd.isna(value):
-            return ""
-    except (TypeError, ValueError):
-        pass
-
-    text = str(value).strip()
-    if not text:
-        return ""
-    text = re.sub(r"\s+", "-", text)
-    return re.sub(r"[^A-Za-z0-9+_.-]+", "-", text).strip("-")
-
-
-def get_optional_row_value(row: pd.Series, column: str) -> Any:
-    """Return a row value, or None when the column is missing/null."""
-    if column not in row.index:
-        return None
-    value = row[column]
-    try:
-        if pd.isna(value):
-            return None
-    except (TypeError, ValueError):
-        pass
-    return value
+    return set(REACTION_JSON_COLUMNS).issubset(df.columns)
 
 
-def count_xyz_atoms(xyz_string: Any) -> Optional[int]:
+def count_xyz_atoms(xyz_string: Any) -> int | None:
     """Return atom count from XYZ text when available."""
     if xyz_string is None:
         return None
@@ -947,88 +3038,53 @@ def count_xyz_atoms(xyz_string: Any) -> Optional[int]:
         return len(elements)
 
 
-def build_reaction_json_unique_name(row: pd.Series, role: str, row_index: Any) -> str:
-    """Build a parseable unique_name for one JSON reaction component."""
-    ligand_pair = sanitize_name_part(get_optional_row_value(row, "ligand_pair"))
-    if not ligand_pair:
-        ligand_pair = f"reaction-{row_index}"
-
-    config = sanitize_name_part(get_optional_row_value(row, f"{role}_configuration"))
-    stereo = sanitize_name_part(get_optional_row_value(row, "stereo_type"))
-    insertion = sanitize_name_part(get_optional_row_value(row, "insertion_type"))
-    suffix_parts = [part for part in (config, stereo, insertion, str(row_index)) if part]
-    suffix = "_".join(suffix_parts)
-    if suffix:
-        return f"{ligand_pair}_{role}_{suffix}"
-    return f"{ligand_pair}_{role}_{row_index}"
-
-
-def get_reaction_json_smiles(row: pd.Series, role: str) -> Optional[str]:
-    """Return a role-specific SMILES value if present in JSON data."""
-    candidate_columns = (
-        f"{role}_smiles",
-        f"{role}_initial_smiles",
-        f"{role}_opt_smiles",
-        "smiles",
-    )
-    for column in candidate_columns:
-        value = get_optional_row_value(row, column)
-        if value is not None:
-            return str(value)
-    return None
-
+REACTION_JSON_EXCLUDED_COLUMNS = (
+    "reactant_geometry",
+    "product_geometry",
+    "reactant_gibbs",
+    "product_gibbs",
+)
 
-def build_reaction_json_component_row(row: pd.Series, role: str, row_index: Any) -> dict:
-    """Build one molecule-like row from a reaction-level JSON row."""
-    geometry = get_optional_row_value(row, f"{role}_geometry")
-    if geometry is None:
-        geometry = ""
 
-    excluded_columns = {
-        "reactant_geometry",
-        "product_geometry",
-        "reactant_gibbs",
-        "product_gibbs",
-    }
-    component_row = {
-        column: value for column, value in row.to_dict().items() if column not in excluded_columns
-    }
-    component_row.update(
-        {
-            "unique_name": build_reaction_json_unique_name(row, role, row_index),
-            "reaction_role": role,
-            "source_json_row": row_index,
-            "initial_xyz": str(geometry),
-            "opt_xyz": str(geometry),
-            "number_of_atoms": count_xyz_atoms(geometry),
-            "source_gibbs": get_optional_row_value(row, f"{role}_gibbs"),
-            "formula": get_optional_row_value(row, "formula"),
-            "initial_smiles": "",
-            "opt_smiles": "",
-            "task": "reaction",
-            "calculator": "json",
-            "opt_converged": True,
-            "smiles_changed": False,
-            "number_of_imaginary": 0,
-        }
+def build_reaction_json_components(
+    json_df: pd.DataFrame, role: str, row_numbers: np.ndarray
+) -> pd.DataFrame:
+    """Build the molecule-like rows for one role of every reaction-level JSON row."""
+    geometry = optional_column(json_df, f"{role}_geometry").fillna("").astype(str)
+    number_of_atoms = xyz_atom_counts(geometry)
+    # Fall back to parsing the coordinates when the first line is not an atom count
+    unparsed = number_of_atoms.isna() & (geometry != "")
+    if unparsed.any():
+        number_of_atoms[unparsed] = geometry[unparsed].map(count_xyz_atoms)
+
+    smiles = role_smiles(json_df, role)
+    component_df = json_df.drop(columns=list(REACTION_JSON_EXCLUDED_COLUMNS), errors="ignore")
+    return component_df.assign(
+        unique_name=component_unique_names(json_df, role, row_numbers),
+        reaction_role=role,
+        source_json_row=row_numbers,
+        initial_xyz=geometry,
+        opt_xyz=geometry,
+        number_of_atoms=number_of_atoms,
+        source_gibbs=optional_column(json_df, f"{role}_gibbs"),
+        formula=optional_column(json_df, "formula"),
+        initial_smiles=smiles,
+        opt_smiles=smiles,
+        task="reaction",
+        calculator="json",
+        opt_converged=True,
+        smiles_changed=False,
+        number_of_imaginary=0,
     )
 
-    smiles = get_reaction_json_smiles(row, role)
-    if smiles is not None:
-        component_row["initial_smiles"] = smiles
-        component_row["opt_smiles"] = smiles
-
-    return component_row
-
 
-def expand_reaction_json_dataframe(json_df: pd.DataFrame) -> pd.DataFrame:
-    """Expand reaction-level JSON rows into reactant/product molecule rows."""
-    rows = []
-    for row_index, row in json_df.reset_index(drop=True).iterrows():
-        rows.append(build_reaction_json_component_row(row, "reactant", row_index))
-        rows.append(build_reaction_json_component_row(row, "product", row_index))
-
-    return pd.DataFrame(rows)
+def expand_reaction_json_dataframe(json_df: pd.DataFrame, row_offset: int = 0) -> pd.DataFrame:
+    """Expand reaction-level JSON rows into reactant/product molecule rows, column by column."""
+    json_df = json_df.reset_index(drop=True)
+    row_numbers = np.arange(row_offset, row_offset + len(json_df), dtype=np.int64)
+    return interleave_components(
+        [build_reaction_json_components(json_df, role, row_numbers) for role in REACTION_ROLES]
+    )
 
 
 # ============================================================================
@@ -1036,7 +3092,7 @@ def expand_reaction_json_dataframe(json_df: pd.DataFrame) -> pd.DataFrame:
 # ============================================================================
 
 
-def highlight_string_differences(str1: str, str2: str) -> Tuple[str, str]:
+def highlight_string_differences(str1: str, str2: str) -> tuple[str, str]:
     """
     Highlight differences between two strings using HTML markup.
     Returns two strings with differences highlighted in red.
@@ -1086,7 +3142,7 @@ def highlight_string_differences(str1: str, str2: str) -> Tuple[str, str]:
     return "".join(highlighted1_parts), "".join(highlighted2_parts)
 
 
-def normalize_vibrational_frequencies(frequencies) -> Optional[np.ndarray]:
+def normalize_vibrational_frequencies(frequencies) -> np.ndarray | None:
     """
     Normalize vibrational frequencies into a numeric 1D numpy array.
 
@@ -1122,7 +3178,7 @@ def normalize_vibrational_frequencies(frequencies) -> Optional[np.ndarray]:
     return freq_array
 
 
-def normalize_spectrum_intensities(intensities, expected_length: int) -> Optional[np.ndarray]:
+def normalize_spectrum_intensities(intensities, expected_length: int) -> np.ndarray | None:
     """
     Normalize spectrum intensities into a numeric 1D numpy array.
 
@@ -1158,7 +3214,7 @@ def normalize_spectrum_intensities(intensities, expected_length: int) -> Optiona
     return intensity_array
 
 
-def _clean_unit(unit) -> Optional[str]:
+def _clean_unit(unit) -> str | None:
     """Return a displayable unit string, or None when unavailable."""
     if unit is None:
         return None
@@ -1174,7 +3230,7 @@ def _clean_unit(unit) -> Optional[str]:
     return unit_text
 
 
-def _get_first_present(mapping, keys: Tuple[str, ...]):
+def _get_first_present(mapping, keys: tuple[str, ...]):
     """Return the first non-null value from a dict-like object."""
     for key in keys:
         value = mapping.get(key, None)
@@ -1191,9 +3247,9 @@ def _get_first_present(mapping, keys: Tuple[str, ...]):
 
 def sync_indexed_selection(
     session_state,
-    options: List[str],
+    options: list[str],
     selection_key: str,
-    index_key: Optional[str] = None,
+    index_key: str | None = None,
 ) -> int:
     """Keep a selectbox value and optional selected index aligned."""
     if not options:
@@ -1219,10 +3275,10 @@ def sync_indexed_selection(
 
 def move_indexed_selection(
     session_state,
-    options: List[str],
+    options: list[str],
     selection_key: str,
     step: int,
-    index_key: Optional[str] = None,
+    index_key: str | None = None,
 ) -> int:
     """Move a selectbox-backed selection by step and persist both value and index."""
     if not options:
@@ -1244,6 +3300,37 @@ def move_indexed_selection(
     return next_index
 
 
+def sync_keyset_page_cursors(
+    session_state,
+    cursor_key: str,
+    signature_key: str,
+    signature,
+) -> list[str | None]:
+    """Return the keyset cursor stack, restarting at the first page when inputs change."""
+    cursors = session_state.get(cursor_key)
+    if session_state.get(signature_key) != signature or not cursors:
+        cursors = [None]
+        session_state[cursor_key] = cursors
+        session_state[signature_key] = signature
+    return cursors
+
+
+def move_keyset_page(
+    session_state,
+    cursor_key: str,
+    step: int,
+    next_cursor: str | None = None,
+) -> list[str | None]:
+    """Push the next page cursor (step > 0) or pop back to the previous page."""
+    cursors = list(session_state.get(cursor_key) or [None])
+    if step > 0 and next_cursor is not None:
+        cursors.append(next_cursor)
+    elif step < 0 and len(cursors) > 1:
+        cursors.pop()
+    session_state[cursor_key] = cursors
+    return cursors
+
+
 def validate_energy_unit(energy_unit: str) -> str:
     """Validate and return a supported display energy unit."""
     if energy_unit not in ENERGY_UNITS:
@@ -1259,7 +3346,7 @@ def energy_conversion_factor(energy_unit: str) -> float:
     return 1.0
 
 
-def convert_energy_value(value, energy_unit: str) -> Optional[float]:
+def convert_energy_value(value, energy_unit: str) -> float | None:
     """Convert a scalar eV value to the selected display unit."""
     if value is None:
         return None
@@ -1339,11 +3426,11 @@ def build_all_data_table(molecule_data: pd.Series, energy_unit: str) -> pd.DataF
     return pd.DataFrame(rows, columns=["Field", "Value"])
 
 
-def make_unique_file_labels(file_paths: List[str]) -> List[str]:
+def make_unique_file_labels(file_paths: list[str]) -> list[str]:
     """Return stable, readable file labels for display."""
     names = [Path(file_path).name for file_path in file_paths]
     name_counts = pd.Series(names).value_counts().to_dict()
-    seen_counts: Dict[str, int] = {}
+    seen_counts: dict[str, int] = {}
     labels = []
 
     for name in names:
@@ -1377,7 +3464,7 @@ def parquet_files_have_same_schema(file_summaries: pd.DataFrame) -> bool:
     return all(tuple(column_names) == first_columns for column_names in file_summaries["column_names"])
 
 
-def get_available_comparison_key_columns(file_summaries: pd.DataFrame) -> List[str]:
+def get_available_comparison_key_columns(file_summaries: pd.DataFrame) -> list[str]:
     """Return candidate row-matching columns available in every loaded file."""
     if file_summaries.empty or "column_names" not in file_summaries.columns:
         return []
@@ -1389,7 +3476,7 @@ def get_available_comparison_key_columns(file_summaries: pd.DataFrame) -> List[s
     return [column for column in COMPARISON_KEY_CANDIDATES if column in common_columns]
 
 
-def get_default_comparison_key_column(available_columns: List[str]) -> Optional[str]:
+def get_default_comparison_key_column(available_columns: list[str]) -> str | None:
     """Choose the default comparison key from preferred initial-molecule columns."""
     for candidate in COMPARISON_KEY_CANDIDATES:
         if candidate in available_columns:
@@ -1397,7 +3484,7 @@ def get_default_comparison_key_column(available_columns: List[str]) -> Optional[
     return available_columns[0] if available_columns else None
 
 
-def normalize_xyz_comparison_key(xyz_string: str) -> Optional[str]:
+def normalize_xyz_comparison_key(xyz_string: str) -> str | None:
     """Normalize XYZ geometry text for exact initial-geometry comparisons."""
     parsed_xyz = parse_xyz_coordinates(xyz_string)
     if parsed_xyz is None:
@@ -1412,7 +3499,7 @@ def normalize_xyz_comparison_key(xyz_string: str) -> Optional[str]:
     return "\n".join(normalized_lines)
 
 
-def normalize_comparison_key(value, key_column: str) -> Optional[str]:
+def normalize_comparison_key(value, key_column: str) -> str | None:
     """Normalize an initial-molecule key value for matching rows across files."""
     if is_missing_scalar(value):
         return None
@@ -1493,7 +3580,7 @@ def build_comparison_match_options(matched_rows: pd.DataFrame) -> pd.DataFrame:
     )
 
 
-def get_comparison_numeric_columns(matched_rows: pd.DataFrame) -> List[str]:
+def get_comparison_numeric_columns(matched_rows: pd.DataFrame) -> list[str]:
     """Return original columns that can be compared numerically."""
     if matched_rows.empty:
         return []
@@ -1812,7 +3899,7 @@ def build_optimized_geometry_comparison(
     return result
 
 
-def extract_ir_spectrum_dataset(row: pd.Series) -> Optional[dict]:
+def extract_ir_spectrum_dataset(row: pd.Series) -> dict | None:
     """Extract paired IR spectrum arrays from a comparison row."""
     frequencies = normalize_vibrational_frequencies(row.get("spectrum_frequencies", None))
     if frequencies is None:
@@ -1835,7 +3922,7 @@ def extract_ir_spectrum_dataset(row: pd.Series) -> Optional[dict]:
     }
 
 
-def extract_vibrational_frequency_dataset(row: pd.Series) -> Optional[dict]:
+def extract_vibrational_frequency_dataset(row: pd.Series) -> dict | None:
     """Extract vibrational frequency arrays from a comparison row."""
     frequencies = normalize_vibrational_frequencies(
         _get_first_present(
@@ -1885,7 +3972,7 @@ def build_spectrum_summary_row(dataset: dict, data_type: str) -> dict:
 def create_comparison_spectrum_plot(
     matched_rows: pd.DataFrame,
     title: str,
-) -> Tuple[Optional[go.Figure], pd.DataFrame, str]:
+) -> tuple[go.Figure | None, pd.DataFrame, str]:
     """Create an overlay plot for IR spectra, or vibrational frequencies as fallback."""
     if matched_rows.empty:
         return None, pd.DataFrame(), "None"
@@ -1991,7 +4078,7 @@ def create_comparison_spectrum_plot(
     return None, pd.DataFrame(), "None"
 
 
-def normalize_element_symbol(raw_symbol: str) -> Optional[str]:
+def normalize_element_symbol(raw_symbol: str) -> str | None:
     """Normalize an XYZ atom symbol for display and radius lookup."""
     match = re.match(r"([A-Za-z]+)", str(raw_symbol).strip())
     if not match:
@@ -2000,7 +4087,7 @@ def normalize_element_symbol(raw_symbol: str) -> Optional[str]:
     return symbol[:1].upper() + symbol[1:].lower()
 
 
-def parse_xyz_coordinates(xyz_string: str) -> Optional[Tuple[List[str], np.ndarray]]:
+def parse_xyz_coordinates(xyz_string: str) -> tuple[list[str], np.ndarray] | None:
     """Parse XYZ text into element symbols and coordinates."""
     if not xyz_string or is_missing_scalar(xyz_string):
         return None
@@ -2043,7 +4130,7 @@ def parse_xyz_coordinates(xyz_string: str) -> Optional[Tuple[List[str], np.ndarr
     return elements, np.array(coordinates, dtype=float)
 
 
-def atom_label(elements: List[str], atom_index: int) -> str:
+def atom_label(elements: list[str], atom_index: int) -> str:
     """Return a compact atom label using element plus one-based atom index."""
     return f"{elements[atom_index]}{atom_index + 1}"
 
@@ -2051,7 +4138,7 @@ def atom_label(elements: List[str], atom_index: int) -> str:
 def align_coordinates(
     reference_coords: np.ndarray,
     mobile_coords: np.ndarray,
-    fit_indices: List[int],
+    fit_indices: list[int],
 ) -> np.ndarray:
     """Align mobile coordinates onto reference coordinates using Kabsch fitting."""
     if len(fit_indices) == 0:
@@ -2133,7 +4220,7 @@ def normalize_angle_delta(delta: float) -> float:
     return float(((delta + 180.0) % 360.0) - 180.0)
 
 
-def infer_bonds(elements: List[str], coords: np.ndarray) -> set[Tuple[int, int]]:
+def infer_bonds(elements: list[str], coords: np.ndarray) -> set[tuple[int, int]]:
     """Infer covalent bonds from interatomic distances and covalent radii."""
     bonds = set()
     for atom_i in range(len(elements)):
@@ -2146,7 +4233,7 @@ def infer_bonds(elements: List[str], coords: np.ndarray) -> set[Tuple[int, int]]
     return bonds
 
 
-def build_bond_adjacency(bonds: set[Tuple[int, int]], atom_count: int) -> List[set[int]]:
+def build_bond_adjacency(bonds: set[tuple[int, int]], atom_count: int) -> list[set[int]]:
     """Build adjacency sets from inferred bonds."""
     adjacency = [set() for _ in range(atom_count)]
     for atom_i, atom_j in bonds:
@@ -2155,7 +4242,7 @@ def build_bond_adjacency(bonds: set[Tuple[int, int]], atom_count: int) -> List[s
     return adjacency
 
 
-def find_angle_tuples(adjacency: List[set[int]]) -> List[Tuple[int, int, int]]:
+def find_angle_tuples(adjacency: list[set[int]]) -> list[tuple[int, int, int]]:
     """Find unique bonded angle tuples i-j-k."""
     angles = []
     for center_atom, neighbors in enumerate(adjacency):
@@ -2167,9 +4254,9 @@ def find_angle_tuples(adjacency: List[set[int]]) -> List[Tuple[int, int, int]]:
 
 
 def find_dihedral_tuples(
-    bonds: set[Tuple[int, int]],
-    adjacency: List[set[int]],
-) -> List[Tuple[int, int, int, int]]:
+    bonds: set[tuple[int, int]],
+    adjacency: list[set[int]],
+) -> list[tuple[int, int, int, int]]:
     """Find unique bonded dihedral tuples i-j-k-l."""
     dihedrals = []
     seen = set()
@@ -2188,7 +4275,7 @@ def find_dihedral_tuples(
     return dihedrals
 
 
-def rank_geometry_changes(rows: List[dict], delta_column: str, limit: int) -> pd.DataFrame:
+def rank_geometry_changes(rows: list[dict], delta_column: str, limit: int) -> pd.DataFrame:
     """Sort geometry changes by absolute delta and return the top rows."""
     if not rows:
         return pd.DataFrame()
@@ -2203,7 +4290,7 @@ def build_geometry_optimization_summary(
     molecule_data: pd.Series,
     energy_unit: str,
     limit: int = 5,
-) -> Optional[dict]:
+) -> dict | None:
     """Build geometry optimization summary data from initial and optimized XYZ structures."""
     initial_parsed = parse_xyz_coordinates(molecule_data.get("initial_xyz", None))
     optimized_parsed = parse_xyz_coordinates(molecule_data.get("opt_xyz", None))
@@ -2305,7 +4392,7 @@ def build_geometry_optimization_summary(
 # ============================================================================
 
 
-def get_descriptor_definition(descriptor_id: str) -> Optional[dict]:
+def get_descriptor_definition(descriptor_id: str) -> dict | None:
     """Return descriptor metadata by ID."""
     for descriptor in DESCRIPTOR_DEFINITIONS:
         if descriptor["id"] == descriptor_id:
@@ -2318,7 +4405,7 @@ def format_descriptor_unit(unit: str) -> str:
     return DESCRIPTOR_UNIT_LABELS.get(unit, unit)
 
 
-def get_preferred_xyz(row: pd.Series) -> Optional[str]:
+def get_preferred_xyz(row: pd.Series) -> str | None:
     """Return optimized XYZ when available, otherwise initial XYZ."""
     for column in ("opt_xyz", "initial_xyz"):
         value = row.get(column, None)
@@ -2337,13 +4424,13 @@ def get_preferred_smiles(row: pd.Series) -> str:
 
 
 def nearest_atom_indices(
-    elements: List[str],
+    elements: list[str],
     coords: np.ndarray,
     center_index: int,
     element_symbol: str,
     count: int = 1,
-    excluded_indices: Optional[set[int]] = None,
-) -> List[int]:
+    excluded_indices: set[int] | None = None,
+) -> list[int]:
     """Return atom indices for the nearest atoms of one element to a center atom."""
     excluded_indices = excluded_indices or set()
     candidates = []
@@ -2359,7 +4446,7 @@ def nearest_atom_indices(
     return [atom_index for _, atom_index in candidates[:count]]
 
 
-def oxygen_neighbor_count(elements: List[str], coords: np.ndarray, atom_index: int) -> int:
+def oxygen_neighbor_count(elements: list[str], coords: np.ndarray, atom_index: int) -> int:
     """Count oxygen atoms close enough to be bonded to a carbon-like atom."""
     return sum(
         1
@@ -2368,7 +4455,7 @@ def oxygen_neighbor_count(elements: List[str], coords: np.ndarray, atom_index: i
     )
 
 
-def build_cn_adjacency(elements: List[str], coords: np.ndarray) -> List[set[int]]:
+def build_cn_adjacency(elements: list[str], coords: np.ndarray) -> list[set[int]]:
     """Build a C/N covalent-neighbor graph for ligand plane detection."""
     adjacency = [set() for _ in elements]
     for atom_i, element_i in enumerate(elements):
@@ -2386,11 +4473,11 @@ def build_cn_adjacency(elements: List[str], coords: np.ndarray) -> List[set[int]
 
 
 def collect_bpy_plane_indices(
-    elements: List[str],
+    elements: list[str],
     coords: np.ndarray,
     ni_index: int,
-    donor_n_indices: List[int],
-) -> List[int]:
+    donor_n_indices: list[int],
+) -> list[int]:
     """
     Infer the bipyridine plane atoms from the two Ni-bound N donors.
 
@@ -2463,11 +4550,11 @@ def point_plane_distance(point: np.ndarray, plane_points: np.ndarray) -> float:
 
 
 def find_c_beta_index(
-    elements: List[str],
+    elements: list[str],
     coords: np.ndarray,
     ni_index: int,
-    bpy_plane_indices: List[int],
-) -> Optional[int]:
+    bpy_plane_indices: list[int],
+) -> int | None:
     """Infer C_beta as the nearest non-bpy carbon to Ni."""
     bpy_plane_set = set(bpy_plane_indices)
     candidates = []
@@ -2490,9 +4577,9 @@ def find_c_beta_index(
 
 
 def infer_descriptor_atoms(
-    elements: List[str],
+    elements: list[str],
     coords: np.ndarray,
-) -> Tuple[Dict[str, Any], Optional[str]]:
+) -> tuple[dict[str, Any], str | None]:
     """Infer descriptor atom roles from element-only XYZ coordinates."""
     ni_indices = [index for index, element in enumerate(elements) if element == "Ni"]
     if not ni_indices:
@@ -2525,7 +4612,7 @@ def infer_descriptor_atoms(
     )
 
 
-def descriptor_atom_summary(elements: List[str], atom_roles: Dict[str, Any]) -> str:
+def descriptor_atom_summary(elements: list[str], atom_roles: dict[str, Any]) -> str:
     """Format inferred atom-role labels for descriptor diagnostics."""
     labels = [
         f"Ni={atom_label(elements, atom_roles['ni'])}",
@@ -2568,7 +4655,7 @@ def build_descriptor_record(
     }
 
 
-def calculate_descriptor_records_for_row(row: pd.Series, descriptor: dict) -> List[dict]:
+def calculate_descriptor_records_for_row(row: pd.Series, descriptor: dict) -> list[dict]:
     """Calculate one descriptor definition for a molecule row."""
     xyz_string = get_preferred_xyz(row)
     if xyz_string is None:
@@ -2693,7 +4780,7 @@ def descriptor_keyword_text(row: pd.Series) -> str:
     return " ".join(parts).lower()
 
 
-def row_matches_descriptor_keywords(row: pd.Series, keywords: List[str]) -> bool:
+def row_matches_descriptor_keywords(row: pd.Series, keywords: list[str]) -> bool:
     """Return True when a row contains every selected descriptor keyword."""
     if not keywords:
         return True
@@ -2702,7 +4789,7 @@ def row_matches_descriptor_keywords(row: pd.Series, keywords: List[str]) -> bool
     return all(str(keyword).lower() in searchable_text for keyword in keywords)
 
 
-def extract_descriptor_keyword_options(df: pd.DataFrame, role: str) -> List[str]:
+def extract_descriptor_keyword_options(df: pd.DataFrame, role: str) -> list[str]:
     """Extract keyword options from parsed ligand names for a role."""
     if df.empty or "unique_name" not in df.columns:
         return []
@@ -2728,7 +4815,7 @@ def extract_descriptor_keyword_options(df: pd.DataFrame, role: str) -> List[str]
     return sorted(keywords, key=lambda keyword: keyword.lower())
 
 
-def descriptor_record_columns() -> List[str]:
+def descriptor_record_columns() -> list[str]:
     """Return the descriptor dataframe schema."""
     return [
         "descriptor_id",
@@ -2765,7 +4852,7 @@ def is_finite_descriptor_value(value) -> bool:
     return bool(np.isfinite(numeric_value))
 
 
-def normalize_descriptor_role(value) -> Optional[str]:
+def normalize_descriptor_role(value) -> str | None:
     """Normalize reactant/product role labels."""
     if is_missing_scalar(value):
         return None
@@ -2777,6 +4864,14 @@ def normalize_descriptor_role(value) -> Optional[str]:
     return None
 
 
+def normalize_descriptor_roles(values: pd.Series) -> pd.Series:
+    """Normalize a column of reactant/product role labels, as normalize_descriptor_role does."""
+    text = values.astype("string").str.strip().str.lower()
+    roles = pd.Series([None] * len(values), index=values.index, dtype=object)
+    roles = roles.mask(text.str.contains("product", regex=False).fillna(False), "product")
+    return roles.mask(text.str.contains("reactant", regex=False).fillna(False), "reactant")
+
+
 def normalize_insertion_type(value) -> str:
     """Normalize Type_I/Type_II labels for regioisomer pairing."""
     if is_missing_scalar(value):
@@ -2805,11 +4900,9 @@ def get_descriptor_pair_value(
 
 def infer_descriptor_pair_key(row: pd.Series) -> str:
     """Build a fallback pair key for non-JSON reactant/product rows."""
-    unique_name = str(row.get("unique_name", ""))
-    parsed_name = parse_unique_name(unique_name)
     key_parts = [
-        parsed_name.get("bipyridine"),
-        parsed_name.get("alkyne"),
+        row.get("name_bipyridine", None),
+        row.get("name_alkyne", None),
         row.get("ligand_pair", ""),
         row.get("stereo_type", ""),
         row.get("insertion_type", ""),
@@ -2819,10 +4912,10 @@ def infer_descriptor_pair_key(row: pd.Series) -> str:
 
 def build_descriptor_reaction_pairs(
     df: pd.DataFrame,
-    reactant_keywords: Optional[List[str]] = None,
-    product_keywords: Optional[List[str]] = None,
-    max_pairs: Optional[int] = None,
-) -> List[dict]:
+    reactant_keywords: list[str] | None = None,
+    product_keywords: list[str] | None = None,
+    max_pairs: int | None = None,
+) -> list[dict]:
     """Build paired reactant/product entries for descriptor_kit."""
     if df.empty or "unique_name" not in df.columns:
         return []
@@ -2830,12 +4923,12 @@ def build_descriptor_reaction_pairs(
     reactant_keywords = reactant_keywords or []
     product_keywords = product_keywords or []
     work = df.reset_index(drop=True).copy()
+    work = work.assign(**parsed_name_columns(work))
     work["_descriptor_order"] = np.arange(len(work))
-    work["_descriptor_role"] = work.apply(
-        lambda row: normalize_descriptor_role(row.get("reaction_role", None))
-        or parse_unique_name(str(row.get("unique_name", ""))).get("role"),
-        axis=1,
-    )
+    work["_descriptor_role"] = work["name_role"]
+    if "reaction_role" in work.columns:
+        reaction_roles = normalize_descriptor_roles(work["reaction_role"])
+        work["_descriptor_role"] = reaction_roles.where(reaction_roles.notna(), work["name_role"])
 
     if "source_json_row" in work.columns:
         work["_descriptor_pair_key"] = work["source_json_row"].astype(str)
@@ -2864,7 +4957,6 @@ def build_descriptor_reaction_pairs(
 
         reactant_name = str(reactant_row.get("unique_name", ""))
         product_name = str(product_row.get("unique_name", ""))
-        parsed_name = parse_unique_name(reactant_name)
         source_json_row = get_descriptor_pair_value(
             reactant_row,
             product_row,
@@ -2887,8 +4979,8 @@ def build_descriptor_reaction_pairs(
                 "stereo_type": stereo_type,
                 "insertion_type": insertion_type,
                 "insertion_type_normalized": normalize_insertion_type(insertion_type),
-                "bipyridine": parsed_name.get("bipyridine"),
-                "alkyne": parsed_name.get("alkyne"),
+                "bipyridine": reactant_row["name_bipyridine"],
+                "alkyne": reactant_row["name_alkyne"],
                 "reactant_row": reactant_row,
                 "product_row": product_row,
                 "reactant_xyz": reactant_xyz,
@@ -2912,7 +5004,7 @@ def build_descriptor_kit_record(
     xyz_string: str,
     variant: str,
     atom_summary: str,
-) -> Optional[dict]:
+) -> dict | None:
     """Build one descriptor_kit record for plotting and tables."""
     descriptor = get_descriptor_definition(descriptor_key)
     if descriptor is None:
@@ -2977,7 +5069,7 @@ def build_descriptor_value_options(
     return pd.DataFrame(options, columns=option_columns)
 
 
-def build_single_reaction_descriptor_records(pair_entry: dict) -> Tuple[List[dict], dict]:
+def build_single_reaction_descriptor_records(pair_entry: dict) -> tuple[list[dict], dict]:
     """Compute descriptor_kit single-reaction records for one paired row."""
     if kit_compute_descriptors is None:
         return [], {}
@@ -3026,7 +5118,7 @@ def build_single_reaction_descriptor_records(pair_entry: dict) -> Tuple[List[dic
     return records, descriptor_values
 
 
-def descriptor_tdelta_group_key(pair_entry: dict) -> Tuple[str, str]:
+def descriptor_tdelta_group_key(pair_entry: dict) -> tuple[str, str]:
     """Return grouping key for Type_I/Type_II regioisomer descriptor deltas."""
     ligand_pair = pair_entry.get("ligand_pair") or "|".join(
         str(value)
@@ -3036,12 +5128,12 @@ def descriptor_tdelta_group_key(pair_entry: dict) -> Tuple[str, str]:
     return str(ligand_pair), str(pair_entry.get("stereo_type", ""))
 
 
-def build_tdelta_descriptor_records(computed_pairs: List[dict]) -> List[dict]:
+def build_tdelta_descriptor_records(computed_pairs: list[dict]) -> list[dict]:
     """Build pair-level descriptor records from Type_I/Type_II descriptor results."""
     if kit_compute_tdelta is None:
         return []
 
-    grouped_pairs: Dict[Tuple[str, str], Dict[str, dict]] = {}
+    grouped_pairs: dict[tuple[str, str], dict[str, dict]] = {}
     for computed_pair in computed_pairs:
         insertion_type = computed_pair["pair_entry"].get("insertion_type_normalized")
         if insertion_type not in {"type_i", "type_ii"}:
@@ -3101,14 +5193,45 @@ def build_tdelta_descriptor_records(computed_pairs: List[dict]) -> List[dict]:
     return records
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
 def build_descriptor_dataframe(
     df: pd.DataFrame,
-    reactant_keywords: Optional[List[str]] = None,
-    product_keywords: Optional[List[str]] = None,
-    max_pairs: Optional[int] = None,
+    reactant_keywords: list[str] | None = None,
+    product_keywords: list[str] | None = None,
+    max_pairs: int | None = None,
+    dataset_key: str | None = None,
+) -> pd.DataFrame:
+    """
+    Calculate descriptor_kit records for paired reactant/product rows.
+
+    With a ``dataset_key`` identifying ``df`` the result is cached under that key;
+    without one it is recalculated on every call.
+    """
+    if dataset_key is None:
+        return calculate_descriptor_dataframe(df, reactant_keywords, product_keywords, max_pairs)
+    return cached_descriptor_dataframe(
+        df, dataset_key, reactant_keywords, product_keywords, max_pairs
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_descriptor_dataframe(
+    _df: pd.DataFrame,
+    dataset_key: str,
+    reactant_keywords: list[str] | None = None,
+    product_keywords: list[str] | None = None,
+    max_pairs: int | None = None,
+) -> pd.DataFrame:
+    """Cache calculate_descriptor_dataframe by dataset key; the rows are never hashed."""
+    return calculate_descriptor_dataframe(_df, reactant_keywords, product_keywords, max_pairs)
+
+
+def calculate_descriptor_dataframe(
+    df: pd.DataFrame,
+    reactant_keywords: list[str] | None = None,
+    product_keywords: list[str] | None = None,
+    max_pairs: int | None = None,
 ) -> pd.DataFrame:
-    """Calculate descriptor_kit records for paired reactant/product rows."""
+    """Calculate descriptor_kit records for paired reactant/product rows (uncached)."""
     columns = descriptor_record_columns()
     if not DESCRIPTOR_KIT_AVAILABLE or df.empty or "unique_name" not in df.columns:
         return pd.DataFrame(columns=columns)
@@ -3139,19 +5262,22 @@ def build_descriptor_dataframe(
     return pd.DataFrame(records, columns=columns)
 
 
-def descriptor_delta_record_columns() -> List[str]:
+def descriptor_delta_record_columns() -> list[str]:
     """Return descriptor records with reaction energy columns for scatter plots."""
     return descriptor_record_columns() + ["deltaG", "deltaG_unit"]
 
 
-def build_reaction_delta_lookup(
-    df: pd.DataFrame,
-    energy_unit: str,
-) -> Dict[str, Dict[Any, float]]:
-    """Build lookup maps for reaction ΔG values from the supported reaction table."""
-    lookup: Dict[str, Dict[Any, float]] = {"source_json_row": {}, "names": {}}
+def descriptor_source_columns() -> list[str]:
+    """Return the dataset columns read when building descriptor tables."""
+    descriptor_ids = [descriptor["id"] for descriptor in DESCRIPTOR_DEFINITIONS]
+    return list(DESCRIPTOR_SOURCE_COLUMNS) + descriptor_ids
+
+
+def build_reaction_delta_lookup(df: pd.DataFrame) -> dict[str, dict[Any, float]]:
+    """Build lookup maps for reaction ΔG values in eV from the supported reaction table."""
+    lookup: dict[str, dict[Any, float]] = {"source_json_row": {}, "names": {}}
     try:
-        delta_df = calculate_reaction_table(df, energy_unit=energy_unit)
+        delta_df = calculate_reaction_table(df, energy_unit=ENERGY_UNIT_EV)
     except Exception:
         return lookup
 
@@ -3176,14 +5302,12 @@ def build_reaction_delta_lookup(
     return lookup
 
 
-def get_minimum_co2_gibbs_ev(df: pd.DataFrame) -> Optional[float]:
+def get_minimum_co2_gibbs_ev(df: pd.DataFrame) -> float | None:
     """Return the lowest CO2 Gibbs energy for row-level ΔG calculations."""
     if df.empty or "G_eV" not in df.columns or "unique_name" not in df.columns:
         return None
 
-    roles = df["unique_name"].astype(str).apply(
-        lambda unique_name: parse_unique_name(unique_name).get("role")
-    )
+    roles = parsed_name_columns(df)["name_role"]
     co2_values = pd.to_numeric(df.loc[roles == "co2", "G_eV"], errors="coerce")
     co2_values = co2_values.dropna()
     if co2_values.empty:
@@ -3194,11 +5318,10 @@ def get_minimum_co2_gibbs_ev(df: pd.DataFrame) -> Optional[float]:
 
 def calculate_pair_delta_g(
     pair_entry: dict,
-    energy_unit: str,
-    delta_lookup: Dict[str, Dict[Any, float]],
-    co2_gibbs_ev: Optional[float],
-) -> Optional[float]:
-    """Return the ΔG value associated with one paired descriptor entry."""
+    delta_lookup: dict[str, dict[Any, float]],
+    co2_gibbs_ev: float | None,
+) -> float | None:
+    """Return the ΔG value in eV associated with one paired descriptor entry."""
     for row_key in ("reactant_row", "product_row"):
         row = pair_entry.get(row_key)
         if row is None or "reaction_gibbs_kcal" not in row:
@@ -3206,7 +5329,7 @@ def calculate_pair_delta_g(
 
         delta_g = convert_reaction_gibbs_kcal(
             row.get("reaction_gibbs_kcal", None),
-            energy_unit,
+            ENERGY_UNIT_EV,
         )
         if delta_g is not None and np.isfinite(delta_g):
             return float(delta_g)
@@ -3218,8 +5341,7 @@ def calculate_pair_delta_g(
             reactant_g = reactant_row.get("G_eV", None)
             product_g = product_row.get("G_eV", None)
             if not is_missing_scalar(reactant_g) and not is_missing_scalar(product_g):
-                delta_g_ev = float(product_g) - (float(reactant_g) + co2_gibbs_ev)
-                return float(delta_g_ev * energy_conversion_factor(energy_unit))
+                return float(product_g) - (float(reactant_g) + co2_gibbs_ev)
 
     source_json_row = pair_entry.get("source_json_row", None)
     if not is_missing_scalar(source_json_row):
@@ -3252,7 +5374,7 @@ def compute_selected_single_descriptor_value(
     descriptor_id: str,
     role: str,
     xyz_string: str,
-) -> Tuple[Optional[float], str]:
+) -> tuple[float | None, str]:
     """Compute one descriptor_kit value for one species geometry."""
     if kit_geometry is None or kit_topology is None:
         return None, "descriptor_kit geometry/topology modules are unavailable"
@@ -3282,7 +5404,7 @@ def get_precomputed_descriptor_value(
     pair_entry: dict,
     descriptor_id: str,
     role: str,
-) -> Tuple[bool, Optional[float]]:
+) -> tuple[bool, float | None]:
     """Return a precomputed descriptor value and whether its column is present."""
     row_key = "reactant_row" if role == "reactant" else "product_row"
     row = pair_entry.get(row_key)
@@ -3309,7 +5431,7 @@ def is_precomputed_descriptor_dataset(df: pd.DataFrame, descriptor_id: str) -> b
     return bool(df["descriptor_precomputed"].fillna(False).astype(bool).any())
 
 
-def descriptor_keyword_mask(df: pd.DataFrame, keywords: List[str]) -> pd.Series:
+def descriptor_keyword_mask(df: pd.DataFrame, keywords: list[str]) -> pd.Series:
     """Return a vectorized equivalent of row_matches_descriptor_keywords."""
     if not keywords:
         return pd.Series(True, index=df.index, dtype=bool)
@@ -3354,9 +5476,9 @@ def preferred_descriptor_series(
 
 def get_precomputed_component_rows(
     df: pd.DataFrame,
-    reactant_keywords: List[str],
-    product_keywords: List[str],
-) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    reactant_keywords: list[str],
+    product_keywords: list[str],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Return one eligible reactant and product row per source reaction."""
     work = df.reset_index(drop=True).copy()
     role = work["reaction_role"].astype("string").str.lower()
@@ -3390,31 +5512,20 @@ def get_precomputed_component_rows(
 
 def descriptor_name_metadata(
     reactants: pd.DataFrame,
-) -> Tuple[Dict[Any, str], Dict[Any, str]]:
+) -> tuple[dict[Any, str], dict[Any, str]]:
     """Return bipyridine and alkyne lookup maps keyed by source JSON row."""
-    parsed_names = reactants["unique_name"].astype(str).apply(parse_unique_name)
+    parsed_names = parsed_name_columns(reactants)
     source_ids = reactants["source_json_row"]
-    bipyridines = dict(
-        zip(
-            source_ids,
-            parsed_names.apply(lambda parsed: parsed.get("bipyridine")),
-        )
-    )
-    alkynes = dict(
-        zip(
-            source_ids,
-            parsed_names.apply(lambda parsed: parsed.get("alkyne")),
-        )
-    )
+    bipyridines = dict(zip(source_ids, parsed_names["name_bipyridine"]))
+    alkynes = dict(zip(source_ids, parsed_names["name_alkyne"]))
     return bipyridines, alkynes
 
 
 def build_precomputed_single_descriptor_dataframe(
     df: pd.DataFrame,
     descriptor: dict,
-    energy_unit: str,
-    reactant_keywords: List[str],
-    product_keywords: List[str],
+    reactant_keywords: list[str],
+    product_keywords: list[str],
 ) -> pd.DataFrame:
     """Build one single-species descriptor plot table without geometry calculations."""
     columns = descriptor_delta_record_columns()
@@ -3433,12 +5544,13 @@ def build_precomputed_single_descriptor_dataframe(
         selected_rows[descriptor["id"]],
         errors="coerce",
     )
-    delta_g = pd.to_numeric(
-        selected_rows["reaction_gibbs_kcal"],
-        errors="coerce",
+    delta_g = (
+        pd.to_numeric(
+            selected_rows["reaction_gibbs_kcal"],
+            errors="coerce",
+        )
+        / EV_TO_KCAL_MOL
     )
-    if energy_unit == ENERGY_UNIT_EV:
-        delta_g = delta_g / EV_TO_KCAL_MOL
 
     finite_mask = np.isfinite(descriptor_values) & np.isfinite(delta_g)
     selected_rows = selected_rows.loc[finite_mask].copy()
@@ -3506,7 +5618,7 @@ def build_precomputed_single_descriptor_dataframe(
                 pd.Series("", index=selected_rows.index),
             ),
             "deltaG": delta_g,
-            "deltaG_unit": energy_unit,
+            "deltaG_unit": ENERGY_UNIT_EV,
         },
         index=selected_rows.index,
     )
@@ -3516,9 +5628,8 @@ def build_precomputed_single_descriptor_dataframe(
 def build_precomputed_tdelta_descriptor_dataframe(
     df: pd.DataFrame,
     descriptor: dict,
-    energy_unit: str,
-    reactant_keywords: List[str],
-    product_keywords: List[str],
+    reactant_keywords: list[str],
+    product_keywords: list[str],
 ) -> pd.DataFrame:
     """Build a pair-descriptor plot table from stored Type-I descriptor deltas."""
     columns = descriptor_delta_record_columns()
@@ -3591,9 +5702,7 @@ def build_precomputed_tdelta_descriptor_dataframe(
         paired["reaction_gibbs_kcal_ii"],
         errors="coerce",
     )
-    delta_g = type_i_delta_g - type_ii_delta_g
-    if energy_unit == ENERGY_UNIT_EV:
-        delta_g = delta_g / EV_TO_KCAL_MOL
+    delta_g = (type_i_delta_g - type_ii_delta_g) / EV_TO_KCAL_MOL
 
     finite_mask = np.isfinite(descriptor_values) & np.isfinite(delta_g)
     paired = paired.loc[finite_mask].copy()
@@ -3647,7 +5756,7 @@ def build_precomputed_tdelta_descriptor_dataframe(
                 pd.Series("", index=paired.index),
             ),
             "deltaG": delta_g,
-            "deltaG_unit": energy_unit,
+            "deltaG_unit": ENERGY_UNIT_EV,
         },
         index=paired.index,
     )
@@ -3660,25 +5769,19 @@ def tdelta_source_product_descriptor(descriptor_id: str) -> str:
 
 
 def build_selected_single_descriptor_records(
-    pair_entries: List[dict],
+    pair_entries: list[dict],
     descriptor_id: str,
     role: str,
-    energy_unit: str,
-    delta_lookup: Dict[str, Dict[Any, float]],
-    co2_gibbs_ev: Optional[float],
-) -> List[dict]:
-    """Build records for one reactant or product descriptor across all pairs."""
+    delta_lookup: dict[str, dict[Any, float]],
+    co2_gibbs_ev: float | None,
+) -> list[dict]:
+    """Build records for one reactant or product descriptor across all pairs, ΔG in eV."""
     records = []
     row_key = "reactant_row" if role == "reactant" else "product_row"
     xyz_key = "reactant_xyz" if role == "reactant" else "product_xyz"
 
     for pair_entry in pair_entries:
-        delta_g = calculate_pair_delta_g(
-            pair_entry,
-            energy_unit,
-            delta_lookup,
-            co2_gibbs_ev,
-        )
+        delta_g = calculate_pair_delta_g(pair_entry, delta_lookup, co2_gibbs_ev)
         if not is_finite_descriptor_value(delta_g):
             continue
 
@@ -3711,36 +5814,30 @@ def build_selected_single_descriptor_records(
             continue
 
         record["deltaG"] = float(delta_g)
-        record["deltaG_unit"] = energy_unit
+        record["deltaG_unit"] = ENERGY_UNIT_EV
         records.append(record)
 
     return records
 
 
 def build_selected_tdelta_descriptor_records(
-    pair_entries: List[dict],
+    pair_entries: list[dict],
     descriptor_id: str,
-    energy_unit: str,
-    delta_lookup: Dict[str, Dict[Any, float]],
-    co2_gibbs_ev: Optional[float],
-) -> List[dict]:
-    """Build records for one Type_I - Type_II product descriptor delta."""
+    delta_lookup: dict[str, dict[Any, float]],
+    co2_gibbs_ev: float | None,
+) -> list[dict]:
+    """Build records for one Type_I - Type_II product descriptor delta, ΔG in eV."""
     source_descriptor_id = tdelta_source_product_descriptor(descriptor_id)
     if source_descriptor_id not in KIT_PRODUCT_FUNCTIONS:
         return []
 
-    grouped_pairs: Dict[Tuple[str, str], Dict[str, dict]] = {}
+    grouped_pairs: dict[tuple[str, str], dict[str, dict]] = {}
     for pair_entry in pair_entries:
         insertion_type = pair_entry.get("insertion_type_normalized")
         if insertion_type not in {"type_i", "type_ii"}:
             continue
 
-        delta_g = calculate_pair_delta_g(
-            pair_entry,
-            energy_unit,
-            delta_lookup,
-            co2_gibbs_ev,
-        )
+        delta_g = calculate_pair_delta_g(pair_entry, delta_lookup, co2_gibbs_ev)
         if not is_finite_descriptor_value(delta_g):
             continue
 
@@ -3823,21 +5920,37 @@ def build_selected_tdelta_descriptor_records(
             f"{type_ii['pair_entry'].get('product_name', '')}"
         )
         record["deltaG"] = type_i["deltaG"] - type_ii["deltaG"]
-        record["deltaG_unit"] = energy_unit
+        record["deltaG_unit"] = ENERGY_UNIT_EV
         records.append(record)
 
     return records
 
 
 @st.cache_data(ttl=3600, show_spinner=False)
-def build_selected_descriptor_dataframe(
+def cached_selected_descriptor_records_ev(
+    _df: pd.DataFrame,
+    dataset_key: str,
+    descriptor_id: str,
+    reactant_keywords: list[str] | None = None,
+    product_keywords: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Cache calculate_selected_descriptor_records_ev by dataset key; the rows are never hashed.
+
+    Keyed without an energy unit, so switching units reuses the descriptor values.
+    """
+    return calculate_selected_descriptor_records_ev(
+        _df, descriptor_id, reactant_keywords, product_keywords
+    )
+
+
+def calculate_selected_descriptor_records_ev(
     df: pd.DataFrame,
     descriptor_id: str,
-    energy_unit: str = ENERGY_UNIT_KCAL,
-    reactant_keywords: Optional[List[str]] = None,
-    product_keywords: Optional[List[str]] = None,
+    reactant_keywords: list[str] | None = None,
+    product_keywords: list[str] | None = None,
 ) -> pd.DataFrame:
-    """Calculate one descriptor across every applicable reaction pair."""
+    """Calculate one descriptor across every applicable reaction pair, with ΔG in eV."""
     columns = descriptor_delta_record_columns()
     if (
         not DESCRIPTOR_KIT_AVAILABLE
@@ -3855,7 +5968,6 @@ def build_selected_descriptor_dataframe(
             return build_precomputed_single_descriptor_dataframe(
                 df,
                 descriptor,
-                energy_unit,
                 reactant_keywords,
                 product_keywords,
             )
@@ -3863,7 +5975,6 @@ def build_selected_descriptor_dataframe(
             return build_precomputed_tdelta_descriptor_dataframe(
                 df,
                 descriptor,
-                energy_unit,
                 reactant_keywords,
                 product_keywords,
             )
@@ -3877,7 +5988,7 @@ def build_selected_descriptor_dataframe(
     if not pair_entries:
         return pd.DataFrame(columns=columns)
 
-    delta_lookup = build_reaction_delta_lookup(df, energy_unit)
+    delta_lookup = build_reaction_delta_lookup(df)
     co2_gibbs_ev = get_minimum_co2_gibbs_ev(df)
     role = descriptor_family_for_key(descriptor_id)
 
@@ -3886,7 +5997,6 @@ def build_selected_descriptor_dataframe(
             pair_entries,
             descriptor_id,
             role,
-            energy_unit,
             delta_lookup,
             co2_gibbs_ev,
         )
@@ -3894,7 +6004,6 @@ def build_selected_descriptor_dataframe(
         records = build_selected_tdelta_descriptor_records(
             pair_entries,
             descriptor_id,
-            energy_unit,
             delta_lookup,
             co2_gibbs_ev,
         )
@@ -3904,6 +6013,39 @@ def build_selected_descriptor_dataframe(
     return pd.DataFrame(records, columns=columns)
 
 
+def convert_descriptor_delta_g(records: pd.DataFrame, energy_unit: str) -> pd.DataFrame:
+    """Convert descriptor records' eV ΔG values to the selected display unit."""
+    records = records.copy()
+    records["deltaG"] = convert_energy_series(records["deltaG"], energy_unit)
+    records["deltaG_unit"] = energy_unit
+    return records
+
+
+def build_selected_descriptor_dataframe(
+    df: pd.DataFrame,
+    descriptor_id: str,
+    energy_unit: str = ENERGY_UNIT_KCAL,
+    reactant_keywords: list[str] | None = None,
+    product_keywords: list[str] | None = None,
+    dataset_key: str | None = None,
+) -> pd.DataFrame:
+    """
+    Calculate one descriptor across every applicable reaction pair.
+
+    With a ``dataset_key`` identifying ``df`` the eV records are cached under that
+    key; without one they are recalculated on every call.
+    """
+    if dataset_key is None:
+        records = calculate_selected_descriptor_records_ev(
+            df, descriptor_id, reactant_keywords, product_keywords
+        )
+    else:
+        records = cached_selected_descriptor_records_ev(
+            df, dataset_key, descriptor_id, reactant_keywords, product_keywords
+        )
+    return convert_descriptor_delta_g(records, energy_unit)
+
+
 def build_descriptor_hover_html(
     descriptor_records: pd.DataFrame,
     title: str,
@@ -4434,7 +6576,7 @@ def create_ir_spectrum_plot(
     title: str,
     frequency_units=None,
     intensity_units=None,
-) -> Optional[go.Figure]:
+) -> go.Figure | None:
     """
     Create an IR spectrum curve from paired spectrum frequency and intensity arrays.
 
@@ -4523,7 +6665,7 @@ def create_vibrational_stick_plot(
     intensities=None,
     frequency_units=None,
     intensity_units=None,
-) -> Optional[go.Figure]:
+) -> go.Figure | None:
     """
     Create a stick plot for vibrational frequencies.
 
@@ -4552,7 +6694,7 @@ def create_vibrational_stick_plot(
         heights: np.ndarray,
         name: str,
         color: str,
-    ) -> Optional[go.Scatter]:
+    ) -> go.Scatter | None:
         if len(values) == 0:
             return None
 
@@ -4637,7 +6779,7 @@ def create_vibrational_stick_plot(
     return fig
 
 
-def create_molecule_spectrum_plot(molecule_data, title: str) -> Optional[go.Figure]:
+def create_molecule_spectrum_plot(molecule_data, title: str) -> go.Figure | None:
     """
     Create the best available IR spectrum plot for a molecule row.
 
@@ -4804,6 +6946,52 @@ def parse_unique_name(unique_name: str) -> dict:
     return result
 
 
+def parse_unique_names(names: pd.Series) -> pd.DataFrame:
+    """
+    Parse unique_name values column-wise, as parse_unique_name does one at a time.
+
+    Returns the PARSED_NAME_COLUMNS; the conformer id is whatever follows the role
+    part. Fields that do not apply to a name are None.
+    """
+    text = pa.array(names.astype("string"), type=pa.string())
+    fields = pc.extract_regex(text, UNIQUE_NAME_FIELDS_PATTERN)
+    missing = pa.scalar(None, pa.string())
+    is_co2 = pc.fill_null(pc.starts_with(pc.utf8_lower(text), "co2"), False)
+    is_complex = pc.and_(pc.invert(is_co2), fields.is_valid())
+
+    def complex_field(name: str, prefix: str = "", condition: pa.Array | None = None):
+        values = pc.struct_field(fields, name)
+        if prefix:
+            values = pc.replace_substring(values, prefix, "")
+        return pc.if_else(is_complex if condition is None else condition, values, missing)
+
+    role_text = pc.utf8_lower(complex_field("role"))
+    role = pc.if_else(
+        pc.match_substring(role_text, "reactant"), pa.scalar("reactant"), missing
+    )
+    role = pc.if_else(pc.match_substring(role_text, "product"), pa.scalar("product"), role)
+    role = pc.if_else(is_co2, pa.scalar("co2"), role)
+    has_conformer = pc.and_(is_complex, pc.greater_equal(pc.count_substring(text, "_"), 3))
+    parsed = {
+        "name_role": role,
+        "name_bipyridine": complex_field("bipyridine", "bipy-"),
+        "name_alkyne": complex_field("alkyne", "-C2H2-"),
+        "name_conformer": complex_field("conformer", condition=has_conformer),
+    }
+    return pd.DataFrame(
+        {column: values.to_numpy(zero_copy_only=False) for column, values in parsed.items()},
+        index=names.index,
+        dtype=object,
+    )
+
+
+def parsed_name_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the parsed unique_name columns a snapshot stored, parsing them when absent."""
+    if all(column in df.columns for column in PARSED_NAME_COLUMNS):
+        return df[list(PARSED_NAME_COLUMNS)]
+    return parse_unique_names(df["unique_name"])
+
+
 def calculate_reaction_gibbs(
     df: pd.DataFrame,
     energy_unit: str = ENERGY_UNIT_KCAL,
@@ -4825,12 +7013,11 @@ def calculate_reaction_gibbs(
     # Reset index to ensure concat works correctly
     df = df.reset_index(drop=True)
 
-    # Parse unique_name to extract reaction information
-    parsed = df["unique_name"].apply(parse_unique_name)
-    parsed_df = pd.DataFrame(parsed.tolist())
-
-    # Concatenate parsed data with original data
-    df2 = pd.concat([df, parsed_df], axis=1)
+    # Reaction information parsed from unique_name, stored in the snapshot when loaded
+    parsed_df = parsed_name_columns(df)[list(PARSED_NAME_FIELDS)].rename(columns=PARSED_NAME_FIELDS)
+    df2 = pd.concat(
+        [df.drop(columns=list(PARSED_NAME_COLUMNS), errors="ignore"), parsed_df], axis=1
+    )
 
     # Isolate CO2 before grouping (since it has None for bipy/alkyne)
     df_co2 = df2[df2["role"] == "co2"]
@@ -4879,7 +7066,7 @@ def calculate_reaction_gibbs(
     return delta
 
 
-def convert_reaction_gibbs_kcal(value, energy_unit: str) -> Optional[float]:
+def convert_reaction_gibbs_kcal(value, energy_unit: str) -> float | None:
     """Convert a precomputed reaction Gibbs value from kcal/mol to display units."""
     if is_missing_scalar(value):
         return None
@@ -4901,7 +7088,7 @@ def first_non_missing_value(series: pd.Series):
 def build_precomputed_reaction_row(
     reaction_rows: pd.DataFrame,
     energy_unit: str,
-) -> Optional[dict]:
+) -> dict | None:
     """Build one reaction table row from JSON-derived reactant/product rows."""
     reaction_gibbs_kcal = first_non_missing_value(reaction_rows["reaction_gibbs_kcal"])
     delta_g = convert_reaction_gibbs_kcal(reaction_gibbs_kcal, energy_unit)
@@ -4951,6 +7138,7 @@ def calculate_precomputed_reaction_gibbs(
         return pd.DataFrame()
 
     work = df.reset_index(drop=True).copy()
+    work = work.assign(**parsed_name_columns(work))
     work["_source_order"] = np.arange(len(work))
     if "source_gibbs" not in work.columns:
         work["source_gibbs"] = np.nan
@@ -4975,7 +7163,7 @@ def calculate_precomputed_reaction_gibbs(
     reactant_rows = (
         work[role_series == "reactant"]
         .sort_values("_source_order", kind="stable")[
-            ["source_json_row", "unique_name", "source_gibbs"]
+            ["source_json_row", "unique_name", "source_gibbs", "name_bipyridine", "name_alkyne"]
         ]
         .drop_duplicates("source_json_row", keep="first")
         .rename(
@@ -5018,9 +7206,6 @@ def calculate_precomputed_reaction_gibbs(
         )
         delta = delta.merge(metadata, on="source_json_row", how="left", sort=False)
 
-    parsed_names = delta["unique_name_reactant"].astype(str).apply(parse_unique_name)
-    parsed_df = pd.DataFrame(parsed_names.tolist(), index=delta.index)
-
     if energy_unit == ENERGY_UNIT_EV:
         delta_g = delta["_reaction_gibbs_kcal_numeric"] / EV_TO_KCAL_MOL
     else:
@@ -5028,8 +7213,8 @@ def calculate_precomputed_reaction_gibbs(
 
     result = pd.DataFrame(
         {
-            "bipyridine": parsed_df.get("bipyridine"),
-            "alkyne": parsed_df.get("alkyne"),
+            "bipyridine": delta["name_bipyridine"],
+            "alkyne": delta["name_alkyne"],
             "G_reactant": delta["G_reactant"],
             "G_product": delta["G_product"],
             "G_CO2": np.nan,
@@ -5069,6 +7254,24 @@ def calculate_reaction_table(
     )
 
 
+def convert_reaction_table(delta_df: pd.DataFrame, energy_unit: str) -> pd.DataFrame:
+    """Convert a reaction table calculated in eV to the selected display unit."""
+    unit_factor = energy_conversion_factor(energy_unit)
+    delta_df = delta_df.copy()
+    if delta_df.empty:
+        return delta_df
+    if "reaction_gibbs_kcal" in delta_df.columns:
+        # Precomputed ΔG comes in kcal/mol; source Gibbs values are shown as given
+        delta_g = delta_df["reaction_gibbs_kcal"].astype(float)
+        delta_df["deltaG"] = delta_g / EV_TO_KCAL_MOL if energy_unit == ENERGY_UNIT_EV else delta_g
+        return delta_df
+
+    for column in ("G_reactant", "G_product", "G_CO2"):
+        delta_df[column] = delta_df[column] * unit_factor
+    delta_df["deltaG"] = delta_df["G_product"] - (delta_df["G_reactant"] + delta_df["G_CO2"])
+    return delta_df
+
+
 def format_optional_number(value, digits: int = 4) -> str:
     """Format a numeric value, or N/A when unavailable."""
     if is_missing_scalar(value):
@@ -5131,11 +7334,13 @@ def build_ligand_selector_df(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty or "unique_name" not in df.columns:
         return pd.DataFrame(columns=["unique_name", "bipyridine", "alkyne", "role"])
 
-    selector_df = df[["unique_name"]].dropna().drop_duplicates().reset_index(drop=True)
-    parsed = selector_df["unique_name"].apply(parse_unique_name)
-    parsed_df = pd.DataFrame(parsed.tolist())
-
-    selector_df = pd.concat([selector_df, parsed_df], axis=1)
+    parsed_df = parsed_name_columns(df)[list(PARSED_NAME_FIELDS)].rename(columns=PARSED_NAME_FIELDS)
+    selector_df = (
+        pd.concat([df[["unique_name"]], parsed_df], axis=1)
+        .dropna(subset=["unique_name"])
+        .drop_duplicates("unique_name")
+        .reset_index(drop=True)
+    )
     selector_df = selector_df.dropna(
         subset=["bipyridine", "alkyne", "role"]
     ).reset_index(drop=True)
@@ -5143,12 +7348,26 @@ def build_ligand_selector_df(df: pd.DataFrame) -> pd.DataFrame:
     return selector_df
 
 
+@st.fragment(run_every=DATA_WATCH_INTERVAL_SECONDS)
+def watch_data_paths(data_manager: DataManager) -> None:
+    """Poll the CLI data paths and rerun the app once files are added, changed or removed."""
+    dataset_hash = data_manager._get_parquet_files_hash()
+    new_paths = data_manager.refresh_data_paths()
+    if data_manager._get_parquet_files_hash() != dataset_hash:
+        st.session_state["cli_loaded_paths"] = data_manager.parquet_files
+        st.session_state.data_loaded = bool(data_manager.parquet_files)
+        if new_paths:
+            st.toast(f"Loaded {len(new_paths)} new or changed file(s)")
+        st.rerun()
+    st.caption(f"Last checked for new files at {time.strftime('%H:%M:%S')}")
+
+
 # ============================================================================
 # Main Streamlit App
 # ============================================================================
 
 
-def main(data_paths: Optional[List[str]] = None):
+def main(data_paths: list[str] | None = None):
     st.set_page_config(page_title="IQC Dashboard", page_icon="⚛️", layout="wide")
 
     st.title("⚛️ IQC Dashboard")
@@ -5190,11 +7409,16 @@ def main(data_paths: Optional[List[str]] = None):
 
     # Initialize session state
     if "data_manager" not in st.session_state:
-        temp_dir = tempfile.mkdtemp()
-        st.session_state.data_manager = DataManager(temp_dir)
+        try:
+            st.session_state.data_manager = DataManager(str(data_cache_dir()))
+        except OSError as e:
+            st.warning(f"Data cache unavailable ({e}); converted files will not be reused.")
+            st.session_state.data_manager = DataManager(tempfile.mkdtemp())
         st.session_state.data_loaded = False
 
     data_manager = st.session_state.data_manager
+    if data_manager.swap_converted_json_files() and st.session_state.get("cli_loaded_paths"):
+        st.session_state["cli_loaded_paths"] = data_manager.parquet_files
 
     if data_paths:
         if st.session_state.get("cli_data_paths") != data_paths:
@@ -5209,12 +7433,15 @@ def main(data_paths: Optional[List[str]] = None):
     # Sidebar
     # ========================================================================
     with st.sidebar:
+        for setting_error in DataManager.get_connection_pool().setting_errors:
+            st.warning(setting_error)
+
         st.header("📁 Data Management")
 
         # File Uploader
         uploaded_files = st.file_uploader(
             "Upload Parquet or JSON Files",
-            type=["parquet", "json"],
+            type=["parquet", "json", "ndjson", "jsonl"],
             accept_multiple_files=True,
             help="Upload IQC data in Parquet format or supported JSON table data",
         )
@@ -5234,6 +7461,21 @@ def main(data_paths: Optional[List[str]] = None):
                 for path in st.session_state["cli_loaded_paths"]:
                     st.write(path)
 
+        # The checkbox is only shown for paths given on the command line
+        if (
+            st.session_state.get("cli_data_paths")
+            and data_manager.data_paths
+            and st.checkbox(
+                "Watch for new files",
+                key="watch_data_paths",
+                help=(
+                    f"Check the data paths every {DATA_WATCH_INTERVAL_SECONDS} seconds and "
+                    "load added or changed files without a full reload."
+                ),
+            )
+        ):
+            watch_data_paths(data_manager)
+
         st.markdown("---")
 
         # Global Filters
@@ -5254,6 +7496,8 @@ def main(data_paths: Optional[List[str]] = None):
 
             # Reset filters button
             if st.button("🔄 Reset All Filters", width="stretch"):
+                st.session_state.filter_calculator = None
+                st.session_state.filter_task = None
                 st.session_state.filter_formula = None
                 st.session_state.filter_converged = None
                 st.session_state.filter_smiles_changed = None
@@ -5265,6 +7509,20 @@ def main(data_paths: Optional[List[str]] = None):
 
             # Get unique values for filters
             parquet_hash = data_manager._get_parquet_files_hash()
+            available_columns = data_manager.get_column_names()
+
+            # Calculator and task are often hive partition keys, so these prune files
+            for column, label in (("calculator", "Calculator"), ("task", "Task")):
+                selected_value = None
+                if column in available_columns:
+                    selected_value = st.selectbox(
+                        label,
+                        options=[None] + data_manager.get_unique_values(column, parquet_hash),
+                        format_func=lambda x: "All" if x is None else x,
+                        key=f"filter_{column}_select",
+                    )
+                st.session_state[f"filter_{column}"] = selected_value
+
             formulas = data_manager.get_unique_values("formula", parquet_hash)
 
             selected_formula = st.selectbox(
@@ -5314,31 +7572,77 @@ def main(data_paths: Optional[List[str]] = None):
             )
             st.session_state.filter_text = text_filter
 
+            if data_manager.json_sources:
+                st.caption(
+                    f"⏳ Querying {len(data_manager.json_sources)} JSON file(s) directly while "
+                    "Parquet copies are written; the text search index is available after that."
+                )
+            elif data_manager.has_search_index():
+                st.caption("⚡ Text search index in use for plain substring filters.")
+            elif st.button(
+                "⚡ Build Text Search Index",
+                width="stretch",
+                help=(
+                    "Write a trigram index next to each data file so plain substring "
+                    "filters read candidate rows instead of scanning every row."
+                ),
+            ):
+                with st.spinner("Building text search index..."):
+                    index_paths = data_manager.build_search_index()
+                if len(index_paths) == len(data_manager.parquet_files):
+                    st.rerun()
+
             st.markdown("---")
 
             # Molecule Selector
             st.header("🔬 Molecule Selector")
 
-            # Get filtered molecule names based on current filters
-            filtered_df = data_manager.get_filtered_data(
-                formula=st.session_state.get("filter_formula", None),
-                opt_converged=st.session_state.get("filter_converged", None),
-                smiles_changed=st.session_state.get("filter_smiles_changed", None),
-                number_of_imaginary_max=st.session_state.get("filter_max_imag", None),
-                text_filter=(
+            # One filter dict keys the shared snapshot that every tab reads
+            dataset_filters = {
+                "calculator": st.session_state.get("filter_calculator", None),
+                "task": st.session_state.get("filter_task", None),
+                "formula": st.session_state.get("filter_formula", None),
+                "opt_converged": st.session_state.get("filter_converged", None),
+                "smiles_changed": st.session_state.get("filter_smiles_changed", None),
+                "number_of_imaginary_max": st.session_state.get("filter_max_imag", None),
+                "text_filter": (
                     st.session_state.get("filter_text", "")
                     if st.session_state.get("filter_text", "")
                     else None
                 ),
-                limit=None,  # Get all for molecule selector
+            }
+            # Page through filtered molecule names in SQL instead of loading every name
+            molecule_filters = dataset_filters
+            molecule_search = st.text_input(
+                "Search Molecules",
+                key="molecule_search",
+                help="Case-insensitive substring match on unique_name",
+            ).strip()
+            has_filters = any(value is not None for value in dataset_filters.values())
+            if (
+                has_filters
+                and not molecule_search
+                and not data_manager.get_molecule_name_page(dataset_filters, page_size=1)[0]
+            ):
+                # Fall back to every molecule while the filters match nothing; the
+                # fallback is part of the page signature, so paging stays within it
+                molecule_filters = {}
+
+            page_cursors = sync_keyset_page_cursors(
+                st.session_state,
+                "molecule_page_cursors",
+                "molecule_page_signature",
+                (
+                    data_manager._get_parquet_files_hash(),
+                    tuple(sorted(molecule_filters.items())),
+                    molecule_search,
+                ),
+            )
+            molecule_names, has_more_molecules = data_manager.get_molecule_name_page(
+                molecule_filters,
+                molecule_search,
+                after=page_cursors[-1],
             )
-
-            if not filtered_df.empty and "unique_name" in filtered_df.columns:
-                molecule_names = sorted(filtered_df["unique_name"].unique().tolist())
-            else:
-                parquet_hash = data_manager._get_parquet_files_hash()
-                molecule_names = sorted(data_manager.get_all_molecule_names(parquet_hash))
-
             if molecule_names:
                 selected_molecule_index = sync_indexed_selection(
                     st.session_state,
@@ -5358,6 +7662,39 @@ def main(data_paths: Optional[List[str]] = None):
                 st.session_state["selected_molecule_index"] = molecule_names.index(
                     selected_molecule
                 )
+
+                if len(page_cursors) > 1 or has_more_molecules:
+
+                    def _molecule_page_prev():
+                        move_keyset_page(st.session_state, "molecule_page_cursors", -1)
+                        st.session_state["selected_molecule_index"] = 0
+
+                    def _molecule_page_next():
+                        move_keyset_page(
+                            st.session_state,
+                            "molecule_page_cursors",
+                            1,
+                            molecule_names[-1],
+                        )
+                        st.session_state["selected_molecule_index"] = 0
+
+                    page_col_prev, page_col_label, page_col_next = st.columns([1, 2, 1])
+                    with page_col_prev:
+                        st.button(
+                            "◀",
+                            key="molecule_page_prev",
+                            disabled=len(page_cursors) == 1,
+                            on_click=_molecule_page_prev,
+                        )
+                    with page_col_label:
+                        st.caption(f"Page {len(page_cursors)}")
+                    with page_col_next:
+                        st.button(
+                            "▶",
+                            key="molecule_page_next",
+                            disabled=not has_more_molecules,
+                            on_click=_molecule_page_next,
+                        )
             else:
                 selected_molecule = None
                 st.info("No molecules available. Please upload data files or adjust filters.")
@@ -5367,6 +7704,9 @@ def main(data_paths: Optional[List[str]] = None):
             selected_smiles_changed = None
             text_filter = ""
             selected_molecule = None
+            dataset_filters = {}
+            molecule_filters = {}
+            molecule_search = ""
 
     # ========================================================================
     # Main Content Area
@@ -5414,13 +7754,13 @@ def main(data_paths: Optional[List[str]] = None):
         single_calc_molecule_names = molecule_names if "molecule_names" in locals() else []
         use_ligand_selector_navigation = False
 
-        ligand_selector_df = build_ligand_selector_df(filtered_df)
+        ligand_pairs_df = data_manager.get_ligand_pairs(molecule_filters)
 
-        if not ligand_selector_df.empty:
+        if not ligand_pairs_df.empty:
             st.subheader("Select by Ligands")
 
             default_selection = parse_unique_name(selected_molecule) if selected_molecule else {}
-            available_bipyridines = sorted(ligand_selector_df["bipyridine"].unique())
+            available_bipyridines = sorted(ligand_pairs_df["bipyridine"].unique())
 
             default_bipy = default_selection.get("bipyridine")
             if st.session_state.get("single_calc_bipy_select") not in available_bipyridines:
@@ -5437,7 +7777,7 @@ def main(data_paths: Optional[List[str]] = None):
                 )
 
             available_alkynes = sorted(
-                ligand_selector_df[ligand_selector_df["bipyridine"] == selected_bipy]["alkyne"].unique()
+                ligand_pairs_df[ligand_pairs_df["bipyridine"] == selected_bipy]["alkyne"].unique()
             )
             default_alkyne = default_selection.get("alkyne")
             if st.session_state.get("single_calc_alkyl_select") not in available_alkynes:
@@ -5452,11 +7792,11 @@ def main(data_paths: Optional[List[str]] = None):
                     key="single_calc_alkyl_select",
                 )
 
-            matching_df = ligand_selector_df[
-                (ligand_selector_df["bipyridine"] == selected_bipy)
-                & (ligand_selector_df["alkyne"] == selected_alkyne)
-            ].sort_values("unique_name")
-            single_calc_molecule_names = matching_df["unique_name"].tolist()
+            single_calc_molecule_names = data_manager.get_ligand_molecule_names(
+                selected_bipy,
+                selected_alkyne,
+                molecule_filters,
+            )
 
             if single_calc_molecule_names:
                 if (
@@ -5714,6 +8054,7 @@ def main(data_paths: Optional[List[str]] = None):
                 if single_calc_molecule_names:
                     if use_ligand_selector_navigation:
                         current_index = single_calc_molecule_names.index(displayed_molecule)
+                        total_molecules = len(single_calc_molecule_names)
 
                         def _go_prev():
                             move_indexed_selection(
@@ -5731,25 +8072,40 @@ def main(data_paths: Optional[List[str]] = None):
                                 1,
                             )
                     else:
-                        current_index = st.session_state["selected_molecule_index"]
+                        # Sidebar names are paged, so step through the full sorted set in SQL.
+                        current_index = data_manager.count_molecule_names(
+                            molecule_filters,
+                            molecule_search,
+                            before=displayed_molecule,
+                        )
+                        total_molecules = data_manager.count_molecule_names(
+                            molecule_filters,
+                            molecule_search,
+                        )
 
-                        def _go_prev():
-                            move_indexed_selection(
-                                st.session_state,
-                                single_calc_molecule_names,
-                                "selected_molecule_select",
-                                -1,
-                                "selected_molecule_index",
+                        def _step_selected_molecule(step: int):
+                            target = data_manager.get_adjacent_molecule_name(
+                                displayed_molecule,
+                                step,
+                                molecule_filters,
+                                molecule_search,
                             )
+                            if target is None:
+                                return
+                            if target not in single_calc_molecule_names:
+                                move_keyset_page(
+                                    st.session_state,
+                                    "molecule_page_cursors",
+                                    step,
+                                    displayed_molecule,
+                                )
+                            st.session_state["selected_molecule_select"] = target
+
+                        def _go_prev():
+                            _step_selected_molecule(-1)
 
                         def _go_next():
-                            move_indexed_selection(
-                                st.session_state,
-                                single_calc_molecule_names,
-                                "selected_molecule_select",
-                                1,
-                                "selected_molecule_index",
-                            )
+                            _step_selected_molecule(1)
 
                     nav_col_left, nav_col_center, nav_col_right = st.columns([1, 2, 1])
                     with nav_col_left:
@@ -5762,13 +8118,13 @@ def main(data_paths: Optional[List[str]] = None):
                             st.rerun()
                     with nav_col_center:
                         st.write(
-                            f"{current_index + 1} of {len(single_calc_molecule_names)}",
+                            f"{current_index + 1} of {total_molecules}",
                         )
                     with nav_col_right:
                         if st.button(
                             "Next ➡️",
                             width="stretch",
-                            disabled=current_index == len(single_calc_molecule_names) - 1,
+                            disabled=current_index >= total_molecules - 1,
                             on_click=_go_next,
                         ):
                             st.rerun()
@@ -5793,21 +8149,18 @@ def main(data_paths: Optional[List[str]] = None):
     with tab2:
         # Get filtered data first (no limit - load all matching rows)
         with st.spinner("Loading filtered data..."):
-            df_full = data_manager.get_filtered_data(
-                formula=st.session_state.get("filter_formula", None),
-                opt_converged=st.session_state.get("filter_converged", None),
-                smiles_changed=st.session_state.get("filter_smiles_changed", None),
-                text_filter=(
-                    st.session_state.get("filter_text", "")
-                    if st.session_state.get("filter_text", "")
-                    else None
-                ),
+            # Keep the full result in Arrow; only the rows analysed become pandas
+            table_full = data_manager.get_filtered_data(
+                **dataset_filters,
                 limit=None,  # No limit - load all matching rows
+                columns=list(ANALYTICS_TEXT_COLUMNS)
+                + data_manager.get_column_names(numeric_only=True),
+                as_arrow=True,
             )
 
         # Dataset size selector slider
-        if not df_full.empty:
-            total_rows = len(df_full)
+        if table_full.num_rows:
+            total_rows = table_full.num_rows
             initial_rows = min(1000, total_rows)  # Initial value: 1000 or total if less
 
             selected_rows = st.slider(
@@ -5820,14 +8173,14 @@ def main(data_paths: Optional[List[str]] = None):
             )
 
             # Limit dataframe to selected number of rows
-            df = df_full.head(selected_rows)
+            df = arrow_table_to_pandas(table_full.slice(0, selected_rows))
 
             if selected_rows < total_rows:
                 st.info(
                     f"📊 Showing {selected_rows:,} of {total_rows:,} filtered rows. Adjust the slider to see more or fewer rows."
                 )
         else:
-            df = df_full
+            df = arrow_table_to_pandas(table_full)
 
         # Display Dataset Schema (always show full schema, not filtered) - collapsed by default
         with st.expander("📋 Dataset Schema", expanded=False):
@@ -6069,13 +8422,14 @@ def main(data_paths: Optional[List[str]] = None):
             st.info("Not enough numerical columns for correlation analysis.")
 
         st.subheader("IR Spectrum Analysis")
+        dataset_columns = set(data_manager.get_column_names())
         has_ir_spectrum = (
-            "spectrum_frequencies" in df.columns
-            and "spectrum_intensities" in df.columns
+            "spectrum_frequencies" in dataset_columns
+            and "spectrum_intensities" in dataset_columns
         )
         has_vibrational_frequencies = (
-            "vibrational_frequencies_cm^-1" in df.columns
-            or "frequencies_cm^-1" in df.columns
+            "vibrational_frequencies_cm^-1" in dataset_columns
+            or "frequencies_cm^-1" in dataset_columns
         )
         if has_ir_spectrum or has_vibrational_frequencies:
             # Get a sample molecule for frequency analysis
@@ -6086,11 +8440,16 @@ def main(data_paths: Optional[List[str]] = None):
             )
 
             if sample_molecule:
-                mol_data = df[df["unique_name"] == sample_molecule].iloc[0]
+                # Spectra are not part of the analytics projection; load one row on demand.
+                mol_data = data_manager.get_molecule_by_name(sample_molecule)
 
-                fig_vib = create_molecule_spectrum_plot(
-                    mol_data,
-                    f"IR Spectrum for {sample_molecule}",
+                fig_vib = (
+                    create_molecule_spectrum_plot(
+                        mol_data,
+                        f"IR Spectrum for {sample_molecule}",
+                    )
+                    if mol_data is not None
+                    else None
                 )
 
                 if fig_vib is not None:
@@ -6113,16 +8472,9 @@ def main(data_paths: Optional[List[str]] = None):
 
         with st.spinner("Loading data for descriptors..."):
             descriptor_source_df = data_manager.get_filtered_data(
-                formula=st.session_state.get("filter_formula", None),
-                opt_converged=st.session_state.get("filter_converged", None),
-                smiles_changed=st.session_state.get("filter_smiles_changed", None),
-                number_of_imaginary_max=st.session_state.get("filter_max_imag", None),
-                text_filter=(
-                    st.session_state.get("filter_text", "")
-                    if st.session_state.get("filter_text", "")
-                    else None
-                ),
+                **dataset_filters,
                 limit=None,
+                columns=descriptor_source_columns(),
             )
 
         if descriptor_source_df.empty:
@@ -6166,8 +8518,8 @@ def main(data_paths: Optional[List[str]] = None):
                 )
                 descriptor = get_descriptor_definition(selected_descriptor_id)
 
-                selected_reactant_keywords: List[str] = []
-                selected_product_keywords: List[str] = []
+                selected_reactant_keywords: list[str] = []
+                selected_product_keywords: list[str] = []
                 with st.expander("Optional keyword filters", expanded=False):
                     reactant_keyword_options = extract_descriptor_keyword_options(
                         descriptor_source_df,
@@ -6206,6 +8558,8 @@ def main(data_paths: Optional[List[str]] = None):
                             energy_unit=energy_unit,
                             reactant_keywords=selected_reactant_keywords,
                             product_keywords=selected_product_keywords,
+                            # Files hash and filters identify the rows without hashing them
+                            dataset_key=data_manager.get_filter_snapshot_name(dataset_filters),
                         )
 
                     if descriptor_records.empty:
@@ -6736,19 +9090,12 @@ def main(data_paths: Optional[List[str]] = None):
     with tab3:
         st.subheader("⚗️ Carboxylation Reaction ΔG Analysis")
 
-        # Load filtered data (same filters as analytics)
+        # Only check that the filters leave rows; reactions are computed in SQL below
         with st.spinner("Loading data for reactions..."):
             df_reac = data_manager.get_filtered_data(
-                formula=st.session_state.get("filter_formula", None),
-                opt_converged=st.session_state.get("filter_converged", None),
-                smiles_changed=st.session_state.get("filter_smiles_changed", None),
-                number_of_imaginary_max=st.session_state.get("filter_max_imag", None),
-                text_filter=(
-                    st.session_state.get("filter_text", "")
-                    if st.session_state.get("filter_text", "")
-                    else None
-                ),
-                limit=None,
+                **dataset_filters,
+                limit=1,
+                columns=list(REACTION_TABLE_COLUMNS),
             )
 
         if df_reac.empty:
@@ -6763,9 +9110,9 @@ def main(data_paths: Optional[List[str]] = None):
         st.markdown("---")
 
         try:
-            # Calculate reaction delta G values
+            # Lowest-G selection and the ΔG join run in DuckDB, over the same filters
             with st.spinner("Calculating reaction ΔG values..."):
-                delta_df = calculate_reaction_table(df_reac, energy_unit=energy_unit)
+                delta_df = data_manager.get_reaction_table(dataset_filters, energy_unit)
 
             if delta_df.empty:
                 st.warning("No complete reactions found.")
@@ -1,11 +1,26 @@
 """Command-line interface for IQC Dashboard."""
 
 import argparse
+import os
 import socket
 import subprocess
 import sys
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
+from collections.abc import Sequence
+
+from iqc_dashboard.config import (
+    CONFIG_ENV_VAR,
+    DUCKDB_POOL_OPTIONS,
+    DUCKDB_SETTINGS,
+    duckdb_env_var,
+    load_duckdb_config,
+)
+from iqc_dashboard.data_cache import (
+    CACHE_DIR_ENV_VAR,
+    CACHE_SIZE_LIMIT_ENV_VAR,
+    cache_size_limit,
+)
+from iqc_dashboard.json_stream import MEMORY_LIMIT_ENV_VAR, json_memory_limit
 
 
 DEFAULT_PORT = 8501
@@ -44,7 +59,18 @@ def _valid_port(value: str) -> int:
     return port
 
 
-def _parse_args(argv: Optional[Sequence[str]]) -> Tuple[argparse.Namespace, List[str]]:
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("value must be an integer") from exc
+
+    if number < 1:
+        raise argparse.ArgumentTypeError("value must be at least 1")
+    return number
+
+
+def _parse_args(argv: Sequence[str] | None) -> tuple[argparse.Namespace, list[str]]:
     parser = argparse.ArgumentParser(
         prog="iqc-dashboard",
         description="Run the IQC Dashboard Streamlit app.",
@@ -64,10 +90,94 @@ def _parse_args(argv: Optional[Sequence[str]]) -> Tuple[argparse.Namespace, List
         default="localhost",
         help="Host interface for Streamlit to bind to. Defaults to localhost.",
     )
+
+    duckdb_group = parser.add_argument_group(
+        "DuckDB resources",
+        "Override the [duckdb] table of --config and the IQC_DUCKDB_* environment variables.",
+    )
+    duckdb_group.add_argument(
+        "--config",
+        dest="config",
+        default=None,
+        help="TOML config file with a [duckdb] table.",
+    )
+    duckdb_group.add_argument(
+        "--duckdb-threads",
+        dest="threads",
+        type=_positive_int,
+        default=None,
+        help="Worker threads for DuckDB queries.",
+    )
+    duckdb_group.add_argument(
+        "--duckdb-memory-limit",
+        dest="memory_limit",
+        default=None,
+        help="DuckDB memory cap, e.g. 4GB. Larger operators spill to --duckdb-temp-directory.",
+    )
+    duckdb_group.add_argument(
+        "--duckdb-temp-directory",
+        dest="temp_directory",
+        default=None,
+        help="Directory DuckDB spills to when a query exceeds the memory limit.",
+    )
+    duckdb_group.add_argument(
+        "--duckdb-preserve-insertion-order",
+        dest="preserve_insertion_order",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Keep result row order; disabling it lets large sorts and joins use less memory.",
+    )
+    duckdb_group.add_argument(
+        "--duckdb-pool-size",
+        dest="pool_size",
+        type=_positive_int,
+        default=None,
+        help="Maximum number of concurrent DuckDB connections (one per session thread).",
+    )
+    parser.add_argument(
+        "--json-memory-limit",
+        dest="json_memory_limit",
+        default=None,
+        help="Memory budget for converting JSON data files in batches, e.g. 2GB. Defaults to 512MiB.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        default=None,
+        help="Directory shared by all sessions for uploads and converted JSON. "
+        "Defaults to ~/.cache/iqc_dashboard.",
+    )
+    parser.add_argument(
+        "--cache-size-limit",
+        dest="cache_size_limit",
+        default=None,
+        help="Size the cache is trimmed to, least recently used files first, e.g. 50GB. "
+        "Defaults to 10GiB.",
+    )
     return parser.parse_known_args(argv)
 
 
-def main(argv: Optional[Sequence[str]] = None) -> None:
+def _duckdb_environment(args: argparse.Namespace) -> dict[str, str]:
+    """Return the environment for the Streamlit process with resource flags applied."""
+    env = dict(os.environ)
+    if args.config:
+        env[CONFIG_ENV_VAR] = str(Path(args.config).expanduser().resolve())
+    for option in DUCKDB_SETTINGS + DUCKDB_POOL_OPTIONS:
+        value = getattr(args, option)
+        if isinstance(value, bool):
+            env[duckdb_env_var(option)] = str(value).lower()
+        elif value is not None:
+            env[duckdb_env_var(option)] = str(value)
+    if args.json_memory_limit is not None:
+        env[MEMORY_LIMIT_ENV_VAR] = args.json_memory_limit
+    if args.cache_dir is not None:
+        env[CACHE_DIR_ENV_VAR] = str(Path(args.cache_dir).expanduser().resolve())
+    if args.cache_size_limit is not None:
+        env[CACHE_SIZE_LIMIT_ENV_VAR] = args.cache_size_limit
+    return env
+
+
+def main(argv: Sequence[str] | None = None) -> None:
     """Run the Streamlit app."""
     args, streamlit_args = _parse_args(argv)
 
@@ -75,6 +185,12 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     app_file = package_dir / "app.py"
 
     try:
+        env = _duckdb_environment(args)
+        # Fail here rather than with a warning inside the running app
+        load_duckdb_config(env)
+        json_memory_limit(env.get(MEMORY_LIMIT_ENV_VAR))
+        cache_size_limit(env.get(CACHE_SIZE_LIMIT_ENV_VAR))
+
         port = args.port
         if port is None:
             port = _find_available_port(args.host)
@@ -99,8 +215,8 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
         ]
         command.extend(streamlit_args)
 
-        subprocess.run(command, check=True)
-    except RuntimeError as e:
+        subprocess.run(command, check=True, env=env)
+    except (RuntimeError, ValueError) as e:
         print(str(e), file=sys.stderr)
         sys.exit(1)
     except subprocess.CalledProcessError as e:
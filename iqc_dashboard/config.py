@@ -0,0 +1,93 @@
+"""DuckDB resource settings for the IQC Dashboard.
+
+Settings come from an optional TOML config file, overridden by ``IQC_DUCKDB_*``
+environment variables. The CLI forwards its flags as those environment
+variables, so the Streamlit process sees one merged configuration.
+
+Example config file::
+
+    [duckdb]
+    threads = 4
+    memory_limit = "8GB"
+    temp_directory = "/scratch/iqc_spill"
+    preserve_insertion_order = false
+    pool_size = 32
+"""
+
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+
+
+CONFIG_ENV_VAR = "IQC_DASHBOARD_CONFIG"
+DUCKDB_ENV_PREFIX = "IQC_DUCKDB_"
+# Options applied with SET when the shared DuckDB database is created.
+DUCKDB_SETTINGS = ("threads", "memory_limit", "temp_directory", "preserve_insertion_order")
+DUCKDB_POOL_OPTIONS = ("pool_size",)
+
+
+class InvalidConfig(ValueError):
+    """Raised when the config file or an IQC_DUCKDB_* variable holds an invalid value."""
+
+
+def duckdb_env_var(option: str) -> str:
+    """Return the environment variable name for a DuckDB option."""
+    return f"{DUCKDB_ENV_PREFIX}{option.upper()}"
+
+
+def read_config_file(config_path: str) -> dict[str, Any]:
+    """Read the ``[duckdb]`` table of a TOML config file."""
+    path = Path(config_path).expanduser()
+    try:
+        with path.open("rb") as config_file:
+            config = tomllib.load(config_file)
+    except OSError as e:
+        raise InvalidConfig(f"Cannot read config file {path}: {e}") from e
+    except tomllib.TOMLDecodeError as e:
+        raise InvalidConfig(f"Invalid TOML in config file {path}: {e}") from e
+
+    duckdb_config = config.get("duckdb", {})
+    if not isinstance(duckdb_config, dict):
+        raise InvalidConfig(f"[duckdb] in {path} must be a table")
+
+    known_options = DUCKDB_SETTINGS + DUCKDB_POOL_OPTIONS
+    unknown_options = sorted(set(duckdb_config) - set(known_options))
+    if unknown_options:
+        raise InvalidConfig(
+            f"Unknown [duckdb] option(s) in {path}: {', '.join(unknown_options)}. "
+            f"Expected one of: {', '.join(known_options)}"
+        )
+    return dict(duckdb_config)
+
+
+def load_duckdb_config(environ: Mapping[str, str] | None = None) -> dict[str, Any]:
+    """
+    Return the merged DuckDB options.
+
+    The config file named by ``IQC_DASHBOARD_CONFIG`` is read first; each
+    ``IQC_DUCKDB_<OPTION>`` environment variable then overrides its option.
+    Options that are set nowhere are left out so DuckDB keeps its defaults.
+    """
+    environ = os.environ if environ is None else environ
+    config_path = environ.get(CONFIG_ENV_VAR)
+    config = read_config_file(config_path) if config_path else {}
+
+    for option in DUCKDB_SETTINGS + DUCKDB_POOL_OPTIONS:
+        value = environ.get(duckdb_env_var(option))
+        if value not in (None, ""):
+            config[option] = value
+
+    if "pool_size" in config:
+        try:
+            config["pool_size"] = int(config["pool_size"])
+        except (TypeError, ValueError) as e:
+            raise InvalidConfig(f"pool_size must be an integer, got {config['pool_size']!r}") from e
+        if config["pool_size"] < 1:
+            raise InvalidConfig("pool_size must be at least 1")
+    return config
@@ -0,0 +1,132 @@
+"""Shared on-disk cache of uploaded and converted data for the IQC Dashboard.
+
+Every session stores uploads and JSON-to-Parquet conversions in one cache
+directory, so a file is converted once per content and converter version
+rather than once per browser session, and the results survive restarts. Each
+entry is a directory named by a content key; entries that have not been used
+recently are removed once the cache grows past its size limit.
+
+The directory defaults to ``$XDG_CACHE_HOME/iqc_dashboard`` (``~/.cache``
+when unset) and the limit to 10 GiB. Set them with the ``IQC_CACHE_DIR`` and
+``IQC_CACHE_SIZE_LIMIT`` environment variables (e.g. ``50GB``).
+"""
+
+import functools
+import hashlib
+import os
+import re
+import shutil
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from iqc_dashboard.json_stream import parse_memory_size
+
+CACHE_DIR_ENV_VAR = "IQC_CACHE_DIR"
+CACHE_SIZE_LIMIT_ENV_VAR = "IQC_CACHE_SIZE_LIMIT"
+DEFAULT_CACHE_SIZE_LIMIT = 10 * 1024**3
+CACHE_ENTRY_KEY_LENGTH = 16
+CACHE_ENTRY_PATTERN = re.compile(rf"[0-9a-f]{{{CACHE_ENTRY_KEY_LENGTH}}}")
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def data_cache_dir(cache_dir: str | Path | None = None) -> Path:
+    """Return the cache directory: the argument, else the environment, else the default."""
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if not cache_dir:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(cache_home) / "iqc_dashboard"
+    return Path(cache_dir).expanduser()
+
+
+def cache_size_limit(size_limit: str | int | None = None) -> int:
+    """Return the cache size limit: the argument, else the environment, else the default."""
+    if size_limit is None:
+        size_limit = os.environ.get(CACHE_SIZE_LIMIT_ENV_VAR) or DEFAULT_CACHE_SIZE_LIMIT
+    return parse_memory_size(size_limit)
+
+
+def cache_entry_key(*parts: str) -> str:
+    """Return the entry directory name for content identified by ``parts``."""
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:CACHE_ENTRY_KEY_LENGTH]
+
+
+@functools.lru_cache(maxsize=1024)
+def _file_content_digest(path: str, file_size: int, file_mtime_ns: int) -> str:
+    """Hash a file's bytes. Keyed by size and mtime, so unchanged files hash once."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as data_file:
+        for chunk in iter(functools.partial(data_file.read, HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def file_content_digest(path: str | Path) -> str:
+    """Return the SHA-256 of a file's contents."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _file_content_digest(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def cache_entry_of(cache_dir: Path, path: str | Path) -> Path | None:
+    """Return the cache entry directory holding ``path``, or None if it is not cached."""
+    try:
+        relative_path = Path(path).resolve().relative_to(cache_dir.resolve())
+    except ValueError:
+        return None
+    if len(relative_path.parts) < 2 or not CACHE_ENTRY_PATTERN.fullmatch(relative_path.parts[0]):
+        return None
+    return cache_dir / relative_path.parts[0]
+
+
+def touch_cache_entry(entry_dir: Path) -> None:
+    """Mark an entry as just used, which is the order eviction goes by."""
+    try:
+        os.utime(entry_dir)
+    except OSError:
+        pass
+
+
+def evict_cache_entries(
+    cache_dir: Path,
+    size_limit: int,
+    keep: Iterable[Path] = (),
+) -> list[Path]:
+    """
+    Remove least recently used entries until the cache fits in ``size_limit``.
+
+    Entries in ``keep`` and entries with a write in progress are never removed.
+    Returns the removed entry directories.
+    """
+    keep = {Path(entry_dir).resolve() for entry_dir in keep}
+    entries = []
+    total_size = 0
+    for entry_dir in cache_dir.iterdir():
+        if not (entry_dir.is_dir() and CACHE_ENTRY_PATTERN.fullmatch(entry_dir.name)):
+            continue
+        try:
+            files = [path for path in entry_dir.rglob("*") if path.is_file()]
+            entry_size = sum(path.stat().st_size for path in files)
+            last_used = entry_dir.stat().st_mtime
+        except OSError:
+            continue
+        total_size += entry_size
+        writing = any(path.name.endswith(".tmp") for path in files)
+        if not writing and entry_dir.resolve() not in keep:
+            entries.append((last_used, entry_size, entry_dir))
+
+    removed = []
+    for _, entry_size, entry_dir in sorted(entries, key=lambda entry: entry[0]):
+        if total_size <= size_limit:
+            break
+        # Rename first so no reader sees a half-deleted entry under its key
+        doomed_dir = entry_dir.with_name(f".{entry_dir.name}.{time.time_ns()}.evicted")
+        try:
+            entry_dir.rename(doomed_dir)
+        except OSError:
+            continue
+        shutil.rmtree(doomed_dir, ignore_errors=True)
+        total_size -= entry_size
+        removed.append(entry_dir)
+    return removed
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import json
 import os
+import uuid
+from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Callable, Iterable, Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from descriptor_kit import (
     DESCRIPTOR_KEYS,
@@ -17,7 +20,20 @@ from descriptor_kit import (
     compute_descriptors,
     compute_tdelta,
 )
-
+from iqc_dashboard.json_stream import iter_json_frames, write_json_parquet, write_parquet_frames
+from iqc_dashboard.reaction_rows import (
+    COMPONENT_COLUMNS,
+    REACTION_ROLES,
+    REACTION_STORE_METADATA_KEY,
+    ROLE_COLUMNS,
+    component_unique_names,
+    interleave_components,
+    optional_column,
+    reaction_store_metadata,
+    reaction_store_path,
+    role_smiles,
+    xyz_atom_counts,
+)
 
 PRECOMPUTE_VERSION = 1
 REQUIRED_REACTION_COLUMNS = {
@@ -27,26 +43,18 @@ REQUIRED_REACTION_COLUMNS = {
 }
 
 
-def read_reaction_json(json_path: Path) -> pd.DataFrame:
-    """Read a supported JSON table and validate its reaction geometry columns."""
-    try:
-        reaction_df = pd.read_json(json_path)
-    except ValueError:
-        with json_path.open(encoding="utf-8") as json_file:
-            json_data = json.load(json_file)
-
-        if isinstance(json_data, list):
-            reaction_df = pd.DataFrame(json_data)
-        elif isinstance(json_data, dict):
-            for key in ("data", "records", "rows"):
-                value = json_data.get(key)
-                if isinstance(value, list):
-                    reaction_df = pd.DataFrame(value)
-                    break
-            else:
-                reaction_df = pd.DataFrame.from_dict(json_data)
-        else:
-            raise ValueError("Unsupported JSON table structure.")
+def read_reaction_json(
+    json_path: Path,
+    memory_limit: str | int | None = None,
+) -> pd.DataFrame:
+    """Read a supported JSON table and validate its reaction geometry columns.
+
+    Record-oriented files are parsed in batches bounded by ``memory_limit`` (see
+    ``iqc_dashboard.json_stream``), but the batches are joined into one DataFrame,
+    so the whole table is held; ``write_precomputed_reaction_json`` streams instead.
+    """
+    frames = list(iter_json_frames(json_path, memory_limit))
+    reaction_df = pd.concat(frames) if frames else pd.DataFrame()
 
     missing_columns = REQUIRED_REACTION_COLUMNS.difference(reaction_df.columns)
     if missing_columns:
@@ -74,65 +82,6 @@ def normalize_insertion_type(value: object) -> str:
     return text
 
 
-def sanitize_name_part(value: object) -> str:
-    """Return a compact token suitable for a generated unique name."""
-    if value is None:
-        return ""
-    try:
-        if pd.isna(value):
-            return ""
-    except (TypeError, ValueError):
-        pass
-
-    import re
-
-    text = re.sub(r"\s+", "-", str(value).strip())
-    return re.sub(r"[^A-Za-z0-9+_.-]+", "-", text).strip("-")
-
-
-def build_component_unique_name(row: pd.Series, role: str, row_index: int) -> str:
-    """Build the same parseable component name used by the dashboard."""
-    ligand_pair = sanitize_name_part(row.get("ligand_pair")) or f"reaction-{row_index}"
-    config = sanitize_name_part(row.get(f"{role}_configuration"))
-    stereo = sanitize_name_part(row.get("stereo_type"))
-    insertion = sanitize_name_part(row.get("insertion_type"))
-    suffix_parts = [part for part in (config, stereo, insertion, str(row_index)) if part]
-    return f"{ligand_pair}_{role}_{'_'.join(suffix_parts)}"
-
-
-def count_xyz_atoms(xyz_string: object) -> Optional[int]:
-    """Return the XYZ atom count when its first line is valid."""
-    if xyz_string is None:
-        return None
-    lines = str(xyz_string).splitlines()
-    if not lines:
-        return None
-    try:
-        return int(lines[0].strip())
-    except ValueError:
-        return None
-
-
-def role_smiles(row: pd.Series, role: str) -> str:
-    """Return the first available role-specific SMILES string."""
-    for column in (
-        f"{role}_smiles",
-        f"{role}_initial_smiles",
-        f"{role}_opt_smiles",
-        "smiles",
-    ):
-        value = row.get(column)
-        if value is None:
-            continue
-        try:
-            if pd.isna(value):
-                continue
-        except (TypeError, ValueError):
-            pass
-        return str(value)
-    return ""
-
-
 def _compute_descriptor_row(geometry_pair: tuple[str, str]) -> tuple[dict, int, bool]:
     """Compute all single-reaction descriptors in a worker process."""
     reactant_xyz, product_xyz = geometry_pair
@@ -159,7 +108,7 @@ def compute_single_reaction_descriptors(
     reaction_df: pd.DataFrame,
     workers: int = 1,
     chunksize: int = 8,
-    progress: Optional[Callable[[int, int], None]] = None,
+    progress: Callable[[int, int], None] | None = None,
 ) -> tuple[pd.DataFrame, pd.Series, pd.Series]:
     """Compute all reac_*/prod_* columns while preserving input row order."""
     total = len(reaction_df)
@@ -200,14 +149,11 @@ def compute_single_reaction_descriptors(
     )
 
 
-def add_tdelta_descriptors(reaction_df: pd.DataFrame) -> pd.DataFrame:
-    """Add pair descriptors to the last Type-I row in each dashboard pair group."""
-    result = reaction_df.copy()
-    for descriptor_key in TDELTA_KEYS:
-        result[descriptor_key] = np.nan
-
-    grouped_rows: dict[tuple[str, str], dict[str, int]] = {}
-    for row_index, row in result.iterrows():
+def iter_pair_group_rows(
+    reaction_df: pd.DataFrame,
+) -> Iterator[tuple[tuple[str, str], str, object]]:
+    """Yield the pair group, insertion type and index of each Type-I/II row."""
+    for row_index, row in reaction_df.iterrows():
         insertion_type = normalize_insertion_type(row.get("insertion_type"))
         if insertion_type not in {"type_i", "type_ii"}:
             continue
@@ -215,6 +161,17 @@ def add_tdelta_descriptors(reaction_df: pd.DataFrame) -> pd.DataFrame:
             str(row.get("ligand_pair", "")),
             str(row.get("stereo_type", "")),
         )
+        yield group_key, insertion_type, row_index
+
+
+def add_tdelta_descriptors(reaction_df: pd.DataFrame) -> pd.DataFrame:
+    """Add pair descriptors to the last Type-I row in each dashboard pair group."""
+    result = reaction_df.copy()
+    for descriptor_key in TDELTA_KEYS:
+        result[descriptor_key] = np.nan
+
+    grouped_rows: dict[tuple[str, str], dict[str, int]] = {}
+    for group_key, insertion_type, row_index in iter_pair_group_rows(result):
         grouped_rows.setdefault(group_key, {})[insertion_type] = row_index
 
     for pair_group in grouped_rows.values():
@@ -232,60 +189,128 @@ def add_tdelta_descriptors(reaction_df: pd.DataFrame) -> pd.DataFrame:
     return result
 
 
-def expand_reactions_for_dashboard(reaction_df: pd.DataFrame) -> pd.DataFrame:
-    """Expand reaction rows into dashboard-compatible reactant/product rows."""
+def build_dashboard_components(reaction_df: pd.DataFrame, row_offset: int = 0) -> pd.DataFrame:
+    """
+    Return the per-component columns of the reactant/product rows, two per reaction.
+
+    Role geometries are left out since they repeat a reaction column, as is
+    ``formula`` when the reactions already carry it. Reactions are numbered from
+    ``row_offset``, their position in the source file.
+    """
+    reaction_df = reaction_df.reset_index(drop=True)
+    row_numbers = np.arange(row_offset, row_offset + len(reaction_df), dtype=np.int64)
     component_frames = []
-    for role, role_order in (("reactant", 0), ("product", 1)):
-        component_df = reaction_df.copy()
-        geometry_column = f"{role}_geometry"
-        component_df["reaction_role"] = role
-        component_df["source_json_row"] = np.arange(len(component_df), dtype=np.int64)
-        component_df["unique_name"] = [
-            build_component_unique_name(row, role, row_index)
-            for row_index, (_, row) in enumerate(component_df.iterrows())
-        ]
-        component_df["initial_xyz"] = component_df[geometry_column].astype(str)
-        component_df["opt_xyz"] = component_df[geometry_column].astype(str)
-        component_df["number_of_atoms"] = component_df[geometry_column].apply(
-            count_xyz_atoms
-        )
-        component_df["source_gibbs"] = component_df.get(
-            f"{role}_gibbs",
-            pd.Series(np.nan, index=component_df.index),
-        )
-        component_df["formula"] = component_df.get(
-            "formula",
-            pd.Series(None, index=component_df.index),
-        )
-        component_df["initial_smiles"] = [
-            role_smiles(row, role) for _, row in component_df.iterrows()
-        ]
-        component_df["opt_smiles"] = component_df["initial_smiles"]
-        component_df["task"] = "reaction"
-        component_df["calculator"] = "json"
-        component_df["opt_converged"] = True
-        component_df["smiles_changed"] = False
-        component_df["number_of_imaginary"] = 0
-        component_df["_component_order"] = (
-            component_df["source_json_row"] * 2 + role_order
+    for role in REACTION_ROLES:
+        geometry = reaction_df[f"{role}_geometry"].astype(str)
+        smiles = role_smiles(reaction_df, role)
+        component_df = pd.DataFrame(
+            {
+                "reaction_role": role,
+                "source_json_row": row_numbers,
+                "unique_name": component_unique_names(reaction_df, role, row_numbers),
+                "number_of_atoms": xyz_atom_counts(geometry),
+                "source_gibbs": reaction_df.get(
+                    f"{role}_gibbs",
+                    pd.Series(np.nan, index=reaction_df.index),
+                ),
+                "formula": optional_column(reaction_df, "formula"),
+                "initial_smiles": smiles,
+                "opt_smiles": smiles,
+                "task": "reaction",
+                "calculator": "json",
+                "opt_converged": True,
+                "smiles_changed": False,
+                "number_of_imaginary": 0,
+            },
+            index=reaction_df.index,
         )
+        if "formula" in reaction_df.columns:
+            component_df = component_df.drop(columns="formula")
         component_frames.append(component_df)
 
-    return (
-        pd.concat(component_frames, ignore_index=True)
-        .sort_values("_component_order", kind="stable")
-        .drop(columns="_component_order")
-        .reset_index(drop=True)
+    return interleave_components(component_frames)
+
+
+def dashboard_columns(reaction_df: pd.DataFrame) -> list[str]:
+    """Return the column order of expanded dashboard rows."""
+    reaction_columns = list(reaction_df.columns)
+    return reaction_columns + [
+        column for column in COMPONENT_COLUMNS if column not in reaction_columns
+    ]
+
+
+def expand_reactions_for_dashboard(reaction_df: pd.DataFrame, row_offset: int = 0) -> pd.DataFrame:
+    """Expand reaction rows into dashboard-compatible reactant/product rows."""
+    reaction_df = reaction_df.reset_index(drop=True)
+    components_df = build_dashboard_components(reaction_df, row_offset)
+    source_rows = components_df["source_json_row"].to_numpy() - row_offset
+    expanded_df = pd.concat(
+        [
+            reaction_df.drop(columns=list(components_df.columns), errors="ignore")
+            .take(source_rows)
+            .reset_index(drop=True),
+            components_df,
+        ],
+        axis=1,
     )
+    for column, template in ROLE_COLUMNS.items():
+        role_values = [
+            reaction_df[template.format(role=role)].astype(str) for role in REACTION_ROLES
+        ]
+        expanded_df[column] = interleave_components(
+            [values.to_frame(column) for values in role_values]
+        )[column]
+    return expanded_df[dashboard_columns(reaction_df)]
 
 
-def build_precomputed_descriptor_dataframe(
+def write_reaction_store(
+    reaction_df: pd.DataFrame,
+    output_path: Path,
+    compression: str | None = "zstd",
+) -> tuple[Path, Path]:
+    """
+    Write reaction rows as a normalized reaction store and return its two paths.
+
+    ``output_path`` gets the thin components table the dashboard loads; every
+    reaction column, descriptors and geometries included, is written once to the
+    ``.reactions.parquet`` file beside it instead of into both component rows.
+    """
+    reaction_df = reaction_df.reset_index(drop=True)
+    components_df = build_dashboard_components(reaction_df)
+    reactions_path = reaction_store_path(output_path)
+    reaction_columns = [
+        column for column in reaction_df.columns if column not in components_df.columns
+    ]
+    reactions_table = pa.Table.from_pandas(
+        reaction_df[reaction_columns].assign(
+            source_json_row=np.arange(len(reaction_df), dtype=np.int64)
+        ),
+        preserve_index=False,
+    )
+    pq.write_table(reactions_table, reactions_path, compression=compression)
+
+    store = reaction_store_metadata(
+        reaction_columns, dashboard_columns(reaction_df), reactions_path
+    )
+    components_table = pa.Table.from_pandas(components_df, preserve_index=False)
+    components_table = components_table.replace_schema_metadata(
+        {
+            **(components_table.schema.metadata or {}),
+            REACTION_STORE_METADATA_KEY: json.dumps(store).encode(),
+        }
+    )
+    # The components file is written last, so a store is never loaded half-written
+    pq.write_table(components_table, output_path, compression=compression)
+    return Path(output_path), reactions_path
+
+
+def add_single_reaction_descriptors(
     reaction_df: pd.DataFrame,
     workers: int = 1,
     chunksize: int = 8,
-    progress: Optional[Callable[[int, int], None]] = None,
+    progress: Callable[[int, int], None] | None = None,
 ) -> pd.DataFrame:
-    """Return dashboard-ready rows containing the source data and all descriptors."""
+    """Return the source reaction rows with the reac_*/prod_* descriptor columns added."""
     reaction_df = reaction_df.reset_index(drop=True).copy()
     missing_columns = REQUIRED_REACTION_COLUMNS.difference(reaction_df.columns)
     if missing_columns:
@@ -305,8 +330,163 @@ def build_precomputed_descriptor_dataframe(
     enriched_df["descriptor_precompute_version"] = PRECOMPUTE_VERSION
     enriched_df["descriptor_failure_count"] = failure_counts
     enriched_df["descriptor_identification_failed"] = identification_failures
-    enriched_df = add_tdelta_descriptors(enriched_df)
-    return expand_reactions_for_dashboard(enriched_df)
+    return enriched_df
+
+
+def build_precomputed_reaction_dataframe(
+    reaction_df: pd.DataFrame,
+    workers: int = 1,
+    chunksize: int = 8,
+    progress: Callable[[int, int], None] | None = None,
+) -> pd.DataFrame:
+    """Return the source reaction rows with all descriptor columns added."""
+    return add_tdelta_descriptors(
+        add_single_reaction_descriptors(
+            reaction_df,
+            workers=workers,
+            chunksize=chunksize,
+            progress=progress,
+        )
+    )
+
+
+def write_precomputed_reaction_json(
+    json_path: Path,
+    output_path: Path,
+    workers: int = 1,
+    chunksize: int = 8,
+    progress: Callable[[int, int], None] | None = None,
+    memory_limit: str | int | None = None,
+    compression: str | None = "zstd",
+    expanded: bool = False,
+) -> int:
+    """
+    Precompute descriptors for a reaction JSON file batch by batch and return its row count.
+
+    Writes the same reaction store as ``write_reaction_store`` (or, with
+    ``expanded``, the rows of ``expand_reactions_for_dashboard``) without holding
+    the table: batches bounded by ``memory_limit`` get their single-reaction
+    descriptors and go to a staging file beside the output, then are read back one
+    row group at a time to add pair descriptors and write the outputs. Only the
+    descriptor values of the latest Type-I/II row of each pair group are kept
+    between batches. ``progress`` is called with the reactions computed and the
+    reactions read so far.
+    """
+    output_path = Path(output_path)
+    staging_path = output_path.with_name(f"{output_path.name}.{uuid.uuid4().hex[:8]}.staging.tmp")
+    pair_groups: dict[tuple[str, str], dict[str, tuple[int, dict]]] = {}
+    computed = 0
+
+    def precompute_batch(reaction_df: pd.DataFrame, row_offset: int) -> pd.DataFrame:
+        nonlocal computed
+
+        def report(completed: int, total: int) -> None:
+            if progress is not None:
+                progress(computed + completed, computed + total)
+
+        enriched_df = add_single_reaction_descriptors(
+            reaction_df, workers=workers, chunksize=chunksize, progress=report
+        )
+        computed += len(enriched_df)
+        for group_key, insertion_type, row_index in iter_pair_group_rows(enriched_df):
+            pair_groups.setdefault(group_key, {})[insertion_type] = (
+                row_offset + row_index,
+                enriched_df.loc[row_index, DESCRIPTOR_KEYS].to_dict(),
+            )
+        return enriched_df
+
+    try:
+        row_count = write_json_parquet(
+            json_path,
+            staging_path,
+            transform=precompute_batch,
+            memory_limit=memory_limit,
+            compression=compression,
+        )
+        if not row_count:
+            raise ValueError(f"Reaction JSON has no reaction rows: {json_path}")
+
+        tdelta_rows = {}
+        for pair_group in pair_groups.values():
+            if "type_i" in pair_group and "type_ii" in pair_group:
+                type_i_row, type_i_values = pair_group["type_i"]
+                tdelta_rows[type_i_row] = compute_tdelta(type_i_values, pair_group["type_ii"][1])
+        pair_groups.clear()
+
+        staging_file = pq.ParquetFile(staging_path)
+        staged_columns = staging_file.schema_arrow.names
+
+        def iter_batches() -> Iterator[tuple[pd.DataFrame, int]]:
+            row_offset = 0
+            for row_group in range(staging_file.num_row_groups):
+                reaction_df = staging_file.read_row_group(row_group).to_pandas()
+                for descriptor_key in TDELTA_KEYS:
+                    reaction_df[descriptor_key] = np.nan
+                for row_number in range(row_offset, row_offset + len(reaction_df)):
+                    for descriptor_key, value in tdelta_rows.get(row_number, {}).items():
+                        reaction_df.at[row_number - row_offset, descriptor_key] = value
+                yield reaction_df, row_offset
+                row_offset += len(reaction_df)
+
+        if expanded:
+            write_parquet_frames(
+                (
+                    expand_reactions_for_dashboard(reaction_df, row_offset)
+                    for reaction_df, row_offset in iter_batches()
+                ),
+                output_path,
+                compression=compression,
+            )
+            return row_count
+
+        reactions_path = reaction_store_path(output_path)
+        all_columns = staged_columns + [key for key in TDELTA_KEYS if key not in staged_columns]
+        reaction_columns = [column for column in all_columns if column not in COMPONENT_COLUMNS]
+        write_parquet_frames(
+            (
+                reaction_df[reaction_columns].assign(
+                    source_json_row=np.arange(
+                        row_offset, row_offset + len(reaction_df), dtype=np.int64
+                    )
+                )
+                for reaction_df, row_offset in iter_batches()
+            ),
+            reactions_path,
+            compression=compression,
+        )
+        store = reaction_store_metadata(
+            reaction_columns, dashboard_columns(pd.DataFrame(columns=all_columns)), reactions_path
+        )
+        # The components file is written last, so a store is never loaded half-written
+        write_parquet_frames(
+            (
+                build_dashboard_components(reaction_df, row_offset)
+                for reaction_df, row_offset in iter_batches()
+            ),
+            output_path,
+            compression=compression,
+            metadata={REACTION_STORE_METADATA_KEY: json.dumps(store).encode()},
+        )
+        return row_count
+    finally:
+        staging_path.unlink(missing_ok=True)
+
+
+def build_precomputed_descriptor_dataframe(
+    reaction_df: pd.DataFrame,
+    workers: int = 1,
+    chunksize: int = 8,
+    progress: Callable[[int, int], None] | None = None,
+) -> pd.DataFrame:
+    """Return dashboard-ready rows containing the source data and all descriptors."""
+    return expand_reactions_for_dashboard(
+        build_precomputed_reaction_dataframe(
+            reaction_df,
+            workers=workers,
+            chunksize=chunksize,
+            progress=progress,
+        )
+    )
 
 
 def default_worker_count() -> int:
@@ -0,0 +1,425 @@
+"""Bounded-memory reading of JSON tables for the IQC Dashboard.
+
+Record-oriented JSON (a top-level list of objects, such a list under a
+``data``, ``records`` or ``rows`` key, or newline-delimited objects) is parsed
+incrementally and handed on in batches whose source text fits a memory budget,
+so multi-GB exports convert to Parquet one row group at a time. Other layouts,
+such as pandas' default column-oriented ``to_json`` output, cannot be split by
+row and are read whole.
+
+The budget defaults to 512 MiB and can be set with the ``IQC_JSON_MEMORY_LIMIT``
+environment variable (e.g. ``2GB``) or per call. Malformed files raise
+InvalidJSONTable, a ValueError like the decoder's own errors, naming the offset
+and nearby text of the problem rather than reading on to the end of the file.
+"""
+
+import json
+import os
+import re
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+MEMORY_LIMIT_ENV_VAR = "IQC_JSON_MEMORY_LIMIT"
+DEFAULT_MEMORY_LIMIT = 512 * 1024 * 1024
+# Parsed records, their DataFrame and Arrow copies take a few times the source text
+MEMORY_OVERHEAD_FACTOR = 4
+READ_CHUNK_SIZE = 1024 * 1024
+RECORD_LIST_KEYS = ("data", "records", "rows")
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+JSON_LAYOUT_ARRAY = "array"
+JSON_LAYOUT_NDJSON = "ndjson"
+JSON_LAYOUT_OBJECT = "object"
+MEMORY_UNITS = {
+    "": 1,
+    "B": 1,
+    "KB": 1000,
+    "MB": 1000**2,
+    "GB": 1000**3,
+    "TB": 1000**4,
+    "KIB": 1024,
+    "MIB": 1024**2,
+    "GIB": 1024**3,
+    "TIB": 1024**4,
+}
+JSON_WHITESPACE = " \t\r\n"
+# A decode error this close to the end of the buffer may be a value cut off by it
+DECODE_LOOKAHEAD = 16
+ERROR_CONTEXT_CHARS = 40
+
+
+class UnsupportedJSONLayout(ValueError):
+    """Raised when a JSON document is not a list of records that can be streamed."""
+
+
+class InvalidJSONTable(ValueError):
+    """Raised when a record-oriented JSON file is malformed or holds a non-object record."""
+
+
+def parse_memory_size(value: str | int) -> int:
+    """Return a byte count for sizes such as ``536870912``, ``512MB`` or ``2GiB``."""
+    if isinstance(value, int):
+        size = value
+    else:
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([A-Za-z]*)\s*", str(value))
+        if match is None or match.group(2).upper() not in MEMORY_UNITS:
+            raise ValueError(f"Invalid memory size: {value!r}")
+        size = int(float(match.group(1)) * MEMORY_UNITS[match.group(2).upper()])
+    if size < 1:
+        raise ValueError(f"Memory size must be positive, got {value!r}")
+    return size
+
+
+def json_memory_limit(memory_limit: str | int | None = None) -> int:
+    """Return the memory budget: the argument, else the environment, else the default."""
+    if memory_limit is None:
+        memory_limit = os.environ.get(MEMORY_LIMIT_ENV_VAR) or DEFAULT_MEMORY_LIMIT
+    return parse_memory_size(memory_limit)
+
+
+class _JSONReader:
+    """Decode consecutive JSON values from a text file without reading all of it."""
+
+    def __init__(self, json_file, chunk_size: int = READ_CHUNK_SIZE):
+        self.json_file = json_file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        # Characters dropped from the front of the buffer, for error offsets
+        self.offset = 0
+        self.at_eof = False
+
+    def _fill(self, min_size: int = 0) -> bool:
+        """Append at least one chunk to the buffer; return False at end of file."""
+        if self.at_eof:
+            return False
+        chunk = self.json_file.read(max(self.chunk_size, min_size))
+        if not chunk:
+            self.at_eof = True
+            return False
+        self.offset += self.position
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+        return True
+
+    def _decode_error(self, error: json.JSONDecodeError) -> InvalidJSONTable:
+        """Describe a decode error with its file offset and the text around it."""
+        start = max(0, error.pos - ERROR_CONTEXT_CHARS)
+        context = self.buffer[start : error.pos + ERROR_CONTEXT_CHARS]
+        return InvalidJSONTable(
+            f"Invalid JSON at character {self.offset + error.pos}: {error.msg} (near {context!r})"
+        )
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at end of file."""
+        while True:
+            buffer = self.buffer
+            while self.position < len(buffer) and buffer[self.position] in JSON_WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._fill():
+                return ""
+
+    def expect(self, character: str) -> None:
+        """Consume the next non-whitespace character, which must be ``character``."""
+        found = self.peek()
+        if found != character:
+            raise InvalidJSONTable(
+                f"Invalid JSON: expected {character!r}, found {found or 'end of file'!r}"
+            )
+        self.position += 1
+
+    def decode(self) -> tuple[Any, int]:
+        """Decode the next value and return it with the length of its source text."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as e:
+                # A value cut off by the buffer fails near its end or inside a string;
+                # read more, doubling each time, but report errors elsewhere at once
+                truncated = e.pos >= len(self.buffer) - DECODE_LOOKAHEAD or e.msg.startswith(
+                    "Unterminated string"
+                )
+                if truncated and self._fill(len(self.buffer)):
+                    continue
+                raise self._decode_error(e) from e
+            # A number touching the end of the buffer may still have digits to come
+            if end == len(self.buffer) and self._fill():
+                continue
+            length = end - self.position
+            self.position = end
+            return value, length
+
+    def iter_array_records(self) -> Iterator[tuple[dict, int]]:
+        """Yield the objects of the array that starts at the current position."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.position += 1
+            return
+        first = True
+        while True:
+            record, length = self.decode()
+            if not isinstance(record, dict):
+                if first:
+                    raise UnsupportedJSONLayout("JSON array does not hold records")
+                raise InvalidJSONTable("Invalid JSON table: every array element must be an object")
+            first = False
+            yield record, length
+            separator = self.peek()
+            self.position += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise InvalidJSONTable(
+                    f"Invalid JSON: expected ',' or ']', found {separator or 'end of file'!r}"
+                )
+
+
+def json_layout(json_path: str | Path, chunk_size: int = READ_CHUNK_SIZE) -> str:
+    """
+    Return whether a JSON file is an array, newline-delimited objects, or one object.
+
+    Only the start of the file is read: a first line that is a whole object
+    followed by another object means newline-delimited JSON.
+    """
+    json_path = Path(json_path)
+    if json_path.suffix.lower() in NDJSON_SUFFIXES:
+        return JSON_LAYOUT_NDJSON
+    with open(json_path, encoding="utf-8-sig") as json_file:
+        head = json_file.read(chunk_size)
+    stripped = head.lstrip(JSON_WHITESPACE)
+    if stripped.startswith("["):
+        return JSON_LAYOUT_ARRAY
+    first_line, newline, rest = stripped.partition("\n")
+    if newline and rest.lstrip(JSON_WHITESPACE).startswith("{"):
+        try:
+            if isinstance(json.loads(first_line), dict):
+                return JSON_LAYOUT_NDJSON
+        except ValueError:
+            pass
+    return JSON_LAYOUT_OBJECT
+
+
+def _iter_ndjson_records(json_file) -> Iterator[tuple[dict, int]]:
+    """Yield the objects of a newline-delimited JSON file."""
+    for line_number, line in enumerate(json_file, start=1):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise InvalidJSONTable(f"Invalid JSON lines table: line {line_number} is not an object")
+        yield record, len(line)
+
+
+def iter_json_records(
+    json_path: str | Path,
+    chunk_size: int = READ_CHUNK_SIZE,
+) -> Iterator[tuple[dict, int]]:
+    """
+    Yield each record of a record-oriented JSON file with its source text length.
+
+    Raises UnsupportedJSONLayout before yielding anything when the file is not a
+    list of records (at the top level or under a data/records/rows key) or
+    newline-delimited objects.
+    """
+    layout = json_layout(json_path)
+    with open(json_path, encoding="utf-8-sig") as json_file:
+        if layout == JSON_LAYOUT_NDJSON:
+            yield from _iter_ndjson_records(json_file)
+            return
+
+        reader = _JSONReader(json_file, chunk_size)
+        first = reader.peek()
+        if first == "[":
+            yield from reader.iter_array_records()
+            return
+        if first != "{":
+            raise UnsupportedJSONLayout("JSON document is not an array or object")
+
+        reader.position += 1
+        while reader.peek() not in ("}", ""):
+            key, _ = reader.decode()
+            reader.expect(":")
+            if key in RECORD_LIST_KEYS and reader.peek() == "[":
+                yield from reader.iter_array_records()
+                return
+            value, _ = reader.decode()
+            if isinstance(value, dict):
+                # Column-oriented table: no row is complete before the last column
+                raise UnsupportedJSONLayout("JSON object holds columns, not records")
+            if reader.peek() == ",":
+                reader.position += 1
+        raise UnsupportedJSONLayout("JSON object has no data, records or rows list")
+
+
+def read_json_table(json_path: str | Path) -> pd.DataFrame:
+    """Read common JSON table layouts into a DataFrame, holding the whole document."""
+    try:
+        return pd.read_json(json_path)
+    except ValueError:
+        with open(json_path, encoding="utf-8") as json_file:
+            json_data = json.load(json_file)
+
+        if isinstance(json_data, list):
+            return pd.DataFrame(json_data)
+        if isinstance(json_data, dict):
+            for key in RECORD_LIST_KEYS:
+                value = json_data.get(key)
+                if isinstance(value, list):
+                    return pd.DataFrame(value)
+            return pd.DataFrame.from_dict(json_data)
+
+        raise ValueError("Unsupported JSON table structure.")
+
+
+def iter_json_frames(
+    json_path: str | Path,
+    memory_limit: str | int | None = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield a JSON table as DataFrames that each fit the memory budget.
+
+    Frames are indexed by their position in the file, so concatenating them gives
+    the whole table. Layouts that cannot be streamed arrive as a single frame.
+    """
+    batch_bytes = max(1, json_memory_limit(memory_limit) // MEMORY_OVERHEAD_FACTOR)
+    records: list[dict] = []
+    records_bytes = 0
+    row_offset = 0
+    try:
+        for record, length in iter_json_records(json_path):
+            records.append(record)
+            records_bytes += length
+            if records_bytes >= batch_bytes:
+                yield pd.DataFrame(
+                    records, index=pd.RangeIndex(row_offset, row_offset + len(records))
+                )
+                row_offset += len(records)
+                records = []
+                records_bytes = 0
+    except UnsupportedJSONLayout:
+        yield read_json_table(json_path).reset_index(drop=True)
+        return
+    if records:
+        yield pd.DataFrame(records, index=pd.RangeIndex(row_offset, row_offset + len(records)))
+
+
+def conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast a table to a wider schema, adding missing columns as nulls."""
+    columns = [
+        table.column(field.name).cast(field.type)
+        if field.name in table.column_names
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def write_parquet_frames(
+    frames: Iterable[pd.DataFrame],
+    parquet_path: str | Path,
+    compression: str | None = "snappy",
+    metadata: dict[bytes, bytes] | None = None,
+    source: str | Path | None = None,
+) -> int:
+    """
+    Write DataFrames to one Parquet file, one row group each, and return the rows written.
+
+    When a later frame adds columns or widens a type, earlier row groups are cast
+    to the final schema. ``metadata`` is added to the file's schema metadata, and
+    ``source`` names the input in errors. Nothing is written when no frame has rows.
+    """
+    parquet_path = Path(parquet_path)
+    token = uuid.uuid4().hex[:8]
+    part_paths: list[Path] = []
+    writer: pq.ParquetWriter | None = None
+    schema: pa.Schema | None = None
+    rows_written = 0
+    try:
+        for frame in frames:
+            if frame.empty:
+                continue
+
+            table = pa.Table.from_pandas(frame, preserve_index=False).replace_schema_metadata()
+            if schema is None:
+                schema = table.schema
+            elif not table.schema.equals(schema):
+                try:
+                    unified = pa.unify_schemas([schema, table.schema], promote_options="permissive")
+                except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                    raise ValueError(
+                        f"Inconsistent column types in {source or parquet_path}: {e}"
+                    ) from e
+                if not unified.equals(schema):
+                    # A Parquet file has one schema, so continue in a new part
+                    writer.close()
+                    writer = None
+                    schema = unified
+
+            if writer is None:
+                part_path = parquet_path.with_name(
+                    f"{parquet_path.name}.{token}.part{len(part_paths)}.tmp"
+                )
+                part_paths.append(part_path)
+                writer = pq.ParquetWriter(part_path, schema, compression=compression)
+            writer.write_table(conform_table(table, schema))
+            rows_written += table.num_rows
+
+        if writer is not None:
+            writer.close()
+            writer = None
+        if not rows_written:
+            return 0
+
+        final_schema = schema.with_metadata(metadata) if metadata else schema
+        if len(part_paths) == 1 and not metadata:
+            part_paths[0].replace(parquet_path)
+            return rows_written
+
+        staging_path = parquet_path.with_name(f"{parquet_path.name}.{token}.tmp")
+        with pq.ParquetWriter(staging_path, final_schema, compression=compression) as combined:
+            for part_path in part_paths:
+                part_file = pq.ParquetFile(part_path)
+                for row_group in range(part_file.num_row_groups):
+                    combined.write_table(
+                        conform_table(part_file.read_row_group(row_group), final_schema)
+                    )
+        staging_path.replace(parquet_path)
+        return rows_written
+    finally:
+        if writer is not None:
+            writer.close()
+        for part_path in part_paths:
+            part_path.unlink(missing_ok=True)
+        parquet_path.with_name(f"{parquet_path.name}.{token}.tmp").unlink(missing_ok=True)
+
+
+def write_json_parquet(
+    json_path: str | Path,
+    parquet_path: str | Path,
+    transform: Callable[[pd.DataFrame, int], pd.DataFrame] | None = None,
+    memory_limit: str | int | None = None,
+    compression: str | None = "snappy",
+) -> int:
+    """
+    Convert a JSON table to Parquet one batch at a time and return the rows written.
+
+    ``transform`` receives each batch with a fresh index and the file position of
+    its first row. Batches are written as by ``write_parquet_frames``.
+    """
+
+    def frames() -> Iterator[pd.DataFrame]:
+        for frame in iter_json_frames(json_path, memory_limit):
+            row_offset = int(frame.index[0]) if len(frame) else 0
+            frame = frame.reset_index(drop=True)
+            yield frame if transform is None else transform(frame, row_offset)
+
+    return write_parquet_frames(frames(), parquet_path, compression=compression, source=json_path)
@@ -0,0 +1,172 @@
+"""Column-wise expansion of reaction-level tables into reactant/product rows.
+
+Shared by the dashboard's JSON loader and the descriptor precompute script so
+both generate the same parseable component names. Every helper works on whole
+columns, so N reactions expand to 2N rows without a Python loop per row.
+
+Precomputed datasets are stored normalized as a reaction store: a thin
+components Parquet file (the path users load) holding only per-component
+columns, and a ``.reactions.parquet`` file beside it holding every reaction
+column once. The two are linked by ``source_json_row``, and the components
+file's schema metadata records how the dashboard rebuilds the expanded rows.
+"""
+
+import functools
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+REACTION_ROLES = ("reactant", "product")
+# Role-specific SMILES columns, most specific first
+ROLE_SMILES_COLUMNS = ("{role}_smiles", "{role}_initial_smiles", "{role}_opt_smiles", "smiles")
+# Columns each expanded row derives from its reaction, in the order they are added
+COMPONENT_COLUMNS = (
+    "reaction_role",
+    "source_json_row",
+    "unique_name",
+    "initial_xyz",
+    "opt_xyz",
+    "number_of_atoms",
+    "source_gibbs",
+    "formula",
+    "initial_smiles",
+    "opt_smiles",
+    "task",
+    "calculator",
+    "opt_converged",
+    "smiles_changed",
+    "number_of_imaginary",
+)
+# Component columns that repeat a role-specific reaction column, rebuilt on read
+ROLE_COLUMNS = {"initial_xyz": "{role}_geometry", "opt_xyz": "{role}_geometry"}
+REACTION_STORE_METADATA_KEY = b"iqc.reaction_store"
+REACTION_STORE_VERSION = 1
+REACTION_STORE_SUFFIX = ".reactions.parquet"
+
+
+def optional_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return a column, or an all-null column when it is missing."""
+    if column in df.columns:
+        return df[column]
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def sanitize_name_parts(values: pd.Series) -> pd.Series:
+    """Return compact tokens suitable for generated unique_name values; nulls become ""."""
+    return (
+        values.astype("string")
+        .str.strip()
+        .str.replace(r"\s+", "-", regex=True)
+        .str.replace(r"[^A-Za-z0-9+_.-]+", "-", regex=True)
+        .str.strip("-")
+        .fillna("")
+        .astype(str)
+    )
+
+
+def component_unique_names(df: pd.DataFrame, role: str, row_numbers: np.ndarray) -> pd.Series:
+    """
+    Build parseable names for one role of every reaction row.
+
+    Names read ``<ligand_pair>_<role>_<configuration>_<stereo>_<insertion>_<row>``,
+    skipping empty parts; a missing ligand pair becomes ``reaction-<row>``.
+    """
+    row_text = pd.Series(row_numbers, index=df.index).astype(str)
+    ligand_pair = sanitize_name_parts(optional_column(df, "ligand_pair"))
+    names = ligand_pair.where(ligand_pair != "", "reaction-" + row_text) + f"_{role}"
+    for column in (f"{role}_configuration", "stereo_type", "insertion_type"):
+        part = sanitize_name_parts(optional_column(df, column))
+        names = names + ("_" + part).where(part != "", "")
+    return names + "_" + row_text
+
+
+def xyz_atom_counts(geometries: pd.Series) -> pd.Series:
+    """Return the atom count on the first line of each XYZ string, or null if it is not one."""
+    first_lines = geometries.astype("string").str.extract(r"^([^\r\n]*)", expand=False).str.strip()
+    counts = first_lines.where(first_lines.str.fullmatch(r"[+-]?\d+").fillna(False))
+    return pd.to_numeric(counts).astype("Int64")
+
+
+def role_smiles(df: pd.DataFrame, role: str) -> pd.Series:
+    """Return the first available role-specific SMILES per row as text, "" when there is none."""
+    smiles = pd.Series(None, index=df.index, dtype=object)
+    for template in ROLE_SMILES_COLUMNS:
+        column = template.format(role=role)
+        if column in df.columns:
+            smiles = smiles.where(smiles.notna(), df[column])
+    return smiles.astype("string").fillna("").astype(str)
+
+
+def interleave_components(component_frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Stack equal-length per-role frames so each reaction's rows are adjacent, in role order."""
+    stacked = pd.concat(component_frames, ignore_index=True)
+    reaction_count = len(component_frames[0])
+    order = np.arange(len(stacked)).reshape(len(component_frames), reaction_count).T.ravel()
+    return stacked.take(order).reset_index(drop=True)
+
+
+def reaction_store_path(components_path: str | Path) -> Path:
+    """Return the reactions file that belongs beside a components file."""
+    components_path = Path(components_path)
+    return components_path.with_name(f"{components_path.stem}{REACTION_STORE_SUFFIX}")
+
+
+def is_reaction_store_table(path: str | Path) -> bool:
+    """Return True for the reactions half of a reaction store, which is not loaded alone."""
+    return Path(path).name.lower().endswith(REACTION_STORE_SUFFIX)
+
+
+def reaction_store_metadata(
+    reaction_columns: list[str],
+    dashboard_columns: list[str],
+    reactions_path: str | Path,
+) -> dict[str, Any]:
+    """Describe how a components file joins its reactions file into expanded rows."""
+    role_columns = {
+        column: {role: template.format(role=role) for role in REACTION_ROLES}
+        for column, template in ROLE_COLUMNS.items()
+        if all(template.format(role=role) in reaction_columns for role in REACTION_ROLES)
+    }
+    return {
+        "version": REACTION_STORE_VERSION,
+        "reactions": Path(reactions_path).name,
+        "reaction_columns": list(reaction_columns),
+        "role_columns": role_columns,
+        "columns": list(dashboard_columns),
+    }
+
+
+def read_reaction_store(components_path: str | Path) -> dict[str, Any] | None:
+    """
+    Return a components file's reaction store description, or None for plain Parquet.
+
+    The ``reactions`` entry is resolved to a path; stores whose reactions file is
+    missing or whose version is unknown are treated as plain Parquet.
+    """
+    try:
+        stat = Path(components_path).stat()
+    except OSError:
+        return None
+    return _read_reaction_store(str(components_path), stat.st_size, stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_reaction_store(
+    components_path: str, file_size: int, file_mtime_ns: int
+) -> dict[str, Any] | None:
+    """Read the store description from the footer. Keyed by size and mtime, read once."""
+    try:
+        metadata = pq.read_schema(components_path).metadata or {}
+        store = json.loads(metadata[REACTION_STORE_METADATA_KEY])
+    except (OSError, KeyError, ValueError):
+        return None
+    if store.get("version") != REACTION_STORE_VERSION:
+        return None
+    reactions_path = Path(components_path).with_name(store["reactions"])
+    if not reactions_path.is_file():
+        return None
+    return {**store, "reactions": str(reactions_path)}
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Build IQC dashboard text search indexes next to Parquet files."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from iqc_dashboard.app import (
+    is_search_index_fresh,
+    search_index_path,
+    write_search_index,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Write a trigram index next to each Parquet file so plain substring "
+            "text filters in the dashboard read candidate rows instead of scanning."
+        )
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        type=Path,
+        help="Parquet files or directories containing Parquet files",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Rebuild indexes that are already up to date.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    parquet_paths = []
+    for input_path in args.inputs:
+        input_path = input_path.expanduser().resolve()
+        if input_path.is_dir():
+            parquet_paths.extend(sorted(input_path.glob("*.parquet")))
+        elif input_path.is_file():
+            parquet_paths.append(input_path)
+        else:
+            raise SystemExit(f"Input does not exist: {input_path}")
+
+    if not parquet_paths:
+        raise SystemExit("No Parquet files found.")
+
+    for parquet_path in parquet_paths:
+        if is_search_index_fresh(str(parquet_path)) and not args.overwrite:
+            print(f"Up to date: {search_index_path(str(parquet_path))}")
+            continue
+
+        start_time = time.perf_counter()
+        index_path = write_search_index(str(parquet_path))
+        elapsed = time.perf_counter() - start_time
+        size_mb = index_path.stat().st_size / (1024 * 1024)
+        print(f"Wrote {index_path} ({size_mb:.1f} MiB) in {elapsed:.1f} s", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
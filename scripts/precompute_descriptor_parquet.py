@@ -8,17 +8,15 @@ import sys
 import time
 from pathlib import Path
 
-
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from iqc_dashboard.descriptor_precompute import (  # noqa: E402
-    build_precomputed_descriptor_dataframe,
+from iqc_dashboard.descriptor_precompute import (
     default_worker_count,
-    read_reaction_json,
+    write_precomputed_reaction_json,
 )
-
+from iqc_dashboard.reaction_rows import reaction_store_path
 
 DEFAULT_INPUT = Path(
     "/Users/keceli/Library/CloudStorage/Box-Box/Project_II_2024_2026/"
@@ -31,7 +29,7 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description=(
             "Read reaction JSON, precompute all descriptor-tab values, and write "
-            "a dashboard-ready Parquet file containing the original fields."
+            "a dashboard-ready Parquet reaction store containing the original fields."
         )
     )
     parser.add_argument(
@@ -66,6 +64,23 @@ def parse_args() -> argparse.Namespace:
         choices=("zstd", "snappy", "gzip", "brotli", "none"),
         help="Parquet compression codec (default: zstd)",
     )
+    parser.add_argument(
+        "--memory-limit",
+        default=None,
+        help=(
+            "Memory budget for parsing the JSON input in batches, e.g. 2GB "
+            "(default: IQC_JSON_MEMORY_LIMIT or 512MiB)"
+        ),
+    )
+    parser.add_argument(
+        "--expanded",
+        action="store_true",
+        help=(
+            "Write one Parquet file with every reaction column repeated in both "
+            "reactant and product rows, instead of a components file plus a "
+            "<output stem>.reactions.parquet file holding each reaction once."
+        ),
+    )
     parser.add_argument(
         "--overwrite",
         action="store_true",
@@ -89,13 +104,14 @@ def main() -> int:
         raise SystemExit("--chunksize must be at least 1")
     if not input_path.is_file():
         raise SystemExit(f"Input JSON does not exist: {input_path}")
-    if output_path.exists() and not args.overwrite:
-        raise SystemExit(f"Output already exists: {output_path} (use --overwrite)")
+    output_paths = [output_path]
+    if not args.expanded:
+        output_paths.append(reaction_store_path(output_path))
+    for path in output_paths:
+        if path.exists() and not args.overwrite:
+            raise SystemExit(f"Output already exists: {path} (use --overwrite)")
 
     start_time = time.perf_counter()
-    reaction_df = read_reaction_json(input_path)
-    print(f"Loaded {len(reaction_df):,} reaction rows from {input_path}")
-
     last_report = 0
 
     def report_progress(completed: int, total: int) -> None:
@@ -104,28 +120,32 @@ def main() -> int:
             elapsed = time.perf_counter() - start_time
             rate = completed / elapsed if elapsed else 0.0
             print(
-                f"Computed {completed:,}/{total:,} reactions "
-                f"({completed / total:.1%}, {rate:.1f} rows/s)",
+                f"Computed {completed:,}/{total:,} reactions read so far "
+                f"({rate:.1f} rows/s)",
                 flush=True,
             )
             last_report = completed
 
-    output_df = build_precomputed_descriptor_dataframe(
-        reaction_df,
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    compression = None if args.compression == "none" else args.compression
+    # Reactions are read, computed and written in batches bounded by --memory-limit
+    reaction_count = write_precomputed_reaction_json(
+        input_path,
+        output_path,
         workers=args.workers,
         chunksize=args.chunksize,
         progress=report_progress,
+        memory_limit=args.memory_limit,
+        compression=compression,
+        expanded=args.expanded,
     )
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    compression = None if args.compression == "none" else args.compression
-    output_df.to_parquet(output_path, index=False, compression=compression)
-
     elapsed = time.perf_counter() - start_time
-    size_mb = output_path.stat().st_size / (1024 * 1024)
+    size_mb = sum(path.stat().st_size for path in output_paths) / (1024 * 1024)
     print(
-        f"Wrote {len(output_df):,} dashboard rows and {len(output_df.columns):,} "
-        f"columns to {output_path} ({size_mb:.1f} MiB) in {elapsed / 60:.1f} minutes"
+        f"Wrote {2 * reaction_count:,} dashboard rows to "
+        f"{', '.join(str(path) for path in output_paths)} ({size_mb:.1f} MiB) "
+        f"in {elapsed / 60:.1f} minutes"
     )
     return 0
 
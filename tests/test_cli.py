@@ -88,3 +88,67 @@ class TestCLI:
         assert "--server.port=8601" in args
         assert "--browser.serverPort=8601" in args
         mock_is_port_available.assert_called_once_with("127.0.0.1", 8601)
+
+    @patch("iqc_dashboard.cli.subprocess.run")
+    @patch("iqc_dashboard.cli._is_port_available", return_value=True)
+    def test_main_forwards_duckdb_settings(
+        self, mock_is_port_available, mock_run, tmp_path, monkeypatch
+    ):
+        """Test DuckDB flags reach the Streamlit process as environment variables."""
+        monkeypatch.delenv("IQC_DUCKDB_THREADS", raising=False)
+        config_path = tmp_path / "iqc.toml"
+        config_path.write_text('[duckdb]\nmemory_limit = "2GB"\n')
+        mock_run.return_value = MagicMock(returncode=0)
+
+        main(
+            [
+                "--config",
+                str(config_path),
+                "--duckdb-threads",
+                "4",
+                "--duckdb-temp-directory",
+                str(tmp_path / "spill"),
+                "--no-duckdb-preserve-insertion-order",
+            ]
+        )
+
+        env = mock_run.call_args.kwargs["env"]
+        assert env["IQC_DASHBOARD_CONFIG"] == str(config_path.resolve())
+        assert env["IQC_DUCKDB_THREADS"] == "4"
+        assert env["IQC_DUCKDB_TEMP_DIRECTORY"] == str(tmp_path / "spill")
+        assert env["IQC_DUCKDB_PRESERVE_INSERTION_ORDER"] == "false"
+        assert "IQC_DUCKDB_MEMORY_LIMIT" not in env
+
+    @patch("iqc_dashboard.cli.subprocess.run")
+    @patch("iqc_dashboard.cli._is_port_available", return_value=True)
+    def test_main_exits_on_invalid_config(
+        self, mock_is_port_available, mock_run, tmp_path, capsys
+    ):
+        """Test CLI rejects an unreadable DuckDB config before starting Streamlit."""
+        config_path = tmp_path / "iqc.toml"
+        config_path.write_text("[duckdb]\nmemory = 1\n")
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(["--config", str(config_path)])
+
+        assert exc_info.value.code == 1
+        assert "Unknown [duckdb] option(s)" in capsys.readouterr().err
+        mock_run.assert_not_called()
+
+    @patch("iqc_dashboard.cli.subprocess.run")
+    @patch("iqc_dashboard.cli._is_port_available", return_value=True)
+    def test_main_forwards_cache_settings(self, mock_is_port_available, mock_run, tmp_path, capsys):
+        """Test cache flags are forwarded, and an invalid size limit stops the launch."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        main(["--cache-dir", str(tmp_path / "cache"), "--cache-size-limit", "50GB"])
+
+        env = mock_run.call_args.kwargs["env"]
+        assert env["IQC_CACHE_DIR"] == str(tmp_path / "cache")
+        assert env["IQC_CACHE_SIZE_LIMIT"] == "50GB"
+
+        mock_run.reset_mock()
+        with pytest.raises(SystemExit):
+            main(["--cache-size-limit", "lots"])
+        assert "Invalid memory size" in capsys.readouterr().err
+        mock_run.assert_not_called()
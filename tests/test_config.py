@@ -0,0 +1,56 @@
+"""Tests for DuckDB configuration loading."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import the module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from iqc_dashboard.config import load_duckdb_config
+
+
+def test_environment_overrides_config_file(tmp_path):
+    """Test IQC_DUCKDB_* variables take precedence over the config file."""
+    config_path = tmp_path / "iqc.toml"
+    config_path.write_text(
+        "[duckdb]\n"
+        "threads = 8\n"
+        'memory_limit = "4GB"\n'
+        "preserve_insertion_order = false\n"
+        "pool_size = 4\n"
+    )
+
+    config = load_duckdb_config(
+        {
+            "IQC_DASHBOARD_CONFIG": str(config_path),
+            "IQC_DUCKDB_MEMORY_LIMIT": "1GB",
+            "IQC_DUCKDB_POOL_SIZE": "12",
+        }
+    )
+
+    assert config == {
+        "threads": 8,
+        "memory_limit": "1GB",
+        "preserve_insertion_order": False,
+        "pool_size": 12,
+    }
+
+
+def test_no_configuration_keeps_duckdb_defaults():
+    """Test nothing is set when neither a config file nor variables are given."""
+    assert load_duckdb_config({}) == {}
+
+
+@pytest.mark.parametrize(
+    "contents",
+    ["[duckdb\n", "duckdb = 1\n", "[duckdb]\nmemory = 1\n", "[duckdb]\npool_size = 0\n"],
+)
+def test_invalid_config_file_is_rejected(tmp_path, contents):
+    """Test malformed config files raise ValueError with the file path."""
+    config_path = tmp_path / "iqc.toml"
+    config_path.write_text(contents)
+
+    with pytest.raises(ValueError):
+        load_duckdb_config({"IQC_DASHBOARD_CONFIG": str(config_path)})
@@ -0,0 +1,67 @@
+"""Tests for the shared data cache."""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import the module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from iqc_dashboard.data_cache import (
+    cache_entry_key,
+    cache_entry_of,
+    data_cache_dir,
+    evict_cache_entries,
+    file_content_digest,
+)
+
+
+def make_entry(cache_dir, key, size, last_used, file_name="data.parquet"):
+    entry_dir = cache_dir / cache_entry_key(key)
+    entry_dir.mkdir()
+    (entry_dir / file_name).write_bytes(b"x" * size)
+    os.utime(entry_dir, (last_used, last_used))
+    return entry_dir
+
+
+def test_eviction_removes_least_recently_used_entries(tmp_path):
+    """Test entries go oldest first until the cache fits, sparing kept and in-progress ones."""
+    oldest = make_entry(tmp_path, "oldest", 100, 1_000)
+    kept = make_entry(tmp_path, "kept", 100, 2_000)
+    writing = make_entry(tmp_path, "writing", 100, 3_000, file_name="data.parquet.ab12.tmp")
+    older = make_entry(tmp_path, "older", 100, 4_000)
+    newest = make_entry(tmp_path, "newest", 100, 5_000)
+    (tmp_path / "notes.txt").write_text("not an entry")
+
+    removed = evict_cache_entries(tmp_path, 300, keep=[kept])
+
+    assert removed == [oldest, older]
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        [kept.name, writing.name, newest.name, "notes.txt"]
+    )
+
+
+def test_content_digest_follows_file_content(tmp_path):
+    """Test files are identified by their bytes, not their names."""
+    first = tmp_path / "a.json"
+    second = tmp_path / "b.json"
+    first.write_text("[1]")
+    second.write_text("[1]")
+    digest = file_content_digest(first)
+
+    assert file_content_digest(second) == digest
+    first.write_text("[2, 3]")
+    assert file_content_digest(first) != digest
+
+
+def test_cache_entry_of_and_default_dir(tmp_path, monkeypatch):
+    """Test cached paths map to their entry and the directory honours the environment."""
+    entry_dir = tmp_path / cache_entry_key("upload")
+
+    assert cache_entry_of(tmp_path, entry_dir / "molecules.json") == entry_dir
+    assert cache_entry_of(tmp_path, tmp_path / "molecules.json") is None
+    monkeypatch.setenv("IQC_CACHE_DIR", str(tmp_path / "shared"))
+    assert data_cache_dir() == tmp_path / "shared"
+    monkeypatch.delenv("IQC_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert data_cache_dir() == tmp_path / "iqc_dashboard"
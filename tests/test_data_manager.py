@@ -1,16 +1,24 @@
 """Tests for DataManager class."""
 
+import duckdb
+import io
 import pandas as pd
+import pyarrow as pa
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 import sys
+import threading
+from collections import OrderedDict
 
 # Add parent directory to path to import the module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from iqc_dashboard.app import (
+    DATASET_CATALOG_LIMIT,
     DataManager,
+    DuckDBConnectionPool,
+    arrow_table_to_pandas,
     ENERGY_UNIT_EV,
     ENERGY_UNIT_KCAL,
     build_all_data_table,
@@ -26,7 +34,11 @@ from iqc_dashboard.app import (
     energy_metadata_label,
     parquet_files_have_same_dimensions,
     parquet_files_have_same_schema,
+    parse_unique_name,
+    parse_unique_names,
+    PARSED_NAME_COLUMNS,
 )
+from iqc_dashboard.descriptor_precompute import write_reaction_store
 
 
 class TestDataManager:
@@ -44,13 +56,11 @@ class TestDataManager:
         dm = DataManager(temp_dir)
 
         # Create mock uploaded files
-        mock_file1 = Mock()
+        mock_file1 = io.BytesIO(b"test data 1")
         mock_file1.name = "test1.parquet"
-        mock_file1.getbuffer.return_value = b"test data 1"
 
-        mock_file2 = Mock()
+        mock_file2 = io.BytesIO(b"test data 2")
         mock_file2.name = "test2.parquet"
-        mock_file2.getbuffer.return_value = b"test data 2"
 
         uploaded_files = [mock_file1, mock_file2]
         saved_paths = dm.save_uploaded_files(uploaded_files)
@@ -63,9 +73,8 @@ class TestDataManager:
         """Test saving uploaded files with None values."""
         dm = DataManager(temp_dir)
 
-        mock_file = Mock()
+        mock_file = io.BytesIO(b"test data")
         mock_file.name = "test.parquet"
-        mock_file.getbuffer.return_value = b"test data"
 
         uploaded_files = [mock_file, None]
         saved_paths = dm.save_uploaded_files(uploaded_files)
@@ -73,8 +82,88 @@ class TestDataManager:
         assert len(saved_paths) == 1
         assert Path(saved_paths[0]).exists()
 
+    def test_save_uploaded_files_skips_already_ingested_content(self, temp_dir):
+        """Test reruns with the same upload bytes neither rewrite nor reconvert them."""
+        json_bytes = pd.DataFrame(
+            {"unique_name": ["mol_001", "mol_002"], "formula": ["H2O", "CO2"]}
+        ).to_json(orient="records").encode()
+        dm = DataManager(temp_dir)
+
+        def upload(name):
+            uploaded_file = io.BytesIO(json_bytes)
+            uploaded_file.name = name
+            return uploaded_file
+
+        conversion_gate = threading.Event()
+        convert_json_file = DataManager._convert_json_file
+
+        def gated_conversion(*args):
+            conversion_gate.wait(timeout=30)
+            convert_json_file(*args)
+
+        with patch("iqc_dashboard.app.UPLOAD_CHUNK_SIZE", 16), patch.object(
+            DataManager, "prepare_data_file", wraps=dm.prepare_data_file
+        ) as prepare_data_file, patch.object(
+            DataManager, "_convert_json_file", staticmethod(gated_conversion)
+        ):
+            first_paths = dm.save_uploaded_files([upload("molecules.json")])
+            upload_path = next(Path(temp_dir).glob("*/molecules.json"))
+            upload_mtime = upload_path.stat().st_mtime_ns
+            second_paths = dm.save_uploaded_files([upload("molecules.json")])
+            parquet_path = dm.json_sources[str(upload_path)]
+            conversion_gate.set()
+            DataManager._json_conversions[parquet_path].result(timeout=30)
+            third_paths = dm.save_uploaded_files([upload("molecules.json")])
+
+        assert second_paths == first_paths == [str(upload_path)]
+        assert third_paths == [parquet_path]
+        assert dm.json_sources == {}
+        assert upload_path.read_bytes() == json_bytes
+        assert upload_path.stat().st_mtime_ns == upload_mtime
+        prepare_data_file.assert_called_once()
+
+    def test_reruns_reusing_uploads_leave_the_cache_alone(self, temp_dir):
+        """Test the cache is only touched and trimmed when an upload is newly ingested."""
+        dm = DataManager(temp_dir)
+
+        def upload(content):
+            uploaded_file = io.BytesIO(content)
+            uploaded_file.name = "test.parquet"
+            return uploaded_file
+
+        with patch("iqc_dashboard.app.evict_cache_entries", return_value=[]) as evict:
+            dm.save_uploaded_files([upload(b"test data 1")])
+            dm.save_uploaded_files([upload(b"test data 1")])
+            dm.save_uploaded_files([upload(b"test data 1")])
+            assert evict.call_count == 1
+            dm.save_uploaded_files([upload(b"test data 2")])
+
+        assert evict.call_count == 2
+
+    def test_rerun_with_same_json_upload_keeps_it_queryable(self, temp_dir):
+        """Test a JSON upload queried in place stays registered as JSON across reruns."""
+        json_bytes = pd.DataFrame(
+            {"unique_name": ["mol_001", "mol_002"], "formula": ["H2O", "CO2"]}
+        ).to_json(orient="records").encode()
+        dm = DataManager(temp_dir)
+
+        def upload():
+            uploaded_file = io.BytesIO(json_bytes)
+            uploaded_file.name = "data.json"
+            return uploaded_file
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()), patch.object(
+            DataManager, "_schedule_json_conversion"
+        ):
+            dm.save_uploaded_files([upload()])
+            saved_paths = dm.save_uploaded_files([upload()])
+            molecule = dm.get_molecule_by_name("mol_002")
+
+        assert saved_paths[0] in dm.json_sources
+        assert molecule["formula"] == "CO2"
+
     def test_load_data_paths_converts_generic_json(self, temp_dir):
-        """Test loading a JSON records file through the Parquet-backed query path."""
+        """Test a JSON records file is queried in place, then swapped for its Parquet copy."""
         json_path = Path(temp_dir) / "molecules.json"
         pd.DataFrame(
             {
@@ -85,17 +174,48 @@ class TestDataManager:
         ).to_json(json_path, orient="records")
 
         dm = DataManager(temp_dir)
-        loaded_paths = dm.load_data_paths([str(json_path)])
-
-        assert len(loaded_paths) == 1
-        assert loaded_paths[0].endswith(".parquet")
-        assert Path(loaded_paths[0]).exists()
-        loaded_df = pd.read_parquet(loaded_paths[0])
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            loaded_paths = dm.load_data_paths([str(json_path)])
+            in_place_df = dm.get_filtered_data(opt_converged=True, limit=None)
+            molecule = dm.get_molecule_by_name("mol_json_002")
+
+            assert loaded_paths == [str(json_path)]
+            parquet_path = dm.json_sources[str(json_path)]
+            DataManager._json_conversions[parquet_path].result(timeout=30)
+            assert dm.swap_converted_json_files()
+
+        assert in_place_df["unique_name"].tolist() == ["mol_json_001"]
+        assert molecule["formula"] == "CO2"
+        assert dm.parquet_files == [parquet_path]
+        assert dm.json_sources == {}
+        assert dm.get_manifest()["row_count"] == 2
+        loaded_df = pd.read_parquet(parquet_path)
         assert loaded_df["unique_name"].tolist() == [
             "mol_json_001",
             "mol_json_002",
         ]
 
+    def test_ndjson_is_queried_alongside_parquet(self, temp_dir, sample_parquet_file):
+        """Test newline-delimited JSON joins Parquet files in one view before conversion."""
+        ndjson_path = Path(temp_dir) / "extra.jsonl"
+        ndjson_path.write_text(
+            '{"unique_name": "mol_ndjson", "formula": "CH4", "opt_converged": true}\n',
+            encoding="utf-8",
+        )
+
+        dm = DataManager(temp_dir)
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()), patch.object(
+            DataManager, "_schedule_json_conversion"
+        ):
+            dm.load_data_paths([sample_parquet_file, str(ndjson_path)])
+            result = dm.get_filtered_data(opt_converged=True, limit=None)
+
+            assert dm.get_manifest() is None
+            assert not dm.has_search_index()
+
+        assert sorted(result["unique_name"]) == ["mol_001", "mol_002", "mol_ndjson"]
+        assert result.loc[result["unique_name"] == "mol_ndjson", "formula"].item() == "CH4"
+
     def test_load_data_paths_expands_reaction_json(self, temp_dir):
         """Test reaction-level JSON expands into descriptor-ready molecule rows."""
         example_dir = Path(__file__).parent.parent / "descriptor_kit" / "example"
@@ -133,6 +253,29 @@ class TestDataManager:
         assert not descriptor_df.empty
         assert set(descriptor_df["role"]) == {"reactant", "product"}
 
+    def test_json_conversions_are_shared_through_the_cache(self, temp_dir, tmp_path, monkeypatch):
+        """Test sessions reuse a conversion of the same content and stale entries are evicted."""
+        cache_dir = tmp_path / "cache"
+        first_json = Path(temp_dir) / "first.json"
+        second_json = Path(temp_dir) / "second.json"
+        pd.DataFrame({"unique_name": ["mol_a", "mol_b"], "opt_steps": [3, 4]}).to_json(first_json)
+        second_json.write_bytes(first_json.read_bytes())
+        stale_entry = cache_dir / "0123456789abcdef"
+        stale_entry.mkdir(parents=True)
+        (stale_entry / "old.parquet").write_bytes(b"x" * 4096)
+        monkeypatch.setenv("IQC_CACHE_SIZE_LIMIT", "4096")
+
+        first_dm = DataManager(str(cache_dir))
+        first_paths = first_dm.load_data_paths([str(first_json)])
+        with patch("iqc_dashboard.app.write_json_parquet") as write_json_parquet:
+            second_paths = DataManager(str(cache_dir)).load_data_paths([str(second_json)])
+
+        write_json_parquet.assert_not_called()
+        assert Path(first_paths[0]).parent.parent == cache_dir
+        assert Path(second_paths[0]).parent == Path(first_paths[0]).parent
+        assert pd.read_parquet(second_paths[0])["unique_name"].tolist() == ["mol_a", "mol_b"]
+        assert not stale_entry.exists()
+
     @patch("iqc_dashboard.app.duckdb")
     def test_get_connection(self, mock_duckdb, temp_dir):
         """Test getting DuckDB connection."""
@@ -142,10 +285,280 @@ class TestDataManager:
         # Mock streamlit cache_resource
         with patch("iqc_dashboard.app.st") as mock_st:
             mock_st.cache_resource = lambda x: x
-            conn = DataManager.get_connection()
-            assert conn == mock_conn
+            pool = DuckDBConnectionPool(max_cursors=2)
+            with patch.object(DataManager, "get_connection_pool", return_value=pool):
+                conn = DataManager.get_connection()
+                assert conn == mock_conn.cursor.return_value
+                assert DataManager.get_connection() is conn
             mock_duckdb.connect.assert_called_once()
 
+    def test_json_conversion_keeps_file_order_without_insertion_order(self, temp_dir):
+        """Test the background JSON copy keeps rows in file order on a reordering pool."""
+        json_path = Path(temp_dir) / "molecules.jsonl"
+        json_path.write_text(
+            "".join(f'{{"unique_name": "mol_{i:05d}", "opt_steps": {i}}}\n' for i in range(20000)),
+            encoding="utf-8",
+        )
+        parquet_path = Path(temp_dir) / "molecules.parquet"
+        pool = DuckDBConnectionPool(
+            max_cursors=1, settings={"threads": 4, "preserve_insertion_order": False}
+        )
+
+        DataManager._convert_json_file(pool, str(json_path), str(parquet_path))
+
+        converted = pd.read_parquet(parquet_path)
+        assert list(converted.columns) == ["unique_name", "opt_steps"]
+        assert converted["opt_steps"].tolist() == list(range(20000))
+
+    def test_connection_pool_gives_each_thread_its_own_cursor(self):
+        """Test pooled cursors are per thread, share one database and are bounded."""
+        pool = DuckDBConnectionPool(max_cursors=1, settings={"threads": 2})
+        main_cursor = pool.cursor()
+        main_cursor.execute("CREATE TABLE shared_values AS SELECT 42 AS value")
+
+        results = {}
+
+        def query_from_thread():
+            try:
+                cursor = pool.cursor(timeout=0.1)
+            except TimeoutError:
+                results["timed_out"] = True
+                return
+            results["same_cursor"] = cursor is main_cursor
+            results["value"] = cursor.execute("SELECT value FROM shared_values").fetchone()[0]
+
+        # The only slot belongs to the (still running) main thread.
+        worker = threading.Thread(target=query_from_thread)
+        worker.start()
+        worker.join()
+        assert results == {"timed_out": True}
+
+        results.clear()
+        pool.max_cursors = 2
+        worker = threading.Thread(target=query_from_thread)
+        worker.start()
+        worker.join()
+
+        assert results == {"same_cursor": False, "value": 42}
+
+        # The finished worker's slot is reclaimed for the next thread.
+        results.clear()
+        worker = threading.Thread(target=query_from_thread)
+        worker.start()
+        worker.join()
+        assert results == {"same_cursor": False, "value": 42}
+        assert main_cursor.execute("SELECT current_setting('threads')").fetchone()[0] == 2
+
+    def test_dataset_view_is_registered_once(self, temp_dir, sample_parquet_file):
+        """Test queries reuse one catalog view instead of re-reading the file list."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [sample_parquet_file]
+        conn = duckdb.connect()
+
+        view_name = dm.register_dataset_view(conn)
+        assert view_name == dm.get_dataset_view_name()
+
+        with (
+            patch.object(DataManager, "get_connection", return_value=conn),
+            patch.object(
+                dm,
+                "_parquet_source_sql",
+                side_effect=AssertionError("dataset view should be reused"),
+            ),
+        ):
+            assert dm.register_dataset_view(conn) == view_name
+            result = dm.get_filtered_data(opt_converged=True)
+
+        assert result["unique_name"].tolist() == ["mol_001", "mol_002"]
+
+    def test_get_filtered_data_column_projection(self, temp_dir, sample_parquet_file):
+        """Test column projection reads only requested columns that exist."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [sample_parquet_file]
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            result = dm.get_filtered_data(
+                formula="CO2",
+                columns=["opt_energy_eV", "unique_name", "missing_column"],
+            )
+            numeric_columns = dm.get_column_names(numeric_only=True)
+
+        assert list(result.columns) == ["unique_name", "opt_energy_eV"]
+        assert result["unique_name"].tolist() == ["mol_002"]
+        assert "opt_energy_eV" in numeric_columns
+        assert "formula" not in numeric_columns
+        assert "opt_converged" not in numeric_columns
+
+    def test_get_filtered_data_returns_dictionary_columns_as_categories(
+        self, temp_dir, sample_parquet_file
+    ):
+        """Test label columns with few distinct values arrive as categoricals."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [sample_parquet_file]
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            dictionary_columns = dm.get_dictionary_columns(dm._get_parquet_files_hash())
+            result = dm.get_filtered_data(opt_converged=True)
+
+        assert dictionary_columns == ("calculator", "task", "formula")
+        assert isinstance(result["formula"].dtype, pd.CategoricalDtype)
+        assert result["formula"].tolist() == ["H2O", "CO2"]
+        assert not isinstance(result["unique_name"].dtype, pd.CategoricalDtype)
+        assert result["opt_steps"].tolist() == [10, 15]
+
+    def test_high_cardinality_label_columns_stay_strings(self, temp_dir):
+        """Test label columns with mostly distinct values are not returned as categoricals."""
+        row_count = 1000
+        frame = pd.DataFrame(
+            {
+                "unique_name": [f"mol_{i:04d}" for i in range(row_count)],
+                "calculator": ["dft", "xtb"] * (row_count // 2),
+                "formula": [f"C{i}H{i + 2}" for i in range(row_count)],
+            }
+        )
+        manifest_path = Path(temp_dir) / "with_manifest.parquet"
+        scanned_path = Path(temp_dir) / "without_manifest.parquet"
+        frame.to_parquet(manifest_path, index=False)
+        frame.to_parquet(scanned_path, index=False)
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            loaded_dm = DataManager(temp_dir)
+            loaded_dm.load_data_paths([str(manifest_path)])
+            scanned_dm = DataManager(temp_dir)
+            scanned_dm.parquet_files = [str(scanned_path)]
+            from_manifest = loaded_dm.get_dictionary_columns(loaded_dm._get_parquet_files_hash())
+            from_scan = scanned_dm.get_dictionary_columns(scanned_dm._get_parquet_files_hash())
+            result = scanned_dm.get_filtered_data(limit=5)
+
+        assert from_manifest == from_scan == ("calculator",)
+        assert isinstance(result["calculator"].dtype, pd.CategoricalDtype)
+        assert not isinstance(result["formula"].dtype, pd.CategoricalDtype)
+
+    def test_get_filtered_data_arrow_result(self, temp_dir, sample_parquet_file):
+        """Test the Arrow result mode keeps strings out of Python objects until sliced."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [sample_parquet_file]
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            table = dm.get_filtered_data(columns=["unique_name", "formula"], as_arrow=True)
+            empty = dm.get_filtered_data(columns=["missing"], as_arrow=True)
+
+        head = arrow_table_to_pandas(table.slice(0, 2))
+        assert isinstance(table, pa.Table)
+        assert pa.types.is_dictionary(table.schema.field("formula").type)
+        assert head["unique_name"].dtype.storage == "pyarrow"
+        assert head["unique_name"].tolist() == ["mol_001", "mol_002"]
+        assert empty.num_rows == 0
+
+    def test_filter_snapshot_is_shared_between_queries(self, temp_dir, sample_parquet_file):
+        """Test repeated filtered reads use one materialised snapshot table."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [sample_parquet_file]
+        conn = duckdb.connect()
+
+        with patch.object(DataManager, "get_connection", return_value=conn):
+            snapshot_table = dm.get_filter_snapshot({"opt_converged": True, "formula": None})
+            # Label column counts are a separate one-off dataset query, cached per dataset
+            dm.get_dictionary_columns(dm._get_parquet_files_hash())
+            with patch.object(
+                dm,
+                "_execute_dataset_query",
+                side_effect=AssertionError("snapshot should be reused"),
+            ):
+                names = dm.get_filtered_data(opt_converged=True, columns=["unique_name"])
+                first_page, _ = dm.get_molecule_name_page({"opt_converged": True})
+
+        assert snapshot_table == dm.get_filter_snapshot_name({"opt_converged": True})
+        assert names["unique_name"].tolist() == ["mol_001", "mol_002"]
+        assert first_page == ["mol_001", "mol_002"]
+
+    def test_filter_snapshot_keeps_row_keys_not_heavy_columns(
+        self,
+        temp_dir,
+        sample_parquet_file,
+    ):
+        """Test snapshots store row keys and light columns and read the rest back by key."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [sample_parquet_file]
+        conn = duckdb.connect()
+
+        with patch.object(DataManager, "get_connection", return_value=conn):
+            snapshot_table = dm.get_filter_snapshot({"opt_converged": True})
+            snapshot_columns = [
+                row[0] for row in conn.execute(f"DESCRIBE {snapshot_table}").fetchall()
+            ]
+            rows = dm.get_filtered_data(opt_converged=True, columns=["formula", "opt_xyz"])
+
+        assert snapshot_columns[:2] == ["iqc_file_index", "file_row_number"]
+        assert "formula" in snapshot_columns
+        assert "opt_xyz" not in snapshot_columns
+        assert "initial_xyz" not in snapshot_columns
+        assert rows["formula"].tolist() == ["H2O", "CO2"]
+        assert rows["opt_xyz"].str.startswith(("3\nH2O", "3\nCO2")).all()
+
+    def test_filter_snapshots_are_evicted_least_recently_used(
+        self,
+        temp_dir,
+        sample_parquet_file,
+    ):
+        """Test old filter snapshots are dropped once the snapshot limit is reached."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [sample_parquet_file]
+        conn = duckdb.connect()
+
+        with (
+            patch.object(DataManager, "get_connection", return_value=conn),
+            patch("iqc_dashboard.app.FILTER_SNAPSHOT_LIMIT", 1),
+        ):
+            first_table = dm.get_filter_snapshot({"formula": "H2O"})
+            second_table = dm.get_filter_snapshot({"formula": "CO2"})
+
+        tables = {row[0] for row in conn.execute("SELECT table_name FROM duckdb_tables()").fetchall()}
+        assert second_table in tables
+        assert first_table not in tables
+
+    def test_held_filter_snapshot_outlives_eviction(self, temp_dir, sample_parquet_file):
+        """Test a snapshot another caller still holds is only dropped once released."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [sample_parquet_file]
+        conn = duckdb.connect()
+
+        with (
+            patch.object(DataManager, "get_connection", return_value=conn),
+            patch("iqc_dashboard.app.FILTER_SNAPSHOT_LIMIT", 1),
+        ):
+            with dm.use_filter_snapshot({"formula": "H2O"}) as held_table:
+                dm.get_filter_snapshot({"formula": "CO2"})
+                held_rows = conn.execute(f"SELECT unique_name FROM {held_table}").fetchall()
+            latest_table = dm.get_filter_snapshot({"formula": "NH3"})
+
+        tables = {row[0] for row in conn.execute("SELECT table_name FROM duckdb_tables()").fetchall()}
+        assert held_rows == [("mol_001",)]
+        assert held_table not in tables
+        assert latest_table in tables
+
+    def test_get_filtered_data_text_filter_binds_patterns(self, temp_dir, sample_parquet_file):
+        """Test substring, regex and RE2-unsupported text filters in one filtered snapshot."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [sample_parquet_file]
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            substring = dm.get_filtered_data(text_filter="MOL_00", opt_converged=True)
+            quoted = dm.get_filtered_data(text_filter="mol_00'1")
+            regex = dm.get_filtered_data(text_filter=r"_\d{2}3$", columns=["formula"])
+            lookahead = dm.get_filtered_data(text_filter=r"mol_(?=002)", columns=["formula"])
+            lookahead_names, _ = dm.get_molecule_name_page({"text_filter": r"mol_(?!002)"})
+            with patch("iqc_dashboard.app.st") as mock_st:
+                invalid = dm.get_filtered_data(text_filter="mol_(")
+
+        assert substring["unique_name"].tolist() == ["mol_001", "mol_002"]
+        assert quoted.empty
+        assert regex["formula"].tolist() == ["NH3"]
+        assert lookahead["formula"].tolist() == ["CO2"]
+        assert lookahead_names == ["mol_001", "mol_003"]
+        assert invalid.empty
+        mock_st.warning.assert_called_once()
+
     def test_get_summary_stats_empty(self, temp_dir):
         """Test get_summary_stats with no files."""
         dm = DataManager(temp_dir)
@@ -187,6 +600,40 @@ class TestDataManager:
                 assert "total_rows" in result.columns
                 assert result["total_rows"].iloc[0] == 3
 
+    def test_manifest_serves_stats_without_scanning(self, temp_dir, sample_parquet_file):
+        """Test statistics built at load time are reused without querying the files."""
+        dm = DataManager(temp_dir)
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            dm.load_data_paths([sample_parquet_file])
+
+        manifest_path, names_path = dm._manifest_paths()
+        assert manifest_path.parent == Path(sample_parquet_file).parent / ".iqc_cache"
+        assert names_path.exists()
+
+        failing_conn = Mock()
+        failing_conn.execute.side_effect = AssertionError("manifest should avoid queries")
+        with patch.object(DataManager, "get_connection", return_value=failing_conn):
+            parquet_hash = dm._get_parquet_files_hash()
+            summary = dm.get_summary_stats(parquet_hash)
+            formulas = dm.get_unique_values("formula", parquet_hash)
+            names = dm.get_all_molecule_names(parquet_hash)
+
+        manifest = dm.get_manifest()
+        assert summary[["total_rows", "unique_formulas", "converged_count"]].iloc[0].tolist() == [
+            3,
+            3,
+            2,
+        ]
+        assert formulas == ["CO2", "H2O", "NH3"]
+        assert names == ["mol_001", "mol_002", "mol_003"]
+        assert manifest["columns"]["opt_steps"] == {
+            "type": "BIGINT",
+            "null_count": 0,
+            "min": 10,
+            "max": 20,
+        }
+
     def test_get_filtered_data_empty(self, temp_dir):
         """Test get_filtered_data with no files."""
         dm = DataManager(temp_dir)
@@ -264,26 +711,40 @@ class TestDataManager:
         dm = DataManager(temp_dir)
         dm.parquet_files = [sample_parquet_file]
 
-        # Setup mock connection
-        mock_conn = Mock()
-        mock_execute = Mock()
-        mock_conn.execute.return_value = mock_execute
-
-        # Return DataFrame with molecule data
-        molecule_df = pd.DataFrame(
-            {"unique_name": ["mol_001"], "formula": ["H2O"], "number_of_atoms": [3]}
-        )
-        mock_execute.df.return_value = molecule_df
-
-        # Mock streamlit and patch get_connection
+        # The lookup goes through the name index table, so use a real connection
         with patch("iqc_dashboard.app.st") as mock_st:
             mock_st.cache_resource = lambda x: x
-            with patch.object(DataManager, "get_connection", return_value=mock_conn):
+            with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
                 molecule = dm.get_molecule_by_name("mol_001")
 
                 assert molecule is not None
                 assert molecule["formula"] == "H2O"
                 assert molecule["unique_name"] == "mol_001"
+                assert molecule["number_of_atoms"] == 3
+
+    def test_get_molecule_by_name_uses_name_index(self, temp_dir, sample_parquet_files):
+        """Test name lookups read the indexed file row, preferring earlier files."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = sample_parquet_files
+        conn = duckdb.connect()
+
+        with patch.object(DataManager, "get_connection", return_value=conn):
+            name_index = dm.get_name_index()
+            assert dm.get_name_index() == name_index
+            molecule = dm.get_molecule_by_name("mol_003")
+            missing = dm.get_molecule_by_name("mol_999")
+
+        indexes = conn.execute(
+            "SELECT index_name FROM duckdb_indexes() WHERE table_name = ?",
+            [name_index],
+        ).fetchall()
+        locations = conn.execute(
+            f"SELECT file_index, file_row_number FROM {name_index} WHERE unique_name = 'mol_003'"
+        ).fetchall()
+        assert indexes == [(f"{name_index}_unique_name",)]
+        assert sorted(locations) == [(0, 2), (1, 2)]
+        assert molecule["formula"] == "NH3"
+        assert missing is None
 
     def test_get_molecule_by_name_not_found(self, temp_dir, sample_parquet_file):
         """Test get_molecule_by_name with non-existent molecule."""
@@ -313,14 +774,177 @@ class TestDataManager:
         mock_execute.df.return_value = molecule_df
 
         # Mock streamlit and patch get_connection
+        # The mock connection has no footer metadata, so the row locator is empty
         with patch("iqc_dashboard.app.st") as mock_st:
             mock_st.cache_resource = lambda x: x
-            with patch.object(DataManager, "get_connection", return_value=mock_conn):
+            with (
+                patch.object(DataManager, "get_connection", return_value=mock_conn),
+                patch.object(DataManager, "get_row_locator", return_value=pd.DataFrame()),
+            ):
                 molecule = dm.get_molecule_by_index(0)
 
                 assert molecule is not None
                 assert molecule["unique_name"] == "mol_001"
 
+    def test_hive_partitioned_tree_prunes_partitions(self, temp_dir):
+        """Test partitioned trees load recursively and filters skip other partitions."""
+        data_root = Path(temp_dir) / "results"
+        for calculator in ("dft", "xtb"):
+            for task in ("freq", "opt"):
+                partition = data_root / f"calculator={calculator}" / f"task={task}"
+                partition.mkdir(parents=True)
+                pd.DataFrame(
+                    {
+                        "unique_name": [f"{calculator}_{task}_{i}" for i in range(2)],
+                        "formula": ["H2O", "CO2"],
+                        "initial_xyz": [f"1\n{calculator}\nH 0 0 {i}" for i in range(2)],
+                    }
+                ).to_parquet(partition / "part-0.parquet", index=False)
+
+        dm = DataManager(temp_dir)
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            assert len(dm.load_data_paths([str(data_root)])) == 4
+            globbed = DataManager(temp_dir).load_data_paths(
+                [str(data_root / "**" / "task=opt" / "*.parquet")]
+            )
+            # A file the filters exclude must never be opened, so corrupt it
+            (data_root / "calculator=xtb" / "task=opt" / "part-0.parquet").write_bytes(b"x")
+            result = dm.get_filtered_data(calculator="dft", task="opt", limit=None)
+            # Columns the snapshot does not keep are read back from matching files only
+            geometries = dm.get_filtered_data(
+                calculator="dft", task="opt", columns=["unique_name", "initial_xyz"]
+            )
+
+        assert geometries["initial_xyz"].tolist() == ["1\ndft\nH 0 0 0", "1\ndft\nH 0 0 1"]
+        assert [Path(path).parent.name for path in globbed] == ["task=opt", "task=opt"]
+        assert dm._partition_pruned_files({"calculator": "xtb", "task": "freq"}) == [
+            str(data_root / "calculator=xtb" / "task=freq" / "part-0.parquet")
+        ]
+        assert result["unique_name"].tolist() == ["dft_opt_0", "dft_opt_1"]
+        assert result["calculator"].tolist() == ["dft", "dft"]
+
+    def test_manifest_key_covers_reaction_files_and_partitions(self, temp_dir):
+        """Test the dataset manifest key changes with what the per-file manifests key on."""
+        reaction_df = pd.DataFrame(
+            {
+                "ligand_pair": ["bipy-alkyne"],
+                "reactant_geometry": ["1\n\nH 0 0 0"],
+                "product_geometry": ["1\n\nH 0 0 1"],
+                "reaction_gibbs_kcal": [-1.0],
+            }
+        )
+        store_path = Path(temp_dir) / "store" / "reactions.parquet"
+        store_path.parent.mkdir()
+        _, reactions_path = write_reaction_store(reaction_df, store_path)
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [str(store_path)]
+        store_key = dm.get_manifest_key()
+        store_file_manifest = dm._file_manifest_paths(str(store_path))[0]
+
+        pd.read_parquet(reactions_path).assign(reaction_gibbs_kcal=-2.0).to_parquet(
+            reactions_path, index=False
+        )
+        assert dm.get_manifest_key() != store_key
+        assert dm._file_manifest_paths(str(store_path))[0] != store_file_manifest
+
+        for stereo in ("R", "S"):
+            partition = Path(temp_dir) / "results" / f"stereo_type={stereo}"
+            partition.mkdir(parents=True)
+            pd.DataFrame({"unique_name": ["mol_a"]}).to_parquet(
+                partition / "part-0.parquet", index=False
+            )
+        partition_keys = []
+        for stereo in ("R", "S"):
+            dm.parquet_files = [
+                str(Path(temp_dir) / "results" / f"stereo_type={stereo}" / "part-0.parquet")
+            ]
+            partition_keys.append(dm.get_manifest_key())
+        assert partition_keys[0] != partition_keys[1]
+
+    def test_refresh_data_paths_scans_only_new_files(self, temp_dir):
+        """Test a refresh merges stored per-file manifests and scans only added files."""
+        data_root = Path(temp_dir) / "results"
+        data_root.mkdir()
+        pd.DataFrame(
+            {"unique_name": ["mol_b", "mol_a"], "formula": ["H2O", "CO2"], "opt_steps": [3, 7]}
+        ).to_parquet(data_root / "batch-0.parquet", index=False)
+
+        dm = DataManager(temp_dir)
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            dm.load_data_paths([str(data_root)])
+            assert dm.refresh_data_paths() == []
+
+            first_manifest, _ = dm._file_manifest_paths(str(data_root / "batch-0.parquet"))
+            first_manifest_mtime = first_manifest.stat().st_mtime_ns
+            new_file = data_root / "batch-1.parquet"
+            pd.DataFrame(
+                {"unique_name": ["mol_c", "mol_a"], "formula": ["NH3", "CO2"], "opt_steps": [1, 9]}
+            ).to_parquet(new_file, index=False)
+            assert dm.refresh_data_paths() == [str(new_file)]
+
+        assert first_manifest.stat().st_mtime_ns == first_manifest_mtime
+        assert dm._file_manifest_paths(str(new_file))[0].exists()
+        manifest = dm.get_manifest()
+        assert manifest["row_count"] == 4
+        assert manifest["distinct_values"]["formula"] == ["CO2", "H2O", "NH3"]
+        assert manifest["columns"]["opt_steps"]["min"] == 1
+        assert manifest["columns"]["opt_steps"]["max"] == 9
+        assert dm.get_all_molecule_names(dm._get_parquet_files_hash()) == [
+            "mol_a",
+            "mol_b",
+            "mol_c",
+        ]
+
+    def test_refreshes_drop_name_indexes_of_old_file_versions(self, temp_dir):
+        """Test each refresh's name index and view do not pile up on the shared connection."""
+        data_root = Path(temp_dir) / "results"
+        data_root.mkdir()
+        conn = duckdb.connect()
+
+        def write_batch(batch):
+            pd.DataFrame({"unique_name": [f"mol_{batch}"], "formula": ["H2O"]}).to_parquet(
+                data_root / f"batch-{batch}.parquet", index=False
+            )
+
+        write_batch(0)
+        dm = DataManager(temp_dir)
+        with patch.object(DataManager, "get_connection", return_value=conn), patch.object(
+            DataManager, "_dataset_catalog", OrderedDict()
+        ):
+            dm.load_data_paths([str(data_root)])
+            for batch in range(1, 7):
+                write_batch(batch)
+                dm.refresh_data_paths()
+                assert dm.get_molecule_by_name(f"mol_{batch}")["formula"] == "H2O"
+                dm.get_schema(dm._get_parquet_files_hash())
+
+        name_tables = conn.execute(
+            "SELECT count(*) FROM duckdb_tables() WHERE table_name LIKE 'iqc_names_%'"
+        ).fetchone()[0]
+        dataset_views = conn.execute(
+            "SELECT count(*) FROM duckdb_views() WHERE view_name LIKE 'iqc_dataset_%'"
+        ).fetchone()[0]
+        assert name_tables <= DATASET_CATALOG_LIMIT
+        assert dataset_views <= DATASET_CATALOG_LIMIT
+
+    def test_get_molecule_by_index_uses_row_locator(self, temp_dir, sample_parquet_files):
+        """Test index lookups resolve a file and row group from parquet footers."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = sample_parquet_files
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            locator = dm.get_row_locator(dm._get_parquet_files_hash())
+            first = dm.get_molecule_by_index(0)
+            second_file_row = dm.get_molecule_by_index(4)
+            past_end = dm.get_molecule_by_index(6)
+
+        assert locator["start_row"].tolist() == [0, 3]
+        assert locator["file_path"].tolist() == sample_parquet_files
+        assert first["unique_name"] == "mol_001"
+        assert second_file_row["unique_name"] == "mol_002"
+        assert "file_row_number" not in second_file_row.index
+        assert past_end is None
+
     def test_get_all_molecule_names(self, temp_dir, sample_parquet_file):
         """Test get_all_molecule_names."""
         dm = DataManager(temp_dir)
@@ -615,6 +1239,50 @@ class TestDataManager:
 
         assert result["deltaG"].iloc[0] == pytest.approx(1.0)
 
+    def test_get_reaction_table_matches_pandas_calculation(self, temp_dir):
+        """Test the SQL reaction table picks the same conformers and ΔG as pandas."""
+        parquet_path = Path(temp_dir) / "reactions.parquet"
+        pd.DataFrame(
+            {
+                "unique_name": [
+                    "bipy-A_x-C2H2-_reactant_conf0",
+                    "bipy-A_x-C2H2-_reactant_conf1",
+                    "bipy-A_x-C2H2-_product_conf0",
+                    "bipy-A_x-C2H2-_product_conf1",
+                    "bipy-B_x-C2H2-_reactant_conf0",
+                    "bipy-B_x-C2H2-_reactant_conf1",
+                    "bipy-B_x-C2H2-_product_conf0",
+                    "bipy-C_y-C2H2-_reactant_conf0",
+                    "CO2",
+                    "co2_linear",
+                ],
+                "G_eV": [0.5, 0.2, 1.0, 1.0, float("nan"), 0.3, 0.4, 0.1, -0.4, -0.5],
+            }
+        ).to_parquet(parquet_path, index=False)
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [str(parquet_path)]
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            rows = dm.get_filtered_data(columns=["unique_name", "G_eV"])
+            for energy_unit in (ENERGY_UNIT_KCAL, ENERGY_UNIT_EV):
+                expected = calculate_reaction_table(rows, energy_unit=energy_unit)
+                result = dm.get_reaction_table(energy_unit=energy_unit)
+                pd.testing.assert_frame_equal(
+                    result.astype(object), expected.reset_index(drop=True).astype(object)
+                )
+            with pytest.raises(ValueError, match="No CO2"):
+                dm.get_reaction_table({"text_filter": "bipy-"})
+
+        assert result["unique_name_reactant"].tolist() == [
+            "bipy-A_x-C2H2-_reactant_conf1",
+            "bipy-B_x-C2H2-_reactant_conf1",
+        ]
+        assert result["unique_name_product"].tolist() == [
+            "bipy-A_x-C2H2-_product_conf0",
+            "bipy-B_x-C2H2-_product_conf0",
+        ]
+        assert result["deltaG"].tolist() == pytest.approx([1.3, 0.6])
+
     def test_energy_unit_conversion_helpers(self):
         """Test scalar energy conversion and metadata labels."""
         assert convert_energy_value(1.0, ENERGY_UNIT_KCAL) == pytest.approx(23.0605)
@@ -679,3 +1347,116 @@ class TestDataManager:
         assert result["bipyridine"].tolist() == ["A", "A"]
         assert result["alkyne"].tolist() == ["C2H2", "C2H2"]
         assert result["role"].tolist() == ["reactant", "product"]
+
+    def test_get_ligand_pairs_matches_python_parser(self, temp_dir):
+        """Test SQL ligand selector queries agree with build_ligand_selector_df."""
+        names = [
+            "bipy-A_x-C2H2-_reactant_conf0",
+            "bipy-A_x-C2H2-_product_conf1",
+            "bipy-B_y-C2H2-_Product",
+            "co2_reactant_x",
+            "CO2",
+            "plain_molecule_name",
+            "bipy-C_z",
+        ]
+        parquet_path = Path(temp_dir) / "ligands.parquet"
+        pd.DataFrame({"unique_name": names}).to_parquet(parquet_path, index=False)
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [str(parquet_path)]
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            pairs = dm.get_ligand_pairs()
+            pair_names = dm.get_ligand_molecule_names("A", "x")
+
+        expected = build_ligand_selector_df(pd.DataFrame({"unique_name": names}))
+        expected_pairs = (
+            expected[["bipyridine", "alkyne"]]
+            .drop_duplicates()
+            .sort_values(["bipyridine", "alkyne"])
+            .values.tolist()
+        )
+        assert pairs[["bipyridine", "alkyne"]].values.tolist() == expected_pairs
+        assert pair_names == [
+            "bipy-A_x-C2H2-_product_conf1",
+            "bipy-A_x-C2H2-_reactant_conf0",
+        ]
+
+    def test_snapshots_store_parsed_name_columns(self, temp_dir):
+        """Test snapshots parse unique_name once, in SQL, exactly as parse_unique_name does."""
+        names = [
+            "bipy-A_x-C2H2-_reactant_conf0",
+            "bipy-A_x-C2H2-_product_conf1_b",
+            "bipy-B_y-C2H2-_Product",
+            "co2_reactant_x",
+            "plain_molecule_name",
+            "bipy-C_z",
+        ]
+        parquet_path = Path(temp_dir) / "parsed_names.parquet"
+        pd.DataFrame({"unique_name": names, "G_eV": range(len(names))}).to_parquet(
+            parquet_path, index=False
+        )
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [str(parquet_path)]
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            stored = dm.get_filtered_data(columns=["unique_name", *PARSED_NAME_COLUMNS])
+            full = dm.get_filtered_data()
+
+        parsed = parse_unique_names(pd.Series(names))
+        assert list(stored.columns) == ["unique_name", *PARSED_NAME_COLUMNS]
+        assert stored[list(PARSED_NAME_COLUMNS)].astype(object).where(
+            stored[list(PARSED_NAME_COLUMNS)].notna(), None
+        ).values.tolist() == parsed.values.tolist()
+        assert parsed["name_conformer"].tolist()[:2] == ["conf0", "conf1_b"]
+        for name, (role, bipyridine, alkyne, _) in zip(names, parsed.values.tolist()):
+            expected = parse_unique_name(name)
+            assert [role, bipyridine, alkyne] == [
+                expected["role"],
+                expected["bipyridine"],
+                expected["alkyne"],
+            ]
+        assert list(full.columns) == ["unique_name", "G_eV"]
+
+    def test_molecule_name_pages_use_keyset_cursor(self, temp_dir, sample_parquet_file):
+        """Test molecule names are paged, searched, counted and stepped in SQL."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [sample_parquet_file]
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            first_page, first_has_more = dm.get_molecule_name_page(page_size=2)
+            second_page, second_has_more = dm.get_molecule_name_page(
+                after=first_page[-1],
+                page_size=2,
+            )
+            searched, _ = dm.get_molecule_name_page(search="_003")
+            filtered, _ = dm.get_molecule_name_page({"formula": "H2O", "text_filter": None})
+            position = dm.count_molecule_names(before="mol_002")
+            total = dm.count_molecule_names()
+            next_name = dm.get_adjacent_molecule_name("mol_002", 1)
+            previous_name = dm.get_adjacent_molecule_name("mol_001", -1)
+
+        assert (first_page, first_has_more) == (["mol_001", "mol_002"], True)
+        assert (second_page, second_has_more) == (["mol_003"], False)
+        assert searched == ["mol_003"]
+        assert filtered == ["mol_001"]
+        assert (position, total) == (1, 3)
+        assert next_name == "mol_003"
+        assert previous_name is None
+
+    def test_text_filter_uses_search_index(self, temp_dir, sample_parquet_file):
+        """Test plain substring filters read candidate rows from the trigram index."""
+        dm = DataManager(temp_dir)
+        dm.parquet_files = [sample_parquet_file]
+
+        with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+            assert not dm.has_search_index()
+            assert len(dm.build_search_index()) == 1
+            assert dm.has_search_index()
+            assert dm._search_index_source("MOL_002") is not None
+            assert dm._search_index_source("mol_0.2") is None
+
+            indexed = dm.get_filtered_data(text_filter="MOL_002", limit=None)
+            missing = dm.get_filtered_data(text_filter="zzz", limit=None)
+
+        assert indexed["unique_name"].tolist() == ["mol_002"]
+        assert missing.empty
@@ -3,12 +3,25 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import duckdb
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
 from descriptor_kit import DESCRIPTOR_KEYS, TDELTA_KEYS, compute_descriptors, compute_tdelta
-from iqc_dashboard.app import ENERGY_UNIT_EV, build_selected_descriptor_dataframe
-from iqc_dashboard.descriptor_precompute import build_precomputed_descriptor_dataframe
+from iqc_dashboard.app import (
+    ENERGY_UNIT_EV,
+    DataManager,
+    build_selected_descriptor_dataframe,
+    expand_reaction_json_dataframe,
+)
+from iqc_dashboard.descriptor_precompute import (
+    build_precomputed_reaction_dataframe,
+    expand_reactions_for_dashboard,
+    write_precomputed_reaction_json,
+    write_reaction_store,
+)
+from iqc_dashboard.reaction_rows import REACTION_STORE_METADATA_KEY
 
 
 EXAMPLE_DIR = Path(__file__).parent.parent / "descriptor_kit" / "example"
@@ -50,8 +63,13 @@ def build_reaction_source_df() -> pd.DataFrame:
 
 
 @pytest.fixture(scope="module")
-def precomputed_df() -> pd.DataFrame:
-    return build_precomputed_descriptor_dataframe(build_reaction_source_df(), workers=1)
+def precomputed_reaction_df() -> pd.DataFrame:
+    return build_precomputed_reaction_dataframe(build_reaction_source_df(), workers=1)
+
+
+@pytest.fixture(scope="module")
+def precomputed_df(precomputed_reaction_df) -> pd.DataFrame:
+    return expand_reactions_for_dashboard(precomputed_reaction_df)
 
 
 def test_precomputed_dataframe_preserves_source_and_dashboard_rows(precomputed_df):
@@ -78,6 +96,35 @@ def test_precomputed_dataframe_preserves_source_and_dashboard_rows(precomputed_d
     ]
 
 
+def test_reaction_expansion_names_match_between_loader_and_precompute():
+    reaction_df = pd.DataFrame(
+        {
+            "ligand_pair": ["bipy a/b", None],
+            "stereo_type": ["S", None],
+            "insertion_type": [None, 2.0],
+            "reactant_geometry": ["2\n\nH 0 0 0\nH 0 0 1", "not xyz"],
+            "product_geometry": ["1\n\nH 0 0 0", ""],
+            "product_smiles": [None, "CC"],
+            "smiles": ["O", None],
+        }
+    )
+
+    loader_df = expand_reaction_json_dataframe(reaction_df)
+    precompute_df = expand_reactions_for_dashboard(reaction_df)
+
+    assert loader_df["unique_name"].tolist() == [
+        "bipy-a-b_reactant_S_0",
+        "bipy-a-b_product_S_0",
+        "reaction-1_reactant_2.0_1",
+        "reaction-1_product_2.0_1",
+    ]
+    assert precompute_df["unique_name"].tolist() == loader_df["unique_name"].tolist()
+    assert loader_df["initial_smiles"].tolist() == ["O", "O", "", "CC"]
+    assert precompute_df["number_of_atoms"].tolist() == [2, 1, pd.NA, pd.NA]
+    offset_df = expand_reaction_json_dataframe(reaction_df, row_offset=5)
+    assert offset_df["source_json_row"].tolist() == [5, 5, 6, 6]
+
+
 def test_precomputed_single_descriptor_matches_descriptor_kit(precomputed_df):
     expected = compute_descriptors(
         read_example_xyz("type_I_reactant.xyz"),
@@ -180,3 +227,76 @@ def test_precomputed_dataframe_round_trips_through_parquet(precomputed_df, tmp_p
     assert loaded_df["reactant_geometry"].tolist() == precomputed_df[
         "reactant_geometry"
     ].tolist()
+
+
+def test_reaction_store_loads_as_expanded_rows(precomputed_reaction_df, precomputed_df, tmp_path):
+    store_dir = tmp_path / "store"
+    store_dir.mkdir()
+    components_path, reactions_path = write_reaction_store(
+        precomputed_reaction_df, store_dir / "reaction_descriptors.parquet"
+    )
+    expanded_path = tmp_path / "reaction_descriptors.parquet"
+    precomputed_df.to_parquet(expanded_path, index=False)
+
+    assert reactions_path.name == "reaction_descriptors.reactions.parquet"
+    assert "reactant_geometry" not in pd.read_parquet(components_path).columns
+    assert (
+        components_path.stat().st_size + reactions_path.stat().st_size
+        < expanded_path.stat().st_size
+    )
+
+    dm = DataManager(str(tmp_path / "cache"))
+    with patch.object(DataManager, "get_connection", return_value=duckdb.connect()):
+        assert dm.load_data_paths([str(store_dir)]) == [str(components_path)]
+        loaded_df = dm.get_filtered_data(limit=None)
+        molecule = dm.get_molecule_by_index(3)
+        named = dm.get_molecule_by_name(precomputed_df.loc[2, "unique_name"])
+
+    assert list(loaded_df.columns) == list(precomputed_df.columns)
+    assert loaded_df["unique_name"].tolist() == precomputed_df["unique_name"].tolist()
+    assert loaded_df["initial_xyz"].tolist() == precomputed_df["initial_xyz"].tolist()
+    assert loaded_df["prod_ni_o1"].tolist() == pytest.approx(precomputed_df["prod_ni_o1"].tolist())
+    assert molecule["opt_xyz"] == precomputed_df.loc[3, "opt_xyz"]
+    assert named["reaction_role"] == "reactant"
+    assert named["source_json_row"] == 1
+
+
+def test_batched_precompute_matches_in_memory_store(
+    precomputed_reaction_df, precomputed_df, tmp_path
+):
+    json_path = tmp_path / "reactions.json"
+    build_reaction_source_df().to_json(json_path, orient="records")
+    memory_limit = 4 * 100  # one reaction per batch, so the Type-I/II pair spans batches
+    store_path = tmp_path / "store" / "reaction_descriptors.parquet"
+    store_path.parent.mkdir()
+    expanded_path = tmp_path / "expanded.parquet"
+
+    assert write_precomputed_reaction_json(json_path, store_path, memory_limit=memory_limit) == 2
+    assert write_precomputed_reaction_json(
+        json_path, expanded_path, memory_limit=memory_limit, expanded=True
+    ) == 2
+
+    expected_dir = tmp_path / "expected"
+    expected_dir.mkdir()
+    expected_components, expected_reactions = write_reaction_store(
+        precomputed_reaction_df, expected_dir / "reaction_descriptors.parquet"
+    )
+    reactions_path = store_path.parent / expected_reactions.name
+    assert pq.ParquetFile(reactions_path).num_row_groups == 2
+    assert (
+        pq.read_schema(store_path).metadata[REACTION_STORE_METADATA_KEY]
+        == pq.read_schema(expected_components).metadata[REACTION_STORE_METADATA_KEY]
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(store_path), pd.read_parquet(expected_components), check_dtype=False
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(reactions_path), pd.read_parquet(expected_reactions), check_dtype=False
+    )
+    precomputed_df.to_parquet(tmp_path / "expected_expanded.parquet", index=False)
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(expanded_path),
+        pd.read_parquet(tmp_path / "expected_expanded.parquet"),
+        check_dtype=False,
+    )
+    assert not list(store_path.parent.glob("*.tmp"))
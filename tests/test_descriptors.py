@@ -2,6 +2,7 @@
 
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -17,7 +18,11 @@ from iqc_dashboard.app import (
     build_descriptor_reaction_pairs,
     build_descriptor_value_options,
     build_selected_descriptor_dataframe,
+    cached_descriptor_dataframe,
+    cached_selected_descriptor_records_ev,
     compact_xyz_for_browser,
+    compute_selected_single_descriptor_value,
+    ENERGY_UNIT_EV,
     extract_descriptor_keyword_options,
 )
 
@@ -25,6 +30,16 @@ from iqc_dashboard.app import (
 EXAMPLE_DIR = Path(__file__).parent.parent / "descriptor_kit" / "example"
 
 
+@pytest.fixture(autouse=True)
+def clear_descriptor_caches():
+    """Start and end each test with empty dataset-keyed descriptor caches."""
+    cached_descriptor_dataframe.clear()
+    cached_selected_descriptor_records_ev.clear()
+    yield
+    cached_descriptor_dataframe.clear()
+    cached_selected_descriptor_records_ev.clear()
+
+
 def read_example_xyz(name: str) -> str:
     """Read one bundled descriptor_kit example XYZ file."""
     return (EXAMPLE_DIR / name).read_text(encoding="utf-8")
@@ -97,6 +112,44 @@ def test_build_selected_descriptor_dataframe_uses_product_delta_g_plot_data():
     assert "_product_" in row["unique_name"]
 
 
+def test_switching_energy_units_reuses_descriptor_values():
+    """Changing the display unit converts cached eV records instead of recomputing them."""
+    df = build_example_reaction_df().iloc[:2].copy()
+
+    with patch(
+        "iqc_dashboard.app.compute_selected_single_descriptor_value",
+        side_effect=compute_selected_single_descriptor_value,
+    ) as compute_value:
+        kcal = build_selected_descriptor_dataframe(df, "prod_tau4", dataset_key="example")
+        ev = build_selected_descriptor_dataframe(
+            df, "prod_tau4", energy_unit=ENERGY_UNIT_EV, dataset_key="example"
+        )
+
+    assert compute_value.call_count == 1
+    assert kcal["value"].tolist() == ev["value"].tolist()
+    assert kcal["deltaG"].tolist() == pytest.approx([-5.0])
+    assert ev["deltaG"].tolist() == pytest.approx([-5.0 / 23.0605])
+    assert ev["deltaG_unit"].tolist() == [ENERGY_UNIT_EV]
+
+
+def test_descriptor_caches_are_keyed_by_dataset_key_not_rows():
+    """Cached descriptor tables are found by dataset key alone, whatever rows are passed."""
+    df = build_example_reaction_df()
+
+    selected = build_selected_descriptor_dataframe(df, "prod_ni_Cb", dataset_key="key-rows")
+    all_records = build_descriptor_dataframe(df, max_pairs=1, dataset_key="key-rows")
+    other_rows = df.iloc[:0]
+
+    assert build_selected_descriptor_dataframe(
+        other_rows, "prod_ni_Cb", dataset_key="key-rows"
+    ).equals(selected)
+    assert build_descriptor_dataframe(
+        other_rows, max_pairs=1, dataset_key="key-rows"
+    ).equals(all_records)
+    assert build_selected_descriptor_dataframe(other_rows, "prod_ni_Cb").empty
+    assert not selected.empty and not all_records.empty
+
+
 def test_build_selected_descriptor_dataframe_uses_reactant_geometry():
     """Reactant descriptors use reactant geometry and the same reaction ΔG."""
     df = build_example_reaction_df().iloc[:2].copy()
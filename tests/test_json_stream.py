@@ -0,0 +1,151 @@
+"""Tests for bounded-memory JSON table reading."""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+# Add parent directory to path to import the module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from iqc_dashboard.app import normalize_json_dataframe
+from iqc_dashboard.json_stream import (
+    InvalidJSONTable,
+    _JSONReader,
+    iter_json_frames,
+    iter_json_records,
+    json_layout,
+    parse_memory_size,
+    write_json_parquet,
+)
+
+
+def write_records(path, records, wrapper_key=None):
+    document = {"version": 2, wrapper_key: records} if wrapper_key else records
+    path.write_text(json.dumps(document, indent=1), encoding="utf-8")
+    return path
+
+
+def test_records_stream_in_budgeted_batches(tmp_path):
+    """Test record lists are parsed incrementally into position-indexed frames."""
+    records = [{"unique_name": f"mol_{i:03d}", "energy": -1.5 * i} for i in range(50)]
+    json_path = write_records(tmp_path / "molecules.json", records, wrapper_key="records")
+
+    streamed = list(iter_json_records(json_path, chunk_size=7))
+    frames = list(iter_json_frames(json_path, memory_limit=4 * 400))
+
+    assert [record for record, _ in streamed] == records
+    assert len(frames) > 1
+    assert pd.concat(frames).equals(pd.DataFrame(records))
+
+
+def test_ndjson_records_stream_line_by_line(tmp_path):
+    """Test newline-delimited files are detected by suffix or content and streamed."""
+    records = [{"unique_name": f"mol_{i}", "energy": -0.5 * i} for i in range(5)]
+    lines = "\n".join(json.dumps(record) for record in records) + "\n\n"
+    ndjson_path = tmp_path / "molecules.jsonl"
+    sniffed_path = tmp_path / "molecules.json"
+    ndjson_path.write_text(lines, encoding="utf-8")
+    sniffed_path.write_text(lines, encoding="utf-8")
+
+    assert json_layout(ndjson_path) == json_layout(sniffed_path) == "ndjson"
+    assert json_layout(write_records(tmp_path / "array.json", records)) == "array"
+    assert [record for record, _ in iter_json_records(sniffed_path, chunk_size=7)] == records
+
+
+def test_column_oriented_json_is_read_whole(tmp_path):
+    """Test layouts that cannot be split by row fall back to the whole-document reader."""
+    json_path = tmp_path / "columns.json"
+    pd.DataFrame({"unique_name": ["mol_a", "mol_b"], "steps": [3, 4]}).to_json(json_path)
+
+    frames = list(iter_json_frames(json_path, memory_limit=1))
+
+    assert len(frames) == 1
+    assert frames[0]["unique_name"].tolist() == ["mol_a", "mol_b"]
+
+
+def test_write_json_parquet_widens_schema_across_batches(tmp_path):
+    """Test later batches may add columns and promote types without losing rows."""
+    records = [{"unique_name": f"mol_{i}", "steps": i} for i in range(20)]
+    records += [
+        {"unique_name": f"mol_{i}", "steps": i + 0.5, "note": "late"} for i in range(20, 40)
+    ]
+    json_path = write_records(tmp_path / "molecules.json", records)
+    parquet_path = tmp_path / "molecules.parquet"
+
+    rows = write_json_parquet(json_path, parquet_path, memory_limit=4 * 200)
+
+    table = pq.read_table(parquet_path)
+    assert rows == 40
+    assert pq.ParquetFile(parquet_path).num_row_groups > 1
+    assert str(table.schema.field("steps").type) == "double"
+    assert table.column("steps").to_pylist() == [record["steps"] for record in records]
+    assert table.column("note").to_pylist() == [None] * 20 + ["late"] * 20
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "molecules.json",
+        "molecules.parquet",
+    ]
+
+
+def test_reaction_names_match_across_batches(tmp_path):
+    """Test batched reaction expansion numbers rows by their position in the file."""
+    records = [
+        {
+            "ligand_pair": "bipy-a_b-C2H2-c",
+            "reactant_geometry": "1\n\nH 0 0 0",
+            "product_geometry": "1\n\nH 0 0 1",
+        }
+        for _ in range(6)
+    ]
+    json_path = write_records(tmp_path / "reactions.json", records)
+    parquet_path = tmp_path / "reactions.parquet"
+
+    write_json_parquet(
+        json_path, parquet_path, transform=normalize_json_dataframe, memory_limit=4 * 150
+    )
+
+    expected = normalize_json_dataframe(pd.DataFrame(records))
+    assert pd.read_parquet(parquet_path)["unique_name"].tolist() == expected["unique_name"].tolist()
+
+
+def test_invalid_json_reports_context_without_reading_on():
+    """Test a syntax error is reported where it is, not after reading the rest of the file."""
+    records = [{"unique_name": f"mol_{i:05d}", "energy": -1.5 * i} for i in range(2000)]
+    document = '[{"unique_name": "mol_bad", "energy": -1.5,, "steps": 3},\n' + json.dumps(
+        records
+    )[1:]
+    json_file = io.StringIO(document)
+    reader = _JSONReader(json_file, chunk_size=64)
+
+    with pytest.raises(InvalidJSONTable, match=r"character 43: .*near '.*-1\.5,, \"steps"):
+        list(reader.iter_array_records())
+    assert json_file.tell() <= 128 < len(document)
+
+
+def test_non_object_records_are_rejected(tmp_path):
+    """Test a later array element that is not an object fails as an invalid table."""
+    json_path = tmp_path / "mixed.json"
+    json_path.write_text('[{"unique_name": "mol_a"}, 3]', encoding="utf-8")
+
+    with pytest.raises(InvalidJSONTable, match="every array element must be an object"):
+        list(iter_json_records(json_path))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(1024, 1024), ("512MB", 512_000_000), ("2GiB", 2 * 1024**3), (" 1.5 kib ", 1536)],
+)
+def test_parse_memory_size(value, expected):
+    """Test memory sizes accept byte counts and decimal or binary units."""
+    assert parse_memory_size(value) == expected
+
+
+@pytest.mark.parametrize("value", ["lots", "0", "5 parsecs"])
+def test_parse_memory_size_rejects_invalid_values(value):
+    """Test unparseable or non-positive sizes are rejected."""
+    with pytest.raises(ValueError):
+        parse_memory_size(value)
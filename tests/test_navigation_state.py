@@ -13,7 +13,9 @@ from iqc_dashboard.app import (
     build_comparison_match_id,
     build_reaction_selection_options,
     move_indexed_selection,
+    move_keyset_page,
     sync_indexed_selection,
+    sync_keyset_page_cursors,
 )
 
 
@@ -78,6 +80,29 @@ def test_sync_indexed_selection_repairs_stale_selectbox_value():
     assert state["selected_molecule_select"] == "mol_b"
 
 
+def test_keyset_page_cursors_reset_when_inputs_change():
+    """Test paged selectors move by cursor and restart when filters or search change."""
+    state = {}
+
+    cursors = sync_keyset_page_cursors(state, "cursors", "signature", ("H2O", ""))
+    assert cursors == [None]
+
+    move_keyset_page(state, "cursors", 1, "mol_b")
+    move_keyset_page(state, "cursors", 1, "mol_d")
+    assert sync_keyset_page_cursors(state, "cursors", "signature", ("H2O", "")) == [
+        None,
+        "mol_b",
+        "mol_d",
+    ]
+
+    move_keyset_page(state, "cursors", -1)
+    assert state["cursors"] == [None, "mol_b"]
+
+    assert sync_keyset_page_cursors(state, "cursors", "signature", ("H2O", "mol")) == [None]
+    move_keyset_page(state, "cursors", -1)
+    assert state["cursors"] == [None]
+
+
 def test_comparison_match_options_follow_source_row_order():
     """Test comparison Next order follows file row order instead of molecule label order."""
     rows = []